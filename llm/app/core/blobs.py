@@ -0,0 +1,192 @@
+"""
+Content-addressed blob storage.
+
+Generated binary assets (scene images) are written once to a local directory and
+addressed by the SHA-256 of their content, so identical images share one blob and
+a blob's URL never changes meaning. Once the store grows past its size limit the
+least recently stored or served blobs are removed, so old image URLs eventually
+return 404. The store is configured under the [blobs] section of config.toml:
+
+    [blobs]
+    directory = ".data/blobs"
+    max_mb = 1024
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.metrics import get_metrics
+
+# File extension used for each supported content type
+CONTENT_TYPES: Dict[str, str] = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+}
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+_evictions = get_metrics().counter("blob_store_evictions_total", "Blobs removed to keep the store under its size limit")
+_bytes = get_metrics().gauge("blob_store_bytes", "Bytes held by the blob store")
+
+
+class BlobNotFoundError(Exception):
+    """Exception raised when a blob does not exist."""
+    pass
+
+
+class BlobStore:
+    """Filesystem blob store addressed by content hash."""
+
+    def __init__(self, directory: str = ".data/blobs", max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Initialize the blob store.
+
+        Args:
+            directory: Directory holding the blobs
+            max_bytes: Maximum total size of the stored blobs
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+        self._index: Optional[Dict[str, int]] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, content_type: str = "image/png") -> str:
+        """
+        Store a blob, skipping the write if it already exists, and evict the
+        least recently used blobs if the store is over its size limit.
+
+        Args:
+            data: Blob content
+            content_type: MIME type of the content
+
+        Returns:
+            The blob's SHA-256 hex digest
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest, content_type)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            logger.debug(f"Stored blob {digest} ({len(data)} bytes)")
+        else:
+            self._touch(path)
+
+        with self._lock:
+            index = self._load_index()
+            self._bytes += len(data) - index.get(path.name, 0)
+            index[path.name] = len(data)
+            if self._bytes > self.max_bytes:
+                self._evict(index, keep=path.name)
+            _bytes.set(self._bytes)
+        return digest
+
+    async def aput(self, data: bytes, content_type: str = "image/png") -> str:
+        """Store a blob without blocking the event loop."""
+        return await asyncio.to_thread(self.put, data, content_type)
+
+    def locate(self, digest: str) -> Tuple[Path, str]:
+        """
+        Find a stored blob.
+
+        Args:
+            digest: SHA-256 hex digest returned by put
+
+        Returns:
+            Tuple of the blob's path and content type
+
+        Raises:
+            BlobNotFoundError: If the digest is malformed or no blob exists
+        """
+        if not _DIGEST.match(digest):
+            raise BlobNotFoundError(f"Invalid blob id: {digest}")
+        for content_type in CONTENT_TYPES:
+            path = self._path(digest, content_type)
+            if path.is_file():
+                self._touch(path)
+                return path, content_type
+        raise BlobNotFoundError(f"Blob not found: {digest}")
+
+    def _path(self, digest: str, content_type: str) -> Path:
+        """Location of a blob, sharded by the first two hex digits."""
+        extension = CONTENT_TYPES.get(content_type)
+        if extension is None:
+            raise ValueError(f"Unsupported content type: {content_type}")
+        return self.directory / digest[:2] / f"{digest}{extension}"
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Refresh a blob's mtime, which orders eviction."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _load_index(self) -> Dict[str, int]:
+        """Scan the store once to learn its current blobs and size."""
+        if self._index is None:
+            index: Dict[str, int] = {}
+            if self.directory.exists():
+                for path in self.directory.glob("??/*"):
+                    if path.is_file() and not path.name.endswith(".tmp"):
+                        index[path.name] = path.stat().st_size
+            self._index = index
+            self._bytes = sum(index.values())
+        return self._index
+
+    def _evict(self, index: Dict[str, int], keep: str) -> None:
+        """Remove the least recently used blobs, except ``keep``, until under the limit."""
+        entries = []
+        for name in index:
+            if name == keep:
+                continue
+            try:
+                entries.append(((self.directory / name[:2] / name).stat().st_mtime, name))
+            except OSError:
+                entries.append((0.0, name))
+        entries.sort()
+
+        target = self.max_bytes * 0.9
+        for _, name in entries:
+            if self._bytes <= target:
+                break
+            try:
+                (self.directory / name[:2] / name).unlink()
+            except OSError:
+                pass
+            self._bytes -= index.pop(name)
+            _evictions.inc()
+        logger.info(f"Evicted blobs, store now {self._bytes} bytes")
+
+
+# Create a singleton instance for global use
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Get the global blob store instance.
+
+    Returns:
+        The global BlobStore instance
+    """
+    global _blob_store
+    if _blob_store is None:
+        config = get_config()
+        _blob_store = BlobStore(
+            config.get("blobs.directory", ".data/blobs"),
+            max_bytes=int(config.get("blobs.max_mb", 1024)) * 1024 * 1024,
+        )
+    return _blob_store
@@ -2,13 +2,16 @@
 Tool discovery and registration system.
 
 This module scans the tools directory, validates tool implementations,
-and registers them with the FastAPI application.
+and registers them with the FastAPI application. Tool modules are imported
+lazily, on first use, using a cached index of their names and schemas.
 """
 
-from typing import Dict, List, Type
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Type
 from pathlib import Path
 import importlib
 import inspect
+import json
 from loguru import logger
 
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -17,12 +20,66 @@ from starlette.requests import Request
 
 from app.core.interfaces import ToolInterface
 from app.core.config import get_config
+from app.core.responses import PrecomputedJSON
+
+
+# Bump when the layout of the cached tool index changes
+_INDEX_VERSION = 1
 
 
 class ToolDiscoveryError(Exception):
     """Exception raised for errors during tool discovery."""
 
 
+@dataclass
+class ToolManifest:
+    """What the registry needs to know about a tool without importing its module."""
+
+    name: str  # Directory name, used in routes
+    tool_name: str  # The tool class's ``name``
+    description: str
+    class_name: str
+    input_schema: str  # "module:ClassName"
+    output_schema: str
+    signature: List[List[Any]]  # File name, mtime and size of each module in the tool
+
+    @classmethod
+    def from_class(
+        cls, name: str, tool_class: Type[ToolInterface], signature: List[List[Any]]
+    ) -> "ToolManifest":
+        """Build the manifest of an imported tool class."""
+        return cls(
+            name=name,
+            tool_name=tool_class.name,
+            description=tool_class.description,
+            class_name=tool_class.__name__,
+            input_schema=_object_path(tool_class.get_input_schema()),
+            output_schema=_object_path(tool_class.get_output_schema()),
+            signature=signature,
+        )
+
+
+def _object_path(obj: Any) -> str:
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def _import_object(path: str) -> Any:
+    module_name, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _tool_signature(tool_dir: Path) -> List[List[Any]]:
+    """File name, modification time and size of each module of a tool."""
+    signature = []
+    for path in sorted(tool_dir.glob("*.py")):
+        stat = path.stat()
+        signature.append([path.name, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
 class ToolRegistry:
     """
     Registry for discovered tools.
@@ -30,15 +87,77 @@ class ToolRegistry:
     This class is responsible for:
     - Discovering tools in the tools directory
     - Validating that tools implement the required interface
+    - Creating one long-lived instance of each tool, shared by all requests
     - Registering routes for each tool
+
+    Discovery reads each tool's name, description and schemas from a cached
+    index (``[tools] index_file``) instead of importing its module. An entry is
+    rebuilt, by importing the tool, only when a file of the tool has changed.
+    A tool's module, with its heavy dependencies, is imported and the tool
+    instantiated on its first call unless ``[tools] preload`` is set.
     """
 
-    def __init__(self):
-        """Initialize the tool registry."""
+    def __init__(self, index_path: Optional[Path] = None):
+        """
+        Initialize the tool registry.
+
+        Args:
+            index_path: Location of the cached tool index. If None, uses the
+                configured ``tools.index_file`` relative to the tools' base directory.
+        """
+        self.manifests: Dict[str, ToolManifest] = {}
         self.tools: Dict[str, Type[ToolInterface]] = {}
+        self.instances: Dict[str, ToolInterface] = {}
+        self.index_path = index_path
         self._router = APIRouter(prefix="/tools", tags=["tools"])
 
-    def discover_tools(self, tools_dir: Path = None) -> Dict[str, Type[ToolInterface]]:
+    def instantiate_tools(self) -> Dict[str, ToolInterface]:
+        """
+        Import and create the shared instance of every discovered tool.
+
+        Returns:
+            Dictionary mapping tool names to tool instances
+
+        Raises:
+            ToolDiscoveryError: If a tool cannot be instantiated
+        """
+        for tool_name in self.manifests:
+            self.get_tool(tool_name)
+        return self.instances
+
+    def get_tool(self, tool_name: str) -> ToolInterface:
+        """
+        Get the shared instance of a tool, importing and creating it on first use.
+
+        Args:
+            tool_name: Name of the tool's directory (e.g. "generate_story")
+
+        Returns:
+            The tool instance
+
+        Raises:
+            ToolDiscoveryError: If the tool is unknown or cannot be instantiated
+        """
+        instance: Optional[ToolInterface] = self.instances.get(tool_name)
+        if instance is not None:
+            return instance
+
+        tool_class = self.tools.get(tool_name)
+        if tool_class is None:
+            if tool_name not in self.manifests:
+                raise ToolDiscoveryError(f"Unknown tool: {tool_name}")
+            tool_class = self._load_tool_class(tool_name)
+        try:
+            instance = tool_class()
+        except Exception as e:
+            error_msg = f"Error instantiating tool {tool_name}: {str(e)}"
+            logger.error(error_msg)
+            raise ToolDiscoveryError(error_msg) from e
+        self.instances[tool_name] = instance
+        logger.info(f"Instantiated tool: {tool_name}")
+        return instance
+
+    def discover_tools(self, tools_dir: Path = None) -> Dict[str, ToolManifest]:
         """
         Discover all valid tools in the tools directory.
 
@@ -46,7 +165,7 @@ class ToolRegistry:
             tools_dir: Path to the tools directory. If None, uses the default path.
 
         Returns:
-            Dictionary mapping tool names to tool classes
+            Dictionary mapping tool names to tool manifests
 
         Raises:
             ToolDiscoveryError: If there's an error during tool discovery
@@ -58,8 +177,12 @@ class ToolRegistry:
             logger.warning(f"Tools directory not found: {tools_path}")
             return {}
 
+        index_path = self.index_path or base_dir / get_config().get("tools.index_file", ".data/tool_index.json")
+        index = self._read_index(index_path)
+        stale = False
+
         # Get all directories in the tools directory (each should be a tool)
-        tool_dirs = [d for d in tools_path.iterdir() if d.is_dir() and not d.name.startswith("__")]
+        tool_dirs = sorted(d for d in tools_path.iterdir() if d.is_dir() and not d.name.startswith("__"))
 
         for tool_dir in tool_dirs:
             tool_name = tool_dir.name
@@ -72,33 +195,97 @@ class ToolRegistry:
                 logger.warning(f"Tool {tool_name} is missing required files")
                 continue
 
-            try:
-                # Import the tool module
-                module_path = f"tools.{tool_name}.tool"
-                tool_module = importlib.import_module(module_path)
-
-                # Find the tool class (should inherit from ToolInterface)
-                for name, obj in inspect.getmembers(tool_module):
-                    if (
-                        inspect.isclass(obj)
-                        and issubclass(obj, ToolInterface)
-                        and obj != ToolInterface
-                    ):
-
-                        # Validate that the tool has the required attributes and methods
-                        self._validate_tool_class(obj, tool_name)
-
-                        # Register the tool
-                        self.tools[tool_name] = obj
-                        logger.info(f"Discovered tool: {tool_name}")
-                        break
+            signature = _tool_signature(tool_dir)
+            entry = index.get(tool_name)
+            if entry and entry.get("signature") == signature:
+                try:
+                    manifest = ToolManifest(**entry)
+                except TypeError:
+                    manifest = None
+            else:
+                manifest = None
 
-            except Exception as e:
-                error_msg = f"Error loading tool {tool_name}: {str(e)}"
-                logger.error(error_msg)
-                raise ToolDiscoveryError(error_msg) from e
+            if manifest is None:
+                # New or changed tool: import it to (re)build its index entry
+                tool_class = self._load_tool_class(tool_name)
+                if tool_class is None:
+                    continue
+                manifest = ToolManifest.from_class(tool_name, tool_class, signature)
+                stale = True
+
+            self.manifests[tool_name] = manifest
+            logger.info(f"Discovered tool: {tool_name}")
 
-        return self.tools
+        if stale or set(index) != set(self.manifests):
+            self._write_index(index_path)
+        return self.manifests
+
+    def _load_tool_class(self, tool_name: str) -> Optional[Type[ToolInterface]]:
+        """
+        Import a tool's module and validate its tool class.
+
+        Args:
+            tool_name: Name of the tool's directory
+
+        Returns:
+            The tool class, or None if the module defines no tool
+
+        Raises:
+            ToolDiscoveryError: If the tool cannot be imported or is invalid
+        """
+        try:
+            # Import the tool module
+            module_path = f"tools.{tool_name}.tool"
+            tool_module = importlib.import_module(module_path)
+
+            # Find the tool class (should inherit from ToolInterface)
+            for name, obj in inspect.getmembers(tool_module):
+                if (
+                    inspect.isclass(obj)
+                    and issubclass(obj, ToolInterface)
+                    and obj != ToolInterface
+                ):
+
+                    # Validate that the tool has the required attributes and methods
+                    self._validate_tool_class(obj, tool_name)
+
+                    # Register the tool
+                    self.tools[tool_name] = obj
+                    logger.info(f"Loaded tool module: {module_path}")
+                    return obj
+
+        except Exception as e:
+            error_msg = f"Error loading tool {tool_name}: {str(e)}"
+            logger.error(error_msg)
+            raise ToolDiscoveryError(error_msg) from e
+
+        logger.warning(f"No tool class found in {module_path}")
+        return None
+
+    def _read_index(self, index_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Read the cached tool index, returning an empty index if it is missing or invalid."""
+        try:
+            data = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        tools = data.get("tools")
+        return tools if isinstance(tools, dict) else {}
+
+    def _write_index(self, index_path: Path) -> None:
+        """Save the tool index; a read-only file system only costs the next startup an import."""
+        data = {
+            "version": _INDEX_VERSION,
+            "tools": {name: asdict(manifest) for name, manifest in self.manifests.items()},
+        }
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, indent=2))
+            tmp_path.replace(index_path)
+        except OSError as e:
+            logger.warning(f"Could not write tool index {index_path}: {str(e)}")
 
     def _validate_tool_class(self, tool_class: Type[ToolInterface], tool_name: str) -> List[str]:
         """
@@ -182,38 +369,45 @@ class ToolRegistry:
                 raise ToolDiscoveryError("Authentication dependencies not installed") from exc
 
         # Function factories to avoid closure issues
-        def create_list_tools_handler(tools_dict):
+        # Tool metadata only changes with the code, so it is serialized once here
+        # and served as prebuilt bytes with an ETag (304 on revalidation)
+        def create_list_tools_handler(manifests):
             """Create handler for listing tools."""
+            listing = PrecomputedJSON(
+                [
+                    {"name": manifest.tool_name, "description": manifest.description}
+                    for manifest in manifests.values()
+                ]
+            )
 
             # pylint: disable=unused-variable
-            async def list_tools():
+            async def list_tools(request: Request):
                 """List all available tools with their descriptions."""
-                return [
-                    {"name": tool_cls.name, "description": tool_cls.description}
-                    for tool_cls in tools_dict.values()
-                ]
+                return listing.respond(request)
 
             return list_tools
 
-        def create_input_schema_handler(tool_cls):
+        def create_input_schema_handler(schema_cls):
             """Create handler for input schema endpoint."""
+            schema = PrecomputedJSON(schema_cls.model_json_schema())
 
-            async def get_input_schema():
+            async def get_input_schema(request: Request):
                 """Get the JSON Schema for tool input."""
-                return tool_cls.get_input_schema().model_json_schema()
+                return schema.respond(request)
 
             return get_input_schema
 
-        def create_output_schema_handler(tool_cls):
+        def create_output_schema_handler(schema_cls):
             """Create handler for output schema endpoint."""
+            schema = PrecomputedJSON(schema_cls.model_json_schema())
 
-            async def get_output_schema():
+            async def get_output_schema(request: Request):
                 """Get the JSON Schema for tool output."""
-                return tool_cls.get_output_schema().model_json_schema()
+                return schema.respond(request)
 
             return get_output_schema
 
-        def create_tool_executor(tool_instance, input_schema_cls, is_auth_enabled):
+        def create_tool_executor(tool_name, input_schema_cls, is_auth_enabled):
             """Create handler for tool execution endpoint."""
 
             async def execute_tool(data: input_schema_cls, request: Request):
@@ -229,16 +423,20 @@ class ToolRegistry:
                         except Exception as e:
                             logger.error(f"Error extracting token: {str(e)}")
 
-                    # Execute the tool with the token
+                    # Execute the tool with the token, importing it on first use
+                    tool_instance = self.get_tool(tool_name)
                     return await tool_instance.execute(data, token=token)
+                except HTTPException:
+                    # Keep status codes chosen by the tool (e.g. 429 when overloaded)
+                    raise
                 except Exception as e:
-                    logger.error(f"Error executing tool {tool_instance.name}: {str(e)}")
+                    logger.error(f"Error executing tool {tool_name}: {str(e)}")
                     raise HTTPException(status_code=500, detail=str(e))
 
             return execute_tool
 
         # Register the route to list all tools
-        list_tools_handler = create_list_tools_handler(self.tools)
+        list_tools_handler = create_list_tools_handler(self.manifests)
         self._router.get(
             "/",
             summary="List all available tools",
@@ -247,19 +445,16 @@ class ToolRegistry:
         )(list_tools_handler)
 
         # Register routes for each tool
-        for tool_name, tool_class in self.tools.items():
+        for tool_name, manifest in self.manifests.items():
             try:
-                # Get input/output schemas
-                input_schema = tool_class.get_input_schema()
-                output_schema = tool_class.get_output_schema()
-
-                # Create an instance of the tool
-                tool_instance = tool_class()
+                # Get input/output schemas (schema modules are cheap to import)
+                input_schema = _import_object(manifest.input_schema)
+                output_schema = _import_object(manifest.output_schema)
 
                 # Create handlers using factory functions
-                input_schema_handler = create_input_schema_handler(tool_class)
-                output_schema_handler = create_output_schema_handler(tool_class)
-                execute_handler = create_tool_executor(tool_instance, input_schema, auth_enabled)
+                input_schema_handler = create_input_schema_handler(input_schema)
+                output_schema_handler = create_output_schema_handler(output_schema)
+                execute_handler = create_tool_executor(tool_name, input_schema, auth_enabled)
 
                 # Set unique function names to avoid route conflicts
                 input_schema_handler.__name__ = f"get_{tool_name}_input_schema"
@@ -269,7 +464,7 @@ class ToolRegistry:
                 # Register input schema endpoint
                 self._router.get(
                     f"/{tool_name}/input-schema",
-                    summary=f"Get input schema for {tool_class.name}",
+                    summary=f"Get input schema for {manifest.tool_name}",
                     operation_id=f"get_{tool_name}_input_schema",
                     dependencies=auth_dependencies,
                 )(input_schema_handler)
@@ -277,7 +472,7 @@ class ToolRegistry:
                 # Register output schema endpoint
                 self._router.get(
                     f"/{tool_name}/output-schema",
-                    summary=f"Get output schema for {tool_class.name}",
+                    summary=f"Get output schema for {manifest.tool_name}",
                     operation_id=f"get_{tool_name}_output_schema",
                     dependencies=auth_dependencies,
                 )(output_schema_handler)
@@ -286,7 +481,7 @@ class ToolRegistry:
                 self._router.post(
                     f"/{tool_name}",
                     response_model=output_schema,
-                    summary=tool_class.description,
+                    summary=manifest.description,
                     operation_id=f"execute_{tool_name}",
                     dependencies=auth_dependencies,
                 )(execute_handler)
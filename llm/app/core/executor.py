@@ -0,0 +1,246 @@
+"""
+Bounded executors for CPU-bound work.
+
+Rendering and encoding images is CPU-bound; running it inside a coroutine blocks
+the event loop and stalls every other request on the worker. This module runs
+such work on named thread or process pools with a bounded backlog, so callers
+await the result without blocking the loop and excess work is rejected instead
+of queuing without limit. Pools are configured under [executors] in config.toml:
+
+    [executors]
+    kind = "thread"
+    max_workers = 4
+    max_queue = 32
+
+    [executors.images]
+    kind = "process"
+
+Functions submitted to a process pool must be picklable (module-level functions).
+The pools are shut down by the FastAPI lifespan.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.metrics import get_metrics
+
+T = TypeVar("T")
+
+_metrics = get_metrics()
+_in_flight = _metrics.gauge("executor_in_flight", "Tasks admitted to an executor (running or queued)")
+_queue_depth = _metrics.gauge("executor_queue_depth", "Tasks waiting for a free executor worker")
+_rejected = _metrics.counter("executor_rejected_total", "Tasks rejected because the executor backlog was full")
+_duration = _metrics.histogram("executor_task_seconds", "Time from submission to result, including queueing")
+
+
+class ExecutorOverloadedError(Exception):
+    """Exception raised when an executor's backlog is full."""
+    pass
+
+
+class BoundedExecutor:
+    """
+    Thread or process pool with a bounded backlog.
+
+    At most ``max_workers`` tasks run at once and at most ``max_queue`` more wait
+    for a worker; further submissions fail fast with ExecutorOverloadedError.
+    """
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 4, max_queue: int = 32):
+        """
+        Initialize the executor.
+
+        Args:
+            name: Executor name, used in logs and metric labels
+            kind: "thread" or "process"
+            max_workers: Number of worker threads or processes
+            max_queue: Number of tasks allowed to wait for a worker
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._pool: Optional[Executor] = None
+        self._admitted = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of admitted tasks waiting for a worker."""
+        return max(0, self._admitted - self.max_workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function on the pool and await its result.
+
+        Args:
+            func: Function to run; must be picklable for process pools
+            *args: Positional arguments for the function
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ExecutorOverloadedError: If the backlog is full
+        """
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_queue:
+                _rejected.inc(executor=self.name)
+                raise ExecutorOverloadedError(
+                    f"Executor {self.name} is overloaded ({self._admitted} tasks in flight)"
+                )
+            self._admitted += 1
+            self._report()
+
+        start = time.perf_counter()
+
+        def release(_future=None) -> None:
+            with self._lock:
+                self._admitted -= 1
+                self._report()
+            _duration.observe(time.perf_counter() - start, executor=self.name)
+
+        try:
+            future = self._get_pool().submit(func, *args)
+        except BaseException:
+            release()
+            raise
+        # The slot is held until the task itself finishes, not just its awaiter:
+        # a task that is already running keeps its worker busy after a cancel
+        future.add_done_callback(release)
+        # Cancelling the awaiting coroutine also cancels a still-queued task
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the pool, cancelling queued tasks."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info(f"Shut down {self.kind} executor {self.name}")
+
+    def _get_pool(self) -> Executor:
+        """Create the underlying pool on first use."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    logger.info(
+                        f"Creating {self.kind} executor {self.name}: max_workers={self.max_workers}, "
+                        f"max_queue={self.max_queue}"
+                    )
+                    if self.kind == "process":
+                        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix=f"{self.name}-executor"
+                        )
+        return self._pool
+
+    def _report(self) -> None:
+        """Publish in-flight and queue depth gauges."""
+        _in_flight.set(self._admitted, executor=self.name)
+        _queue_depth.set(self.queue_depth, executor=self.name)
+
+
+class ExecutorRegistry:
+    """Registry of named bounded executors."""
+
+    def __init__(self):
+        """Initialize the executor registry."""
+        self._executors: Dict[str, BoundedExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> BoundedExecutor:
+        """
+        Get the executor with the given name, creating it if needed.
+
+        Args:
+            name: Executor name, used to look up ``executors.<name>`` settings
+
+        Returns:
+            The shared BoundedExecutor
+        """
+        executor = self._executors.get(name)
+        if executor is None:
+            with self._lock:
+                executor = self._executors.get(name)
+                if executor is None:
+                    settings = self.get_settings(name)
+                    executor = BoundedExecutor(
+                        name,
+                        kind=settings["kind"],
+                        max_workers=int(settings["max_workers"]),
+                        max_queue=int(settings["max_queue"]),
+                    )
+                    self._executors[name] = executor
+        return executor
+
+    def get_settings(self, name: str) -> Dict[str, Any]:
+        """
+        Get the effective settings for an executor.
+
+        Args:
+            name: Executor name
+
+        Returns:
+            The global [executors] settings merged with the executor's overrides
+        """
+        config = get_config()
+        settings: Dict[str, Any] = {"kind": "thread", "max_workers": 4, "max_queue": 32}
+        for key, value in config.get("executors", {}).items():
+            if not isinstance(value, dict):
+                settings[key] = value
+        settings.update(config.get(f"executors.{name}", {}))
+        return settings
+
+    def shutdown(self) -> None:
+        """Shut down every executor in the registry."""
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            try:
+                executor.shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down executor {executor.name}: {str(e)}")
+
+
+# Create a singleton instance for global use
+_executor_registry = None
+
+
+def get_executor_registry() -> ExecutorRegistry:
+    """
+    Get the global executor registry instance.
+
+    Returns:
+        The global ExecutorRegistry instance
+    """
+    global _executor_registry
+    if _executor_registry is None:
+        _executor_registry = ExecutorRegistry()
+    return _executor_registry
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """
+    Get a named bounded executor.
+
+    Args:
+        name: Executor name (e.g. "images")
+
+    Returns:
+        The shared BoundedExecutor
+    """
+    return get_executor_registry().get(name)
+
+
+def shutdown_executors() -> None:
+    """Shut down all executors."""
+    if _executor_registry is not None:
+        _executor_registry.shutdown()
@@ -0,0 +1,189 @@
+"""
+Shared HTTP connection pools for outbound calls.
+
+This module keeps one pooled httpx.AsyncClient per upstream (Ollama, OpenAI,
+Stability, ...) so requests reuse keep-alive connections and TLS sessions instead
+of opening a new client per call. Pool limits and timeouts are configured per
+upstream under the [http] section of config.toml:
+
+    [http]
+    max_connections = 100
+    timeout = 60
+
+    [http.upstreams.ollama]
+    max_connections = 16
+    timeout = 120
+
+The clients are closed by the FastAPI lifespan on shutdown.
+"""
+
+import asyncio
+import importlib.util
+from typing import Any, Dict, Optional, Set, Tuple
+
+import httpx
+from loguru import logger
+
+from app.core.config import get_config
+
+
+class HTTPClientRegistry:
+    """
+    Registry of pooled HTTP clients, one per named upstream.
+
+    Clients are created lazily on first use and bound to the event loop they were
+    created in; a caller on a different loop gets a fresh client and the previous
+    one is closed.
+    """
+
+    def __init__(self):
+        """Initialize the client registry."""
+        self._clients: Dict[str, Tuple[httpx.AsyncClient, Optional[asyncio.AbstractEventLoop]]] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self._http2_available = importlib.util.find_spec("h2") is not None
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for an upstream, creating it if needed.
+
+        Args:
+            name: Upstream name, used to look up ``http.upstreams.<name>`` settings
+
+        Returns:
+            The shared httpx.AsyncClient for the upstream
+        """
+        loop = _running_loop()
+        entry = self._clients.get(name)
+        if entry is not None:
+            client, client_loop = entry
+            if not client.is_closed and (client_loop is None or client_loop is loop):
+                return client
+            if not client.is_closed:
+                self._retire(name, client, client_loop)
+
+        client = self._create_client(name)
+        self._clients[name] = (client, loop)
+        return client
+
+    def get_settings(self, name: str) -> Dict[str, Any]:
+        """
+        Get the effective pool settings for an upstream.
+
+        Args:
+            name: Upstream name
+
+        Returns:
+            The global [http] settings merged with the upstream's overrides
+        """
+        config = get_config()
+        settings = {
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+            "timeout": 60.0,
+            "connect_timeout": 10.0,
+            "http2": True,
+        }
+        for key, value in config.get("http", {}).items():
+            if key != "upstreams" and not isinstance(value, dict):
+                settings[key] = value
+        settings.update(config.get(f"http.upstreams.{name}", {}))
+        return settings
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        """Create a pooled client for an upstream."""
+        settings = self.get_settings(name)
+        http2 = bool(settings["http2"]) and self._http2_available
+        logger.info(
+            f"Creating HTTP pool for {name}: max_connections={settings['max_connections']}, "
+            f"http2={http2}"
+        )
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_keepalive_connections"],
+                keepalive_expiry=settings["keepalive_expiry"],
+            ),
+            timeout=httpx.Timeout(settings["timeout"], connect=settings["connect_timeout"]),
+        )
+
+    def _retire(
+        self, name: str, client: httpx.AsyncClient, client_loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Close a client replaced because the event loop changed.
+
+        The client is closed on its own loop while that loop is still running;
+        otherwise (e.g. after asyncio.run returned) it is closed on the current loop.
+        """
+        if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_client(name, client), client_loop)
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._close_client(name, client))
+        except RuntimeError:
+            logger.warning(f"Could not close replaced HTTP pool for {name} outside an event loop")
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_client(self, name: str, client: httpx.AsyncClient) -> None:
+        """Close one client, logging rather than raising on failure."""
+        try:
+            await client.aclose()
+            logger.info(f"Closed HTTP pool for {name}")
+        except Exception as e:
+            logger.warning(f"Error closing HTTP pool for {name}: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close every client in the registry."""
+        clients, self._clients = self._clients, {}
+        for name, (client, _) in clients.items():
+            await self._close_client(name, client)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Create a singleton instance for global use
+_http_registry = None
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    """
+    Get the global HTTP client registry instance.
+
+    Returns:
+        The global HTTPClientRegistry instance
+    """
+    global _http_registry
+    if _http_registry is None:
+        _http_registry = HTTPClientRegistry()
+    return _http_registry
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for an upstream.
+
+    Args:
+        name: Upstream name (e.g. "ollama", "openai", "stability")
+
+    Returns:
+        The shared httpx.AsyncClient for the upstream
+    """
+    return get_http_registry().get(name)
+
+
+async def close_http_clients() -> None:
+    """Close all pooled HTTP clients."""
+    if _http_registry is not None:
+        await _http_registry.aclose()
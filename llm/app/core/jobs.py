@@ -0,0 +1,395 @@
+"""
+Background jobs.
+
+Long-running work (story generation can take minutes on a local model) is run
+as a job instead of inside the HTTP request: the client submits it, gets a job
+id back immediately and polls ``GET /jobs/{id}`` or receives a webhook when it
+finishes. Jobs wait in a bounded in-process queue and run on a fixed number of
+worker tasks, so the number of concurrent generations (and model calls) never
+exceeds the worker count; submissions beyond the queue limit are rejected.
+Configured under [jobs] in config.toml:
+
+    [jobs]
+    workers = 2
+    max_queue = 50
+    ttl_seconds = 3600
+    retry_after = 10
+    webhook_attempts = 3
+    callback_hosts = []
+    allow_private_callbacks = false
+
+Callback URLs must resolve to public addresses, so a caller cannot make the
+service POST to loopback, private, link-local (e.g. the 169.254.169.254 cloud
+metadata endpoint) or other internal hosts; ``callback_hosts`` further limits
+callbacks to the listed host names. The check runs when a job is submitted and
+again before each delivery attempt.
+
+Finished jobs are kept for ``ttl_seconds`` and then forgotten. Jobs live in
+process memory, so they are lost on restart and each worker process has its own
+queue.
+"""
+
+import asyncio
+import ipaddress
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.http import get_http_client
+from app.core.metrics import get_metrics
+
+_metrics = get_metrics()
+_submitted = _metrics.counter("jobs_submitted_total", "Jobs accepted into the queue")
+_rejected = _metrics.counter("jobs_rejected_total", "Jobs rejected because the queue was full")
+_finished = _metrics.counter("jobs_finished_total", "Jobs finished, by final status")
+_queue_depth = _metrics.gauge("jobs_queue_depth", "Jobs waiting for a worker")
+_wait = _metrics.histogram("jobs_wait_seconds", "Time jobs spent queued before starting")
+_duration = _metrics.histogram("jobs_run_seconds", "Time jobs spent running")
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Finished jobs are purged at most this often (seconds)
+PURGE_INTERVAL = 60
+
+
+class JobQueueFullError(Exception):
+    """Exception raised when a job is submitted to a full queue."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JobManagerStoppedError(Exception):
+    """Exception raised when a job is submitted while the manager is not running."""
+    pass
+
+
+class CallbackURLError(Exception):
+    """Exception raised when a callback URL points at a disallowed host."""
+    pass
+
+
+class Job:
+    """A unit of background work and its outcome."""
+
+    def __init__(self, kind: str, func: Callable[[], Awaitable[Any]], callback_url: Optional[str] = None):
+        """
+        Initialize the job.
+
+        Args:
+            kind: Kind of work, used in logs and metric labels
+            func: Zero-argument coroutine function performing the work; its
+                result must be JSON-serializable
+            callback_url: URL notified with the job when it finishes
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.func = func
+        self.callback_url = callback_url
+        self.status = QUEUED
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished."""
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the job for API responses and webhooks.
+
+        Returns:
+            JSON-compatible job description
+        """
+        def timestamp(value: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(value).isoformat() if value is not None else None
+
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": timestamp(self.created_at),
+            "started_at": timestamp(self.started_at),
+            "finished_at": timestamp(self.finished_at),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Bounded in-process job queue served by a fixed pool of worker tasks."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 50,
+        ttl_seconds: float = 3600,
+        retry_after: int = 10,
+        webhook_attempts: int = 3,
+        callback_hosts: Optional[Iterable[str]] = None,
+        allow_private_callbacks: bool = False,
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            workers: Number of jobs run concurrently
+            max_queue: Number of jobs allowed to wait for a worker
+            ttl_seconds: How long finished jobs are kept
+            retry_after: Seconds clients are told to wait when the queue is full
+            webhook_attempts: Delivery attempts per webhook
+            callback_hosts: Host names callbacks may be sent to (empty allows any
+                public host)
+            allow_private_callbacks: Allow callbacks to non-public addresses
+                (for local development only)
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.ttl_seconds = ttl_seconds
+        self.retry_after = retry_after
+        self.webhook_attempts = max(1, webhook_attempts)
+        self.callback_hosts = {host.lower() for host in callback_hosts or ()}
+        self.allow_private_callbacks = allow_private_callbacks
+        self._jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._webhooks: Set[asyncio.Task] = set()
+        self._last_purge = 0.0
+
+    @classmethod
+    def from_config(cls) -> "JobManager":
+        """Create a job manager from the [jobs] configuration."""
+        settings = get_config().get("jobs", {})
+        return cls(
+            workers=int(settings.get("workers", 2)),
+            max_queue=int(settings.get("max_queue", 50)),
+            ttl_seconds=float(settings.get("ttl_seconds", 3600)),
+            retry_after=int(settings.get("retry_after", 10)),
+            webhook_attempts=int(settings.get("webhook_attempts", 3)),
+            callback_hosts=settings.get("callback_hosts", []),
+            allow_private_callbacks=bool(settings.get("allow_private_callbacks", False)),
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are running."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job workers (max_queue={self.max_queue})")
+
+    async def stop(self) -> None:
+        """Stop the workers; queued and running jobs are marked as failed."""
+        tasks, self._tasks = self._tasks + list(self._webhooks), []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            if not job.done:
+                self._finish(job, FAILED, error="Service shut down before the job finished")
+        self._queue = None
+        logger.info("Stopped job workers")
+
+    def submit(self, kind: str, func: Callable[[], Awaitable[Any]], callback_url: Optional[str] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Kind of work, used in logs and metric labels
+            func: Zero-argument coroutine function performing the work
+            callback_url: URL notified with the job when it finishes
+
+        Returns:
+            The queued job
+
+        Raises:
+            JobManagerStoppedError: If the workers are not running
+            JobQueueFullError: If the queue is full
+        """
+        if not self.running:
+            raise JobManagerStoppedError("Job workers are not running")
+        self._purge_expired()
+
+        job = Job(kind, func, callback_url)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            _rejected.inc(kind=kind)
+            raise JobQueueFullError(
+                f"Job queue is full ({self._queue.qsize()} jobs waiting)", self.retry_after
+            )
+
+        self._jobs[job.id] = job
+        _submitted.inc(kind=kind)
+        _queue_depth.set(self._queue.qsize())
+        logger.info(f"Queued {kind} job {job.id}")
+        return job
+
+    async def validate_callback_url(self, url: str) -> None:
+        """
+        Check that a callback URL may be notified.
+
+        Args:
+            url: Callback URL given by the client
+
+        Raises:
+            CallbackURLError: If the URL is not http(s), its host is not allowed,
+                or it resolves to a loopback, private, link-local or other
+                non-public address
+        """
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        if parts.scheme not in ("http", "https") or not host:
+            raise CallbackURLError("Callback URL must be an http(s) URL with a host")
+        if self.callback_hosts and host not in self.callback_hosts:
+            raise CallbackURLError(f"Callback host {host} is not allowed")
+        if self.allow_private_callbacks:
+            return
+
+        try:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except (OSError, ValueError) as e:
+            raise CallbackURLError(f"Callback host {host} cannot be resolved") from e
+        for info in infos:
+            address = ipaddress.ip_address(info[4][0].split("%")[0])
+            if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+                address = address.ipv4_mapped
+            if not address.is_global:
+                raise CallbackURLError(f"Callback host {host} resolves to a non-public address")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Get a job by id.
+
+        Args:
+            job_id: Job id returned by submit
+
+        Returns:
+            The job, or None if it is unknown or has expired
+        """
+        self._purge_expired()
+        job = self._jobs.get(job_id)
+        if job is not None and self._expired(job, time.time()):
+            return None
+        return job
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time until cancelled."""
+        while True:
+            job = await self._queue.get()
+            _queue_depth.set(self._queue.qsize())
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        """Run a job and record its outcome."""
+        job.status = RUNNING
+        job.started_at = time.time()
+        _wait.observe(job.started_at - job.created_at, kind=job.kind)
+        try:
+            result = await job.func()
+        except asyncio.CancelledError:
+            self._finish(job, FAILED, error="Service shut down before the job finished")
+            raise
+        except Exception as e:
+            # HTTPException carries its message in detail
+            error = getattr(e, "detail", None) or str(e)
+            logger.error(f"{job.kind} job {job.id} failed: {error}")
+            self._finish(job, FAILED, error=str(error))
+        else:
+            self._finish(job, SUCCEEDED, result=result)
+            logger.info(f"{job.kind} job {job.id} succeeded")
+
+        if job.callback_url:
+            # Deliver in the background so retries do not hold up the worker
+            task = asyncio.create_task(self._notify(job))
+            self._webhooks.add(task)
+            task.add_done_callback(self._webhooks.discard)
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Record a job's final status."""
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.func = None
+        if job.started_at is not None:
+            _duration.observe(job.finished_at - job.started_at, kind=job.kind)
+        _finished.inc(kind=job.kind, status=status)
+
+    async def _notify(self, job: Job) -> None:
+        """POST the finished job to its callback URL, retrying with backoff."""
+        payload = job.to_dict()
+        for attempt in range(1, self.webhook_attempts + 1):
+            try:
+                # Re-check in case the host's DNS changed since submission
+                await self.validate_callback_url(job.callback_url)
+            except CallbackURLError as e:
+                logger.error(f"Not delivering webhook for job {job.id}: {str(e)}")
+                return
+            try:
+                response = await get_http_client("webhooks").post(job.callback_url, json=payload)
+                if response.status_code < 400:
+                    return
+                logger.warning(f"Webhook for job {job.id} returned {response.status_code}")
+            except Exception as e:
+                logger.warning(f"Webhook for job {job.id} failed: {str(e)}")
+            if attempt < self.webhook_attempts:
+                await asyncio.sleep(2 ** (attempt - 1))
+        logger.error(f"Giving up on webhook for job {job.id} after {self.webhook_attempts} attempts")
+
+    def _purge_expired(self) -> None:
+        """Forget finished jobs older than the TTL."""
+        now = time.time()
+        if now - self._last_purge < PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        expired = [job_id for job_id, job in self._jobs.items() if self._expired(job, now)]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _expired(self, job: Job, now: float) -> bool:
+        """Whether a finished job has outlived the TTL."""
+        return job.done and now - job.finished_at > self.ttl_seconds
+
+
+# Create a singleton instance for global use
+_job_manager = None
+
+
+def get_job_manager() -> JobManager:
+    """
+    Get the global job manager instance.
+
+    Returns:
+        The global JobManager instance
+    """
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager.from_config()
+    return _job_manager
@@ -0,0 +1,205 @@
+"""
+In-process metrics for the application.
+
+This module provides minimal counters, gauges and histograms that components use
+to report what they are doing (cache hits, queue depths, latencies). Metrics are
+kept in a global registry and exposed by the ``/metrics`` endpoint, either as JSON
+or in the Prometheus text exposition format.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Default histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    """Convert a label dictionary into a hashable, ordered key."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    """Format a label key for the Prometheus text format."""
+    pairs = list(key) + sorted((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+class Metric:
+    """Base class for all metrics."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str):
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name, e.g. ``image_cache_hits_total``
+            description: Human-readable description
+        """
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Dict:
+        """Return the metric's current values as a JSON-serializable dictionary."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Return the metric's sample lines in the Prometheus text format."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str):
+        super().__init__(name, description)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given labels."""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for the given labels."""
+        return self._values.get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> Dict:
+        return {"type": self.kind, "values": [
+            {"labels": dict(key), "value": value} for key, value in self._values.items()
+        ]}
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(key)} {value}" for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given labels."""
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge for the given labels."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, description)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelKey, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given labels."""
+        key = _label_key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(counts):
+                counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def snapshot(self) -> Dict:
+        values = []
+        for key, (counts, total, count) in self._values.items():
+            cumulative, running = {}, 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                running += bucket_count
+                cumulative[str(bound)] = running
+            values.append({"labels": dict(key), "count": count, "sum": total, "buckets": cumulative})
+        return {"type": self.kind, "values": values}
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in self._values.items():
+            running = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                running += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, {'le': str(bound)})} {running}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, {'le': '+Inf'})} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry holding all metrics by name."""
+
+    def __init__(self):
+        """Initialize the metrics registry."""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(
+        self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, description, buckets)
+
+    def _get_or_create(self, metric_cls, name: str, description: str, *args) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_cls(name, description, *args)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return all metrics as a JSON-serializable dictionary."""
+        return {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Create a singleton instance for global use
+_metrics = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Get the global metrics registry instance.
+
+    Returns:
+        The global MetricsRegistry instance
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
@@ -0,0 +1,204 @@
+"""
+Startup profiling.
+
+Cold-start time matters for autoscaled pods, so the service records how long each
+phase of the FastAPI lifespan takes (model initialization, tool discovery, ...).
+Phase durations are always exported as the ``startup_phase_seconds`` gauge; with
+``[startup] profile = true`` a report is also logged at startup and checked
+against the configured budgets.
+
+Import times cannot be measured from inside an already-running interpreter, so
+scripts/profile_startup.py boots the app in a child process started with
+``python -X importtime`` and combines that output (see parse_importtime) with the
+phase report into a budget check that fails the build on regressions:
+
+    [startup]
+    profile = false
+    budget_seconds = 8.0
+    import_budget_seconds = 5.0
+
+    [startup.phase_budgets]
+    tool_discovery = 1.0
+"""
+
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.metrics import get_metrics
+
+_phase_seconds = get_metrics().gauge("startup_phase_seconds", "Duration of each application startup phase")
+_startup_seconds = get_metrics().gauge("startup_seconds", "Time from the start of the lifespan until ready")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """Import time of one module, as reported by ``python -X importtime``."""
+
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int  # 0 for modules imported directly by the profiled code
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse the stderr output of ``python -X importtime``.
+
+    Args:
+        output: Text written by the interpreter (other lines are ignored)
+
+    Returns:
+        One record per imported module, in import order
+    """
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us) / 1e6, int(cumulative_us) / 1e6, len(indent) // 2))
+    if records:
+        top = min(record.depth for record in records)
+        for record in records:
+            record.depth -= top
+    return records
+
+
+def summarize_imports(records: List[ImportRecord], top: int = 15) -> Dict[str, Any]:
+    """
+    Summarize import times for a startup report.
+
+    Args:
+        records: Records from parse_importtime
+        top: Number of modules and packages to list
+
+    Returns:
+        Total import time, the slowest modules by cumulative time, and the time
+        spent in each root package's own modules
+    """
+    packages: Dict[str, float] = {}
+    for record in records:
+        root = record.module.split(".")[0]
+        packages[root] = packages.get(root, 0.0) + record.self_seconds
+
+    top_level = [record for record in records if record.depth == 0]
+    slowest = sorted(records, key=lambda record: record.cumulative_seconds, reverse=True)
+    return {
+        "total_seconds": round(sum(record.cumulative_seconds for record in top_level), 4),
+        "modules": {record.module: round(record.cumulative_seconds, 4) for record in slowest[:top]},
+        "packages": {
+            name: round(seconds, 4)
+            for name, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+    }
+
+
+class StartupProfiler:
+    """Records the duration of each startup phase."""
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.phases: Dict[str, float] = {}
+        self.started_at: Optional[float] = None
+        self.startup_seconds: Optional[float] = None
+
+    def start(self) -> None:
+        """Mark the beginning of startup."""
+        self.started_at = time.perf_counter()
+        self.phases.clear()
+        self.startup_seconds = None
+
+    def finish(self) -> None:
+        """Mark the application as ready to serve."""
+        if self.started_at is not None:
+            self.startup_seconds = time.perf_counter() - self.started_at
+            _startup_seconds.set(self.startup_seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time one phase of startup.
+
+        Args:
+            name: Phase name, used in the report and metric labels
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            _phase_seconds.set(self.phases[name], phase=name)
+
+    def report(self) -> Dict[str, Any]:
+        """Phase durations and total startup time, in seconds."""
+        return {
+            "startup_seconds": round(self.startup_seconds, 4) if self.startup_seconds is not None else None,
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+        }
+
+
+def check_budget(report: Dict[str, Any], budgets: Dict[str, Any]) -> List[str]:
+    """
+    Compare a startup report with the configured budgets.
+
+    Args:
+        report: Report with ``startup_seconds``, ``phases`` and optionally
+            ``total_seconds`` and ``imports`` (from summarize_imports)
+        budgets: The [startup] configuration section
+
+    Returns:
+        A description of each exceeded budget; empty if within budget
+    """
+    violations = []
+    imports = report.get("imports") or {}
+    import_seconds = imports.get("total_seconds", 0.0)
+    # Wall time until ready when measured from process start, else the lifespan alone
+    total_seconds = report.get("total_seconds") or report.get("startup_seconds") or 0.0
+
+    budget = budgets.get("budget_seconds")
+    if budget is not None and total_seconds > budget:
+        violations.append(f"startup took {total_seconds:.2f}s, budget is {budget}s")
+    budget = budgets.get("import_budget_seconds")
+    if budget is not None and imports and import_seconds > budget:
+        violations.append(f"imports took {import_seconds:.2f}s, budget is {budget}s")
+    for name, budget in (budgets.get("phase_budgets") or {}).items():
+        seconds = report.get("phases", {}).get(name)
+        if seconds is not None and seconds > budget:
+            violations.append(f"phase {name} took {seconds:.2f}s, budget is {budget}s")
+    return violations
+
+
+def log_startup_report(profiler: StartupProfiler) -> None:
+    """Log the startup report and any exceeded budgets when profiling is enabled."""
+    settings = get_config().get("startup", {}) or {}
+    if not settings.get("profile", False):
+        return
+    report = profiler.report()
+    logger.info(f"Startup report: {report}")
+    for violation in check_budget(report, settings):
+        logger.warning(f"Startup budget exceeded: {violation}")
+
+
+# Create a singleton instance for global use
+_profiler = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Get the global startup profiler instance.
+
+    Returns:
+        The global StartupProfiler instance
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
@@ -0,0 +1,298 @@
+"""
+Shared registry of prompt templates.
+
+Tools keep their prompts as YAML files in ``tools/<tool>/prompts/``. The registry
+parses each directory once, compiles every ``human`` template and checks that it
+only uses the placeholders the tool supplies (e.g. ``{prompt}``, ``{scene_count}``),
+so a typo fails when the prompt is loaded rather than on a user's request. Each
+prompt is versioned by the hash of its file.
+
+When reloading is enabled, a background task polls the prompt directories and
+re-parses a directory when any of its files change, off the event loop. The new
+prompts replace the old ones in a single assignment, so requests never wait on a
+reload; if the edited prompts fail to load, the previous ones stay in use.
+Configured in config.toml:
+
+    [prompts]
+    reload = true
+    poll_interval = 2
+"""
+
+import asyncio
+import hashlib
+import string
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import yaml
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.metrics import get_metrics
+
+_reloads = get_metrics().counter("prompt_reloads_total", "Prompt directory reloads, by outcome")
+
+_formatter = string.Formatter()
+
+
+class PromptError(Exception):
+    """Exception raised when a prompt file cannot be loaded."""
+    pass
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """A parsed prompt with its compiled ``human`` template."""
+
+    name: str
+    system: str
+    human: str
+    version: str
+    placeholders: FrozenSet[str]
+    data: Dict[str, Any] = field(default_factory=dict, compare=False)
+    # Literal text and placeholder name pairs of the human template
+    _segments: Tuple[Tuple[str, Optional[str]], ...] = field(default=(), compare=False, repr=False)
+
+    def render(self, **values: Any) -> str:
+        """
+        Fill in the human template.
+
+        Args:
+            **values: Placeholder values; unused ones are ignored
+
+        Returns:
+            The formatted human message
+        """
+        parts: List[str] = []
+        for literal, name in self._segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(str(values[name]))
+        return "".join(parts)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get another field of the prompt file (e.g. ``temperature``)."""
+        return self.data.get(key, default)
+
+
+def compile_prompt(name: str, raw: bytes, placeholders: FrozenSet[str]) -> Prompt:
+    """
+    Parse and compile one prompt file.
+
+    Args:
+        name: Prompt type (the file name without extension)
+        raw: Contents of the YAML file
+        placeholders: Placeholders the tool supplies when rendering
+
+    Returns:
+        The compiled prompt
+
+    Raises:
+        PromptError: If the file is invalid or uses an unknown placeholder
+    """
+    try:
+        data = yaml.safe_load(raw.decode("utf-8"))
+    except Exception as e:
+        raise PromptError(f"Invalid prompt {name}: {str(e)}") from e
+    if not isinstance(data, dict):
+        raise PromptError(f"Invalid prompt {name}: expected a mapping")
+
+    system = textwrap.dedent(data.get("system") or "").strip()
+    human = textwrap.dedent(data.get("human") or "").strip()
+
+    segments: List[Tuple[str, Optional[str]]] = []
+    used = set()
+    try:
+        for literal, field_name, format_spec, conversion in _formatter.parse(human):
+            if field_name is not None and (format_spec or conversion or field_name not in placeholders):
+                raise PromptError(
+                    f"Prompt {name} uses unsupported placeholder {{{field_name}}}; "
+                    f"expected one of {sorted(placeholders)}"
+                )
+            segments.append((literal, field_name))
+            if field_name is not None:
+                used.add(field_name)
+    except ValueError as e:
+        raise PromptError(f"Invalid template in prompt {name}: {str(e)}") from e
+
+    return Prompt(
+        name=name,
+        system=system,
+        human=human,
+        version=hashlib.sha256(raw).hexdigest()[:12],
+        placeholders=frozenset(used),
+        data={key: value for key, value in data.items() if key not in ("system", "human")},
+        _segments=tuple(segments),
+    )
+
+
+class PromptSet:
+    """The prompts of one tool, reloaded when their files change."""
+
+    def __init__(self, directory: Path, placeholders: Iterable[str]):
+        """
+        Load the prompts in a directory.
+
+        Args:
+            directory: Directory containing the prompt YAML files
+            placeholders: Placeholders the tool supplies when rendering
+
+        Raises:
+            PromptError: If the prompts cannot be loaded
+        """
+        self.directory = directory
+        self.placeholders = frozenset(placeholders)
+        self._signature = self._scan()
+        self._prompts = self._load()
+
+    def __getitem__(self, name: str) -> Prompt:
+        return self._prompts[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._prompts
+
+    def names(self) -> List[str]:
+        """Names of the loaded prompts."""
+        return list(self._prompts)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the prompts if any file was added, removed or modified.
+
+        Returns:
+            True if new prompts were loaded
+        """
+        signature = self._scan()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            prompts = self._load()
+        except PromptError as e:
+            _reloads.inc(outcome="failed")
+            logger.error(f"Keeping previous prompts for {self.directory}: {str(e)}")
+            return False
+        self._prompts = prompts
+        _reloads.inc(outcome="success")
+        logger.info(f"Reloaded prompts from {self.directory}")
+        return True
+
+    def _scan(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Name, modification time and size of each prompt file."""
+        if not self.directory.is_dir():
+            return ()
+        files = []
+        for path in self.directory.glob("*.yaml"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(files))
+
+    def _load(self) -> Dict[str, Prompt]:
+        if not self.directory.is_dir():
+            raise PromptError(f"Prompts directory not found: {self.directory}")
+
+        prompts = {}
+        for path in sorted(self.directory.glob("*.yaml")):
+            try:
+                raw = path.read_bytes()
+            except OSError as e:
+                raise PromptError(f"Error loading prompt file {path}: {str(e)}") from e
+            prompts[path.stem] = compile_prompt(path.stem, raw, self.placeholders)
+
+        if not prompts:
+            raise PromptError(f"No valid prompts found in {self.directory}")
+        return prompts
+
+
+class PromptRegistry:
+    """Prompt sets of every tool, with optional background reloading."""
+
+    def __init__(self, reload: bool = True, poll_interval: float = 2.0):
+        """
+        Initialize the registry.
+
+        Args:
+            reload: Whether to watch the prompt directories for changes
+            poll_interval: Seconds between checks for changed files
+        """
+        self.reload = reload
+        self.poll_interval = poll_interval
+        self._sets: Dict[Path, PromptSet] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls) -> "PromptRegistry":
+        """Create a registry from the [prompts] configuration."""
+        config = get_config()
+        return cls(
+            reload=bool(config.get("prompts.reload", True)),
+            poll_interval=float(config.get("prompts.poll_interval", 2)),
+        )
+
+    def register(self, directory: Path, placeholders: Iterable[str]) -> PromptSet:
+        """
+        Get the prompt set for a directory, loading it on first use.
+
+        Args:
+            directory: Directory containing the prompt YAML files
+            placeholders: Placeholders the tool supplies when rendering
+
+        Returns:
+            The shared prompt set
+
+        Raises:
+            PromptError: If the prompts cannot be loaded
+        """
+        directory = directory.resolve()
+        prompt_set = self._sets.get(directory)
+        if prompt_set is None:
+            prompt_set = PromptSet(directory, placeholders)
+            self._sets[directory] = prompt_set
+        return prompt_set
+
+    async def check_for_changes(self) -> None:
+        """Reload every prompt set whose files changed, off the event loop."""
+        for prompt_set in list(self._sets.values()):
+            await asyncio.to_thread(prompt_set.reload_if_changed)
+
+    def start_watching(self) -> None:
+        """Start polling the prompt directories in the background."""
+        if self.reload and self.poll_interval > 0 and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch_loop())
+
+    async def stop_watching(self) -> None:
+        """Stop polling the prompt directories."""
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _watch_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.check_for_changes()
+            except Exception as e:
+                logger.warning(f"Prompt reload check failed: {str(e)}")
+
+
+# Create a singleton instance for global use
+_registry = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """
+    Get the global prompt registry instance.
+
+    Returns:
+        The global PromptRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        _registry = PromptRegistry.from_config()
+    return _registry
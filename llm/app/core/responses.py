@@ -0,0 +1,139 @@
+"""
+Response helpers.
+
+JSON responses are rendered with orjson when it is installed, which serializes
+large payloads (stories with inline images) several times faster than the
+standard library and skips FastAPI's extra encoding pass. The caching helpers
+support responses whose content is identified by a strong ETag, so clients and
+proxies can cache them and revalidate with ``If-None-Match`` instead of
+downloading the body again.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Cache-Control for content-addressed resources that never change
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Cache-Control for resources that may change (e.g. on deploy); clients keep a
+# copy but revalidate it with If-None-Match on each use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize a JSON-compatible value to UTF-8 bytes.
+
+    Args:
+        content: Value made of dicts, lists, strings, numbers, booleans and None
+
+    Returns:
+        Compact JSON encoding of the value
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class DefaultJSONResponse(JSONResponse):
+    """JSON response rendered with dumps_json (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def make_etag(digest: str) -> str:
+    """Format a content digest as a strong ETag."""
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether a request's ``If-None-Match`` header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already holds the current representation
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def caching_headers(etag: str, cache_control: str = IMMUTABLE_CACHE_CONTROL) -> Dict[str, str]:
+    """Build the ETag and Cache-Control headers for a response."""
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(
+    request: Request, etag: str, cache_control: str = IMMUTABLE_CACHE_CONTROL
+) -> Optional[Response]:
+    """
+    Return a 304 response if the client's cached copy is current.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        cache_control: Cache-Control header for the resource
+
+    Returns:
+        A 304 Not Modified response, or None if the full body must be sent
+    """
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=caching_headers(etag, cache_control))
+    return None
+
+
+class PrecomputedJSON:
+    """
+    A JSON document serialized once and served with a strong ETag.
+
+    For responses that only change when the application does (tool listings,
+    JSON schemas): each request costs a header comparison and, unless the client
+    already holds the document, a copy of the prebuilt bytes.
+    """
+
+    def __init__(self, content: Any, cache_control: str = REVALIDATE_CACHE_CONTROL):
+        """
+        Serialize the document.
+
+        Args:
+            content: JSON-compatible value
+            cache_control: Cache-Control header for the document
+        """
+        self.body = dumps_json(content)
+        self.etag = make_etag(hashlib.sha256(self.body).hexdigest()[:32])
+        self.cache_control = cache_control
+
+    def respond(self, request: Request) -> Response:
+        """
+        Build the response to a request for the document.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            304 Not Modified if the client's copy is current, else the document
+        """
+        cached = not_modified(request, self.etag, self.cache_control)
+        if cached is not None:
+            return cached
+        return Response(
+            self.body,
+            media_type="application/json",
+            headers=caching_headers(self.etag, self.cache_control),
+        )
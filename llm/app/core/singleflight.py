@@ -0,0 +1,85 @@
+"""
+Request coalescing.
+
+SingleFlight makes concurrent calls with the same key share one execution:
+the first caller starts the work and later callers await the same result
+instead of repeating it. Once the work finishes the key is released, so later
+calls run again (this is deduplication of in-flight work, not a cache).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from loguru import logger
+
+from app.core.metrics import get_metrics
+
+T = TypeVar("T")
+
+_calls = get_metrics().counter(
+    "singleflight_calls_total", "Coalesced calls by group and role (leader runs the work, shared waits)"
+)
+
+
+class SingleFlight:
+    """Coalesces concurrent async calls that share a key."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the group.
+
+        Args:
+            name: Group name, used in logs and metric labels
+        """
+        self.name = name
+        # key -> (shared task, number of callers awaiting it)
+        self._inflight: Dict[Hashable, Tuple[asyncio.Task, int]] = {}
+
+    def __len__(self) -> int:
+        """Number of keys with work in flight."""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``func`` once for all concurrent callers with the same key.
+
+        A caller that is cancelled stops waiting without cancelling the shared
+        work, unless it was the last caller waiting for it.
+
+        Args:
+            key: Hashable identity of the work
+            func: Zero-argument coroutine function performing the work
+
+        Returns:
+            The shared result; an exception raised by the work is raised to every caller
+        """
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0].get_loop() is asyncio.get_running_loop() and not entry[0].done():
+            task, waiters = entry
+            _calls.inc(group=self.name, role="shared")
+            logger.info(f"Coalescing request into in-flight {self.name} call")
+        else:
+            task, waiters = asyncio.ensure_future(func()), 0
+            task.add_done_callback(lambda done: self._release(key, done))
+            _calls.inc(group=self.name, role="leader")
+        self._inflight[key] = (task, waiters + 1)
+
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry = self._inflight.get(key)
+            if entry is not None and entry[0] is task:
+                remaining = entry[1] - 1
+                if remaining == 0 and not task.done():
+                    # Nobody is waiting for the result any more; forget the key now
+                    # so new callers start fresh work instead of joining the dying task
+                    del self._inflight[key]
+                    task.cancel()
+                else:
+                    self._inflight[key] = (task, remaining)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a key once its work has finished."""
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
@@ -0,0 +1,154 @@
+"""
+Incremental JSON parsing for streamed LLM output.
+
+The LLM returns a story as a single JSON object whose ``scenes`` array is written
+token by token. IncrementalJSONParser scans the text as it arrives and reports each
+top-level string field (e.g. ``title``) and each element of a chosen array (e.g.
+``scenes[i]``) as soon as its closing quote or brace is seen, so downstream work can
+start before the LLM has finished writing.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from loguru import logger
+
+from app.llm.tolerant_json import parse_json_tolerant
+
+
+@dataclass
+class JSONStreamEvent:
+    """A value completed while parsing a JSON stream."""
+
+    kind: str  # "field" for a top-level string field, "item" for an array element
+    key: str
+    value: Any
+
+
+class IncrementalJSONParser:
+    """
+    Single-pass incremental scanner for a streamed JSON object.
+
+    Text before the first ``{`` (e.g. prose the model adds) is ignored. Each call to
+    :meth:`feed` scans only the new characters, so the total cost is linear in the
+    length of the output.
+    """
+
+    def __init__(self, array_key: str = "scenes"):
+        """
+        Initialize the parser.
+
+        Args:
+            array_key: Top-level key whose array elements are emitted individually
+        """
+        self.array_key = array_key
+        self.items: List[Any] = []
+        self._chunks: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expecting_key = False
+        self._current_key: Optional[str] = None
+        self._array_open = False
+        # Text of the top-level string or array item currently being read
+        self._capture: Optional[List[str]] = None
+
+    @property
+    def text(self) -> str:
+        """All text fed to the parser so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk: str) -> List[JSONStreamEvent]:
+        """
+        Feed the next chunk of text.
+
+        Args:
+            chunk: Newly received text
+
+        Returns:
+            Events for the fields and array items completed by this chunk
+        """
+        self._chunks.append(chunk)
+        events: List[JSONStreamEvent] = []
+        capture_from = 0
+
+        for pos, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        literal = self._end_capture(chunk, capture_from, pos)
+                        self._on_top_level_string(literal, events)
+                continue
+
+            if self._depth == 0 and char != "{":
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._capture = []
+                    capture_from = pos
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._expecting_key = True
+                elif self._depth == 2 and char == "[" and self._current_key == self.array_key:
+                    self._array_open = True
+                elif self._depth == 3 and self._array_open:
+                    self._capture = []
+                    capture_from = pos
+            elif char in "}]":
+                if self._depth == 3 and self._capture is not None:
+                    self._on_item(self._end_capture(chunk, capture_from, pos), events)
+                elif self._depth == 2:
+                    self._array_open = False
+                self._depth -= 1
+            elif self._depth == 1:
+                if char == ",":
+                    self._expecting_key = True
+                elif char == ":":
+                    self._expecting_key = False
+
+        if self._capture is not None:
+            self._capture.append(chunk[capture_from:])
+        return events
+
+    def _end_capture(self, chunk: str, capture_from: int, pos: int) -> str:
+        """Finish the current capture at ``chunk[pos]`` and return its text."""
+        parts = self._capture or []
+        parts.append(chunk[capture_from : pos + 1])
+        self._capture = None
+        return "".join(parts)
+
+    def _on_top_level_string(self, literal: str, events: List[JSONStreamEvent]) -> None:
+        """Handle a completed string token inside the top-level object."""
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            return
+        if self._expecting_key:
+            self._current_key = value
+        elif self._current_key is not None:
+            events.append(JSONStreamEvent("field", self._current_key, value))
+
+    def _on_item(self, literal: str, events: List[JSONStreamEvent]) -> None:
+        """Handle a completed element of the tracked array."""
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            try:
+                # e.g. a missing comma inside the item
+                value = parse_json_tolerant(literal).value
+            except ValueError as e:
+                logger.warning(f"Skipping unparseable {self.array_key} item: {e}")
+                return
+        self.items.append(value)
+        events.append(JSONStreamEvent("item", self.array_key, value))
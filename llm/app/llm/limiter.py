@@ -0,0 +1,256 @@
+"""
+Admission control for model invocations.
+
+A local model server degrades sharply when it is asked to run more generations
+than it has capacity for, so model calls go through a FairLimiter: at most
+``max_concurrency`` calls per Ollama backend run at once and the rest wait in
+per-user queues that are served round robin, so one user submitting many
+stories cannot starve the others. When the queue is full, or a call has waited longer than ``max_wait``,
+the call is rejected with ModelOverloadedError, which the API turns into
+429 Too Many Requests with a Retry-After header.
+
+Calls made for background jobs (inside ``job_calls()``) share the same slots
+and rotation but are never rejected for a full queue, since the job queue
+already bounds them, and wait up to ``job_max_wait`` seconds (0 waits for as
+long as it takes). Configured under [llm.limiter] in config.toml:
+
+    [llm.limiter]
+    enabled = true
+    max_concurrency = 2
+    max_queue = 16
+    max_wait = 30
+    job_max_wait = 0
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Iterator, Optional
+
+from loguru import logger
+
+from app.core.config import get_config
+from app.core.metrics import get_metrics
+from app.llm.manager import get_ollama_base_urls
+
+_metrics = get_metrics()
+_in_flight = _metrics.gauge("llm_in_flight", "Model calls currently running")
+_queue_depth = _metrics.gauge("llm_queue_depth", "Model calls waiting for a free slot")
+_rejected = _metrics.counter("llm_rejected_total", "Model calls rejected by admission control, by reason")
+_queue_wait = _metrics.histogram("llm_queue_wait_seconds", "Time model calls waited for a free slot")
+_inference = _metrics.histogram(
+    "llm_inference_seconds", "Time model calls held a slot",
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300),
+)
+
+# Weight of the latest call in the moving average used for Retry-After
+_EWMA_ALPHA = 0.2
+
+# Set while running a background job; inherited by tasks the job starts
+_job_call: ContextVar[bool] = ContextVar("llm_job_call", default=False)
+
+
+@contextmanager
+def job_calls() -> Iterator[None]:
+    """Mark model calls made in the block as background job calls."""
+    token = _job_call.set(True)
+    try:
+        yield
+    finally:
+        _job_call.reset(token)
+
+
+class ModelOverloadedError(Exception):
+    """Exception raised when a model call is shed by admission control."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FairLimiter:
+    """Concurrency limiter with bounded, per-user round-robin queueing."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 2,
+        max_queue: int = 16,
+        max_wait: float = 30.0,
+        job_max_wait: Optional[float] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Number of calls allowed to run at once
+            max_queue: Number of calls allowed to wait for a slot
+            max_wait: Seconds a call may wait before it is rejected
+            job_max_wait: Seconds a background job call may wait, or None for no limit
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.max_wait = max_wait
+        self.job_max_wait = job_max_wait
+        self._active = 0
+        self._queued = 0
+        # username -> waiters, in the order users are served
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._average_seconds = 10.0
+
+    @property
+    def active(self) -> int:
+        """Number of calls holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return self._queued
+
+    @asynccontextmanager
+    async def slot(self, username: str) -> AsyncIterator[None]:
+        """
+        Hold a model call slot for the duration of the block.
+
+        Args:
+            username: User the call is made for, used for fair queueing
+
+        Raises:
+            ModelOverloadedError: If the queue is full or the wait times out
+        """
+        await self.acquire(username)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _inference.observe(elapsed)
+            self._average_seconds += _EWMA_ALPHA * (elapsed - self._average_seconds)
+            self.release()
+
+    async def acquire(self, username: str) -> None:
+        """
+        Wait for a free slot; callers must call release() when done.
+
+        Args:
+            username: User the call is made for, used for fair queueing
+
+        Raises:
+            ModelOverloadedError: If the queue is full or the wait times out
+        """
+        if self._active < self.max_concurrency and not self._queued:
+            self._active += 1
+            _queue_wait.observe(0.0)
+            self._report()
+            return
+
+        job_call = _job_call.get()
+        if self._queued >= self.max_queue and not job_call:
+            _rejected.inc(reason="queue_full")
+            raise ModelOverloadedError(
+                f"Model is overloaded ({self._active} running, {self._queued} queued)", self.retry_after()
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(username, deque()).append(future)
+        self._queued += 1
+        self._report()
+        start = time.perf_counter()
+        max_wait = self.job_max_wait if job_call else self.max_wait
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=max_wait)
+        except asyncio.TimeoutError:
+            # Unless the slot was handed over just as the wait ran out
+            if not self._granted(future):
+                self._abandon(username, future)
+                _rejected.inc(reason="timeout")
+                raise ModelOverloadedError(
+                    f"Timed out after {max_wait}s waiting for the model", self.retry_after()
+                ) from None
+        except BaseException:
+            if self._granted(future):
+                self.release()
+            else:
+                self._abandon(username, future)
+            raise
+        _queue_wait.observe(time.perf_counter() - start)
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next user in round-robin order."""
+        while self._waiters:
+            username, waiters = self._waiters.popitem(last=False)
+            future = waiters.popleft()
+            if waiters:
+                # The user goes to the back of the rotation
+                self._waiters[username] = waiters
+            self._queued -= 1
+            if not future.done():
+                # The slot passes directly to the waiter; the active count is unchanged
+                future.set_result(None)
+                self._report()
+                return
+        self._active -= 1
+        self._report()
+
+    def retry_after(self) -> int:
+        """Estimate how many seconds a rejected caller should wait before retrying."""
+        backlog = (self._active + self._queued) / self.max_concurrency
+        return max(1, math.ceil(backlog * self._average_seconds))
+
+    @staticmethod
+    def _granted(future: asyncio.Future) -> bool:
+        """Whether a waiter has been handed a slot."""
+        return future.done() and not future.cancelled()
+
+    def _abandon(self, username: str, future: asyncio.Future) -> None:
+        """Drop a waiter that stopped waiting from its user's queue."""
+        future.cancel()
+        waiters = self._waiters.get(username)
+        if waiters is None or future not in waiters:
+            return
+        waiters.remove(future)
+        if not waiters:
+            del self._waiters[username]
+        self._queued -= 1
+        self._report()
+
+    def _report(self) -> None:
+        """Publish in-flight and queue depth gauges."""
+        _in_flight.set(self._active)
+        _queue_depth.set(self._queued)
+
+
+# Create a singleton instance for global use
+_limiter = None
+
+
+def get_limiter() -> Optional[FairLimiter]:
+    """
+    Get the global model limiter.
+
+    Returns:
+        The FairLimiter configured under [llm.limiter], or None if it is disabled
+    """
+    global _limiter
+    if _limiter is None:
+        settings = get_config().get("llm.limiter", {})
+        if not settings.get("enabled", True):
+            return None
+        # Capacity grows with the number of Ollama backends in the pool
+        llm_settings = get_config().get("llm", {})
+        backends = len(get_ollama_base_urls(llm_settings)) if llm_settings.get("use_ollama", True) else 1
+        _limiter = FairLimiter(
+            max_concurrency=int(settings.get("max_concurrency", 2)) * backends,
+            max_queue=int(settings.get("max_queue", 16)),
+            max_wait=float(settings.get("max_wait", 30)),
+            job_max_wait=float(settings.get("job_max_wait", 0)) or None,
+        )
+        logger.info(
+            f"Model limiter: max_concurrency={_limiter.max_concurrency}, "
+            f"max_queue={_limiter.max_queue}, max_wait={_limiter.max_wait}s, "
+            f"job_max_wait={_limiter.job_max_wait}s"
+        )
+    return _limiter
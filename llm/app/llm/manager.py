@@ -1,34 +1,63 @@
-from typing import Dict, Any, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from dataclasses import dataclass
 from loguru import logger
 import httpx
 import json
 from langchain_openai import ChatOpenAI
 
+from app.core.http import get_http_client
+from app.core.metrics import get_metrics
+
+
+_metrics = get_metrics()
+_prompt_eval = _metrics.histogram(
+    "llm_prompt_eval_seconds", "Time Ollama spent evaluating the prompt (low when the prefix is cached)"
+)
+_prompt_tokens = _metrics.counter("llm_prompt_eval_tokens_total", "Prompt tokens Ollama had to evaluate")
+
 
 class OllamaClient:
-    def __init__(self, model: str, base_url: str):
+    def __init__(self, model: str, base_url: str, keep_alive: Optional[Union[str, int]] = None):
         self.model = model
         self.base_url = base_url
-        self.client = httpx.AsyncClient()
+        # How long Ollama keeps the model (and its prompt cache) loaded between calls
+        self.keep_alive = keep_alive
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for Ollama, owned and closed by the HTTP registry"""
+        return get_http_client("ollama")
+
+    def _payload(
+        self,
+        stream: bool,
+        options: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Union[str, Dict[str, Any]]] = None,
+        **fields: Any,
+    ) -> Dict[str, Any]:
+        """Build a request body for the Ollama API"""
+        payload = {"model": self.model, **fields, "stream": stream}
+        if options:
+            # Model parameters such as temperature; unset ones use the model defaults
+            payload["options"] = options
+        if response_format is not None:
+            # "json" or a JSON schema; Ollama constrains decoding to match it
+            payload["format"] = response_format
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
     
     async def invoke(self, prompt: str) -> str:
         """Invoke Ollama with a prompt"""
         try:
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False
-            }
-            
             response = await self.client.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=120.0
+                json=self._payload(stream=False, prompt=prompt)
             )
             
             if response.status_code == 200:
                 result = response.json()
+                _record_usage(result)
                 return result.get("response", "")
             else:
                 raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
@@ -37,6 +66,77 @@ class OllamaClient:
             logger.error(f"Ollama API call failed: {e}")
             raise
 
+    async def astream(self, prompt: str, options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Invoke Ollama with a prompt and yield response text as it is generated"""
+        payload = self._payload(stream=True, options=options, prompt=prompt)
+        async for chunk in self._stream("/api/generate", payload):
+            if chunk.get("response"):
+                yield chunk["response"]
+
+    async def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Invoke Ollama's chat API and yield the reply text as it is generated.
+
+        Keeping the system message identical across calls lets Ollama reuse the
+        cached evaluation of that shared prefix while the model stays loaded
+        (see ``keep_alive``), so only the user turn has to be evaluated.
+
+        Args:
+            messages: Chat messages, each with a ``role`` and ``content``
+            options: Model parameters such as temperature
+            response_format: "json" or a JSON schema the reply must conform to
+
+        Yields:
+            Chunks of the assistant reply
+        """
+        payload = self._payload(stream=True, options=options, response_format=response_format, messages=messages)
+        async for chunk in self._stream("/api/chat", payload):
+            content = (chunk.get("message") or {}).get("content")
+            if content:
+                yield content
+
+    async def _stream(self, path: str, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Post a streaming request and yield each JSON chunk Ollama sends"""
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}{path}",
+                json=payload
+            ) as response:
+                if response.status_code != 200:
+                    body = (await response.aread()).decode(errors="replace")
+                    raise Exception(f"Ollama API error: {response.status_code} - {body}")
+
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise Exception(f"Ollama API error: {chunk['error']}")
+                    yield chunk
+                    if chunk.get("done"):
+                        _record_usage(chunk)
+                        break
+
+        except Exception as e:
+            logger.error(f"Ollama streaming call failed: {e}")
+            raise
+
+
+def _record_usage(result: Dict[str, Any]) -> None:
+    """Record prompt evaluation statistics from Ollama's final response"""
+    if "prompt_eval_duration" in result:
+        # Ollama reports durations in nanoseconds
+        _prompt_eval.observe(result["prompt_eval_duration"] / 1e9)
+    if "prompt_eval_count" in result:
+        _prompt_tokens.inc(result["prompt_eval_count"])
+
 
 @dataclass
 class ModelConfig:
@@ -46,6 +146,9 @@ class ModelConfig:
     temperature: float
     ollama_model: Optional[str]
     ollama_base_url: Optional[str]
+    ollama_base_urls: List[str]
+    ollama_keep_alive: Optional[Union[str, int]]
+    pool: Dict[str, Any]
     chgw_endpoint: Optional[str]
     enable_prompt_logging: bool
 
@@ -68,11 +171,30 @@ def get_config() -> ModelConfig:
         temperature=llm_config.get("temperature", 0.7),
         ollama_model=llm_config.get("ollama_model", "llama4:16x17b"),
         ollama_base_url=llm_config.get("ollama_base_url", "http://localhost:11434"),
+        ollama_base_urls=get_ollama_base_urls(llm_config),
+        ollama_keep_alive=llm_config.get("ollama_keep_alive", "30m"),
+        pool=llm_config.get("pool", {}),
         chgw_endpoint=llm_config.get("endpoint"),
         enable_prompt_logging=llm_config.get("enable_prompt_logging", False),
     )
 
 
+def get_ollama_base_urls(llm_config: Dict[str, Any]) -> List[str]:
+    """
+    Get the Ollama instances to spread model calls over.
+
+    Args:
+        llm_config: The [llm] configuration section
+
+    Returns:
+        ``ollama_base_urls`` if set, otherwise the single ``ollama_base_url``
+    """
+    base_urls = llm_config.get("ollama_base_urls")
+    if base_urls:
+        return list(base_urls)
+    return [llm_config.get("ollama_base_url", "http://localhost:11434")]
+
+
 class ModelManager:
     _instance: Union[OllamaClient, ChatOpenAI] = None
 
@@ -87,13 +209,15 @@ class ModelManager:
                         raise ValueError(
                             "OLLAMA_MODEL must be set in configuration when using Ollama"
                         )
-                    if not config.ollama_base_url:
+                    if not config.ollama_base_urls:
                         raise ValueError("OLLAMA_BASE_URL must be provided when using Ollama")
-                    logger.info("Initializing Ollama client")
-                    
-                    cls._instance = OllamaClient(
-                        model=config.ollama_model,
-                        base_url=config.ollama_base_url
+                    logger.info(f"Initializing Ollama pool with {len(config.ollama_base_urls)} backends")
+
+                    from app.llm.pool import OllamaPool
+
+                    cls._instance = OllamaPool.from_config(
+                        config.ollama_model, config.ollama_base_urls, config.pool,
+                        keep_alive=config.ollama_keep_alive
                     )
                 else:
                     # Use OpenAI as default
@@ -121,6 +245,20 @@ class ModelManager:
             )
         return cls._instance
 
+    @classmethod
+    def start_health_checks(cls) -> None:
+        """Start background health checks of the model backends, if supported."""
+        start = getattr(cls._instance, "start_health_checks", None)
+        if start is not None:
+            start()
+
+    @classmethod
+    async def stop_health_checks(cls) -> None:
+        """Stop background health checks of the model backends."""
+        stop = getattr(cls._instance, "stop_health_checks", None)
+        if stop is not None:
+            await stop()
+
     @classmethod
     def clear(cls) -> None:
         if cls._instance is not None:
@@ -0,0 +1,305 @@
+"""
+Load-balanced pool of Ollama backends.
+
+Each call is routed to one of several Ollama instances serving the same model,
+so inference capacity grows with the number of instances. Routing picks the
+available backend with the fewest outstanding requests ("least_outstanding"),
+or the lowest expected completion time from a moving average of its latency
+("latency"). A circuit breaker ejects a backend after consecutive failures and
+lets a single trial request through once its cooldown has passed; background
+health checks probe every backend so recovered ones rejoin (and dead ones are
+ejected) without waiting for user traffic. Configured in config.toml:
+
+    [llm]
+    ollama_base_urls = ["http://gpu-1:11434", "http://gpu-2:11434"]
+
+    [llm.pool]
+    strategy = "least_outstanding"
+    failure_threshold = 3
+    cooldown = 30
+    health_interval = 15
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+
+from loguru import logger
+
+from app.core.metrics import get_metrics
+from app.llm.manager import OllamaClient
+
+_metrics = get_metrics()
+_requests = _metrics.counter("llm_backend_requests_total", "Model calls per backend, by outcome")
+_outstanding = _metrics.gauge("llm_backend_outstanding", "Model calls in flight per backend")
+_up = _metrics.gauge("llm_backend_up", "Whether a backend is accepting calls (1) or ejected (0)")
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Weight of the latest call in the latency moving average
+_EWMA_ALPHA = 0.3
+
+STRATEGIES = ("least_outstanding", "latency")
+
+
+class NoBackendAvailableError(Exception):
+    """Exception raised when every Ollama backend is ejected."""
+    pass
+
+
+class OllamaBackend:
+    """One Ollama instance with its load and circuit breaker state."""
+
+    def __init__(self, model: str, base_url: str, keep_alive: Optional[Union[str, int]] = None):
+        self.client = OllamaClient(model=model, base_url=base_url, keep_alive=keep_alive)
+        self.base_url = base_url
+        self.outstanding = 0
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._report()
+
+    def available(self, now: float, cooldown: float) -> bool:
+        """Whether the backend may take a call, moving it to half-open after the cooldown."""
+        if self.state == OPEN and now - self.opened_at >= cooldown:
+            self.state = HALF_OPEN
+        # A half-open backend takes one trial call at a time
+        return self.state == CLOSED or (self.state == HALF_OPEN and self.outstanding == 0)
+
+    def score(self, strategy: str) -> float:
+        """Routing cost of sending the next call to this backend (lower is better)."""
+        if strategy == "latency" and self.latency is not None:
+            return (self.outstanding + 1) * self.latency
+        return float(self.outstanding)
+
+    def record_success(self, elapsed: Optional[float] = None) -> None:
+        """Record a successful call or health check, closing the breaker."""
+        if elapsed is not None:
+            self.latency = elapsed if self.latency is None else self.latency + _EWMA_ALPHA * (elapsed - self.latency)
+        if self.state != CLOSED:
+            logger.info(f"Ollama backend {self.base_url} recovered")
+        self.failures = 0
+        self.state = CLOSED
+        self._report()
+
+    def record_failure(self, threshold: int) -> None:
+        """Record a failed call or health check, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= threshold):
+            logger.warning(f"Ejecting Ollama backend {self.base_url} after {self.failures} failures")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+        self._report()
+
+    def _report(self) -> None:
+        _outstanding.set(self.outstanding, backend=self.base_url)
+        _up.set(0 if self.state == OPEN else 1, backend=self.base_url)
+
+
+class OllamaPool(OllamaClient):
+    """Ollama client that spreads calls over several backends."""
+
+    def __init__(
+        self,
+        model: str,
+        base_urls: List[str],
+        strategy: str = "least_outstanding",
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        health_interval: float = 15.0,
+        health_timeout: float = 2.0,
+        keep_alive: Optional[Union[str, int]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            model: Model served by every backend
+            base_urls: Base URLs of the Ollama instances
+            strategy: "least_outstanding" or "latency"
+            failure_threshold: Consecutive failures that eject a backend
+            cooldown: Seconds an ejected backend waits before a trial call
+            health_interval: Seconds between health checks (0 disables them)
+            health_timeout: Timeout of each health check
+            keep_alive: How long each backend keeps the model loaded between calls
+        """
+        if not base_urls:
+            raise ValueError("At least one Ollama base URL is required")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown routing strategy: {strategy}")
+        super().__init__(model=model, base_url=base_urls[0], keep_alive=keep_alive)
+        self.backends = [OllamaBackend(model, url.rstrip("/"), keep_alive) for url in base_urls]
+        self.strategy = strategy
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self._health_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        model: str,
+        base_urls: List[str],
+        settings: Dict[str, Any],
+        keep_alive: Optional[Union[str, int]] = None,
+    ) -> "OllamaPool":
+        """Create a pool from the [llm.pool] configuration."""
+        return cls(
+            model=model,
+            base_urls=base_urls,
+            strategy=settings.get("strategy", "least_outstanding"),
+            failure_threshold=int(settings.get("failure_threshold", 3)),
+            cooldown=float(settings.get("cooldown", 30)),
+            health_interval=float(settings.get("health_interval", 15)),
+            health_timeout=float(settings.get("health_timeout", 2)),
+            keep_alive=keep_alive,
+        )
+
+    def select(self, exclude: Optional[List[OllamaBackend]] = None) -> OllamaBackend:
+        """
+        Pick the backend for the next call.
+
+        Args:
+            exclude: Backends already tried for this call
+
+        Returns:
+            The available backend with the lowest routing cost
+
+        Raises:
+            NoBackendAvailableError: If every backend is ejected or excluded
+        """
+        now = time.monotonic()
+        candidates = [
+            backend for backend in self.backends
+            if backend.available(now, self.cooldown) and not (exclude and backend in exclude)
+        ]
+        if not candidates:
+            raise NoBackendAvailableError("No Ollama backend is available")
+        return min(candidates, key=lambda backend: backend.score(self.strategy))
+
+    async def invoke(self, prompt: str) -> str:
+        """Invoke the model on the least loaded backend, failing over on errors"""
+        tried: List[OllamaBackend] = []
+        while True:
+            backend = self.select(tried)
+            tried.append(backend)
+            start = self._begin(backend)
+            try:
+                result = await backend.client.invoke(prompt)
+            except Exception:
+                self._end(backend, start, ok=False)
+                if len(tried) == len(self.backends):
+                    raise
+                continue
+            self._end(backend, start, ok=True)
+            return result
+
+    def astream(self, prompt: str, options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Stream a generate call from the least loaded backend"""
+        return self._failover_stream(lambda client: client.astream(prompt, options=options))
+
+    def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a chat call from the least loaded backend"""
+        return self._failover_stream(
+            lambda client: client.astream_chat(messages, options=options, response_format=response_format)
+        )
+
+    async def _failover_stream(
+        self, call: Callable[[OllamaClient], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """
+        Stream a call's output from the least loaded backend.
+
+        A call that fails before producing any output is retried on another
+        backend; once output has been yielded, errors are raised to the caller.
+        """
+        tried: List[OllamaBackend] = []
+        while True:
+            backend = self.select(tried)
+            tried.append(backend)
+            start = self._begin(backend)
+            produced = False
+            # Stays None when the consumer stops early or is cancelled (GeneratorExit,
+            # CancelledError), which is not the backend's fault
+            ok: Optional[bool] = None
+            try:
+                async for chunk in call(backend.client):
+                    produced = True
+                    yield chunk
+                ok = True
+            except Exception:
+                # Also a failure after output was produced, so a backend that keeps
+                # breaking mid-stream is ejected
+                ok = False
+                if produced or len(tried) == len(self.backends):
+                    raise
+                logger.warning(f"Retrying model call on another backend after {backend.base_url} failed")
+            finally:
+                self._end(backend, start, ok=ok)
+            if ok:
+                return
+
+    def start_health_checks(self) -> None:
+        """Start probing the backends in the background."""
+        if self.health_interval > 0 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop_health_checks(self) -> None:
+        """Stop the background health checks."""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def check_health(self) -> None:
+        """Probe every backend once and update its circuit breaker."""
+        await asyncio.gather(*(self._probe(backend) for backend in self.backends))
+
+    async def _health_loop(self) -> None:
+        while True:
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.warning(f"Ollama health check failed: {str(e)}")
+            await asyncio.sleep(self.health_interval)
+
+    async def _probe(self, backend: OllamaBackend) -> None:
+        """Check that a backend answers its version endpoint."""
+        try:
+            response = await self.client.get(f"{backend.base_url}/api/version", timeout=self.health_timeout)
+            healthy = response.status_code == 200
+        except Exception:
+            healthy = False
+        if healthy:
+            if backend.state != CLOSED:
+                backend.record_success()
+        else:
+            backend.record_failure(self.failure_threshold)
+
+    def _begin(self, backend: OllamaBackend) -> float:
+        backend.outstanding += 1
+        backend._report()
+        return time.perf_counter()
+
+    def _end(self, backend: OllamaBackend, start: float, ok: Optional[bool]) -> None:
+        """Finish a call; ``ok`` is None for calls abandoned by the caller."""
+        backend.outstanding -= 1
+        if ok is None:
+            backend._report()
+            _requests.inc(backend=backend.base_url, outcome="abandoned")
+            return
+        if ok:
+            backend.record_success(time.perf_counter() - start)
+        else:
+            backend.record_failure(self.failure_threshold)
+        _requests.inc(backend=backend.base_url, outcome="success" if ok else "failure")
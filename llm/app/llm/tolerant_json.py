@@ -0,0 +1,283 @@
+"""
+Tolerant JSON parsing for LLM output.
+
+Models asked for JSON often return something close to it: prose around the
+object, trailing commas, missing commas between objects, stray closing brackets
+or output cut off at the token limit. parse_json_tolerant reads such text in a
+single linear pass, repairing these defects as it goes and recording what it
+repaired, and returns everything it could read; a truncated story still yields
+the scenes that were written in full. Parse time and outcomes are exported as
+metrics so the repair rate of a model or prompt can be tracked.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.core.metrics import get_metrics
+
+_metrics = get_metrics()
+_parse_seconds = _metrics.histogram(
+    "llm_json_parse_seconds", "Time spent parsing LLM JSON output",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1),
+)
+_parses = _metrics.counter("llm_json_parse_total", "LLM JSON parses by outcome (clean, repaired or failed)")
+_repairs = _metrics.counter("llm_json_repairs_total", "Defects repaired in LLM JSON output, by kind")
+
+_PLAIN_STRING = re.compile(r'[^"\\]*')
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_BARE_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_WHITESPACE = re.compile(r"\s*")
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS = {"true": True, "false": False, "null": None}
+_MAX_DEPTH = 64
+
+
+@dataclass
+class TolerantParseResult:
+    """Outcome of a tolerant parse."""
+
+    value: Any
+    repairs: List[str] = field(default_factory=list)
+    truncated: bool = False
+    # Keys and indices leading to the value the text ended in, e.g.
+    # ("scenes", 1, "story_text") when cut off inside the second scene's text;
+    # a path ending at a container means the cut fell between its members
+    truncated_at: Optional[Tuple[Union[str, int], ...]] = None
+
+    @property
+    def clean(self) -> bool:
+        """Whether the text was valid JSON that needed no repair."""
+        return not self.repairs and not self.truncated
+
+
+class _TolerantParser:
+    """Recursive-descent JSON reader that repairs common LLM defects."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.repairs: List[str] = []
+        self.truncated = False
+        self.truncated_at: Optional[Tuple[Union[str, int], ...]] = None
+        self._path: List[Union[str, int]] = []
+
+    def parse(self) -> TolerantParseResult:
+        starts = [index for index in (self.text.find("{"), self.text.find("[")) if index >= 0]
+        if not starts:
+            raise ValueError("No JSON object found in text")
+        self.pos = min(starts)
+        if self.text[:self.pos].strip():
+            self._repair("leading_text")
+
+        value = self._value(0)
+        if not self.truncated and self.text[self.pos:].strip():
+            self._repair("trailing_text")
+        return TolerantParseResult(value, self.repairs, self.truncated, self.truncated_at)
+
+    def _repair(self, kind: str) -> None:
+        self.repairs.append(kind)
+
+    def _truncate(self) -> None:
+        """Record that the text ended at the current position."""
+        if not self.truncated:
+            self.truncated = True
+            self.truncated_at = tuple(self._path)
+
+    def _skip_whitespace(self) -> bool:
+        """Skip whitespace; returns False (and marks truncation) at the end of the text."""
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        if self.pos >= len(self.text):
+            self._truncate()
+            return False
+        return True
+
+    def _value(self, depth: int) -> Any:
+        if depth > _MAX_DEPTH:
+            raise ValueError("JSON nested too deeply")
+        if not self._skip_whitespace():
+            return None
+        char = self.text[self.pos]
+        if char == "{":
+            return self._object(depth + 1)
+        if char == "[":
+            return self._array(depth + 1)
+        if char == '"':
+            return self._string()
+        number = _NUMBER.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            literal = number.group()
+            return float(literal) if any(c in literal for c in ".eE") else int(literal)
+        for literal, value in _LITERALS.items():
+            if self.text.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+            if self.pos + len(literal) > len(self.text) and literal.startswith(self.text[self.pos:]):
+                # Literal cut off by the end of the output
+                self.pos = len(self.text)
+                self._truncate()
+                return value
+        raise ValueError(f"Unexpected character {char!r} at position {self.pos}")
+
+    def _object(self, depth: int) -> Dict[str, Any]:
+        self.pos += 1  # {
+        result: Dict[str, Any] = {}
+        need_separator = False
+        after_comma = False
+        while self._skip_whitespace():
+            char = self.text[self.pos]
+            if char == "}":
+                self.pos += 1
+                if after_comma:
+                    self._repair("trailing_comma")
+                return result
+            if char == "]":
+                # Closing bracket of the enclosing array; the object was never closed
+                self._repair("unclosed_object")
+                return result
+            if char == ",":
+                self.pos += 1
+                if not need_separator:
+                    self._repair("extra_comma")
+                need_separator = False
+                after_comma = True
+                continue
+            if need_separator:
+                self._repair("missing_comma")
+
+            if char == '"':
+                key = self._string()
+            else:
+                bare = _BARE_KEY.match(self.text, self.pos)
+                if not bare:
+                    raise ValueError(f"Unexpected character {char!r} at position {self.pos}")
+                self._repair("unquoted_key")
+                key = bare.group()
+                self.pos = bare.end()
+            if self.truncated or not self._skip_whitespace():
+                # A key without a value is dropped
+                return result
+            if self.text[self.pos] == ":":
+                self.pos += 1
+            else:
+                self._repair("missing_colon")
+            if not self._skip_whitespace():
+                return result
+            self._path.append(key)
+            try:
+                result[key] = self._value(depth)
+            finally:
+                self._path.pop()
+            if self.truncated:
+                return result
+            need_separator = True
+            after_comma = False
+        return result
+
+    def _array(self, depth: int) -> List[Any]:
+        self.pos += 1  # [
+        result: List[Any] = []
+        need_separator = False
+        after_comma = False
+        while self._skip_whitespace():
+            char = self.text[self.pos]
+            if char == "]":
+                self.pos += 1
+                if after_comma:
+                    self._repair("trailing_comma")
+                return result
+            if char == "}":
+                # Stray closing brace (e.g. "}}]")
+                self.pos += 1
+                self._repair("stray_brace")
+                continue
+            if char == ",":
+                self.pos += 1
+                if not need_separator:
+                    self._repair("extra_comma")
+                need_separator = False
+                after_comma = True
+                continue
+            if need_separator:
+                self._repair("missing_comma")
+            self._path.append(len(result))
+            try:
+                result.append(self._value(depth))
+            finally:
+                self._path.pop()
+            if self.truncated:
+                return result
+            need_separator = True
+            after_comma = False
+        return result
+
+    def _string(self) -> str:
+        self.pos += 1  # opening quote
+        parts: List[str] = []
+        text = self.text
+        while True:
+            run = _PLAIN_STRING.match(text, self.pos)
+            parts.append(run.group())
+            self.pos = run.end()
+            if self.pos >= len(text):
+                self._truncate()
+                return "".join(parts)
+            if text[self.pos] == '"':
+                self.pos += 1
+                return "".join(parts)
+            # Backslash escape
+            escape = text[self.pos + 1:self.pos + 2]
+            if not escape:
+                self.pos = len(text)
+                self._truncate()
+                return "".join(parts)
+            if escape == "u":
+                digits = text[self.pos + 2:self.pos + 6]
+                try:
+                    parts.append(chr(int(digits, 16)))
+                    self.pos += 6
+                    continue
+                except ValueError:
+                    if len(digits) < 4 and self.pos + 2 + len(digits) >= len(text):
+                        self.pos = len(text)
+                        self._truncate()
+                        return "".join(parts)
+            if escape in _ESCAPES:
+                parts.append(_ESCAPES[escape])
+            else:
+                self._repair("invalid_escape")
+                parts.append(escape)
+            self.pos += 2
+
+
+def parse_json_tolerant(text: str) -> TolerantParseResult:
+    """
+    Parse JSON from LLM output, repairing common defects.
+
+    Args:
+        text: Model output containing a JSON object or array
+
+    Returns:
+        The parsed value with the list of repairs applied and whether the
+        output was truncated
+
+    Raises:
+        ValueError: If the text contains no JSON or cannot be repaired
+    """
+    start = time.perf_counter()
+    try:
+        result = _TolerantParser(text).parse()
+    except ValueError:
+        _parses.inc(outcome="failed")
+        raise
+    finally:
+        _parse_seconds.observe(time.perf_counter() - start)
+
+    _parses.inc(outcome="clean" if result.clean else "repaired")
+    for kind in result.repairs:
+        _repairs.inc(kind=kind)
+    if result.truncated:
+        _repairs.inc(kind="truncated")
+    return result
@@ -10,12 +10,32 @@ from typing import Optional
 from datetime import datetime
 
 from loguru import logger
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, HttpUrl
 
+from app.core.blobs import BlobNotFoundError, get_blob_store
 from app.core.config import get_config
 from app.core.discovery import get_registry
+from app.core.executor import shutdown_executors
+from app.core.http import close_http_clients
+from app.core.jobs import (
+    CallbackURLError,
+    JobManagerStoppedError,
+    JobQueueFullError,
+    get_job_manager,
+)
+from app.core.metrics import get_metrics
+from app.core.profiling import get_startup_profiler, log_startup_report
+from app.core.prompts import get_prompt_registry
+from app.core.responses import (
+    DefaultJSONResponse,
+    caching_headers,
+    dumps_json,
+    make_etag,
+    not_modified,
+)
 
 
 # Request model for the generate-story endpoint
@@ -23,6 +43,35 @@ class GenerateStoryRequest(BaseModel):
     """Request model for story generation"""
     username: str
     prompt: str
+    temperature: Optional[float] = None
+
+
+# Request model for the jobs endpoint
+class StoryJobRequest(GenerateStoryRequest):
+    """Request model for a background story generation job"""
+    callback_url: Optional[HttpUrl] = None
+
+
+def build_tool_request(request: GenerateStoryRequest):
+    """
+    Build a GenerateStoryTool request with the default story settings.
+
+    Args:
+        request: The incoming generate-story request
+
+    Returns:
+        The tool request with age_group=3, scene_count=5 and genre=kids
+    """
+    from tools.generate_story.schemas import GenerateStoryRequest as ToolRequest
+
+    return ToolRequest(
+        username=request.username,
+        prompt=request.prompt,
+        age_group="3",  # Default to age group 3
+        scene_count=5,  # Default to 5 scenes
+        genre="kids",   # Default to kids genre
+        temperature=request.temperature
+    )
 
 
 @asynccontextmanager
@@ -32,6 +81,8 @@ async def lifespan(app: FastAPI):
 
     This function handles initialization and cleanup of application resources.
     """
+    profiler = get_startup_profiler()
+    profiler.start()
     try:
         # Initialize components
         logger.info("Starting application")
@@ -40,10 +91,12 @@ async def lifespan(app: FastAPI):
         config = get_config()
         if config.get("llm.enabled", False):
             try:
-                from app.llm.manager import ModelManager
+                with profiler.phase("llm_init"):
+                    from app.llm.manager import ModelManager
 
-                logger.info("Initializing ModelManager")
-                ModelManager.initialize()
+                    logger.info("Initializing ModelManager")
+                    ModelManager.initialize()
+                    ModelManager.start_health_checks()
                 logger.info("ModelManager initialized successfully")
             except ImportError:
                 logger.error(
@@ -54,8 +107,23 @@ async def lifespan(app: FastAPI):
         # Discover and register tools
         registry = get_registry()
         logger.info("Discovering tools...")
-        registry.discover_tools()
-        registry.register_routes(app)
+        with profiler.phase("tool_discovery"):
+            registry.discover_tools()
+        if config.get("tools.preload", False):
+            # Trade a slower start for no import delay on the first calls
+            with profiler.phase("tool_preload"):
+                registry.instantiate_tools()
+        with profiler.phase("route_registration"):
+            registry.register_routes(app)
+
+        # Reload edited prompt templates without a restart
+        get_prompt_registry().start_watching()
+
+        # Start the background job workers
+        get_job_manager().start()
+
+        profiler.finish()
+        log_startup_report(profiler)
 
         yield
     except Exception as e:
@@ -64,16 +132,26 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup resources
         logger.info("Shutting down application")
+        await get_job_manager().stop()
+        await get_prompt_registry().stop_watching()
+
         if config.get("llm.enabled", False):
             try:
                 from app.llm.manager import ModelManager
 
                 logger.info("Cleaning up ModelManager")
+                await ModelManager.stop_health_checks()
                 ModelManager.clear()
             except ImportError:
                 # Already logged the error during initialization
                 pass
 
+        # Close pooled outbound HTTP connections
+        await close_http_clients()
+
+        # Stop the CPU-bound work pools
+        shutdown_executors()
+
 
 def create_app() -> FastAPI:
     """
@@ -105,6 +183,7 @@ def create_app() -> FastAPI:
         ),
         version=app_config.get("app.version", "0.1.0"),
         lifespan=lifespan,
+        default_response_class=DefaultJSONResponse,
     )
 
     # Configure CORS
@@ -138,6 +217,37 @@ def create_app() -> FastAPI:
             "description": app_config.get("app.description"),
         }
 
+    # Add metrics endpoint
+    @app.get("/metrics", tags=["status"], dependencies=auth_dependencies)
+    async def metrics(format: str = "json"):
+        """
+        Return in-process metrics (cache hit rates, queue depths, latencies).
+        Pass ``format=prometheus`` for the Prometheus text exposition format.
+        """
+        registry = get_metrics()
+        if format == "prometheus":
+            return PlainTextResponse(registry.render_prometheus(), media_type="text/plain; version=0.0.4")
+        return registry.snapshot()
+
+    # Add image endpoint for content-addressed scene images. Image URLs are
+    # unguessable content hashes, so they are served without authentication
+    # to keep them usable from plain <img> tags.
+    @app.get("/images/{digest}", tags=["story-generation"])
+    async def get_image(digest: str, request: Request):
+        """
+        Serve a generated scene image by its content hash.
+        """
+        try:
+            path, content_type = get_blob_store().locate(digest)
+        except BlobNotFoundError:
+            raise HTTPException(status_code=404, detail="Image not found")
+
+        etag = make_etag(digest)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+        return FileResponse(path, media_type=content_type, headers=caching_headers(etag))
+
     # Add generate-story endpoint
     @app.post("/generate-story", tags=["story-generation"], dependencies=auth_dependencies)
     async def generate_story(request: GenerateStoryRequest):
@@ -149,29 +259,21 @@ def create_app() -> FastAPI:
             logger.info(f"Generating story for user: {request.username}")
             logger.info(f"Prompt: {request.prompt}")
             
-            # Import the GenerateStoryTool and schemas
-            from tools.generate_story.tool import GenerateStoryTool
-            from tools.generate_story.schemas import GenerateStoryRequest as ToolRequest, Story
-            
-            # Create tool instance
-            tool = GenerateStoryTool()
+            # Reuse the tool instance created at startup
+            tool = get_registry().get_tool("generate_story")
             
             # Create tool request with default values
-            tool_request = ToolRequest(
-                username=request.username,
-                prompt=request.prompt,
-                age_group="3",  # Default to age group 3
-                scene_count=5,  # Default to 5 scenes
-                genre="kids"    # Default to kids genre
-            )
+            tool_request = build_tool_request(request)
             
             # Generate the story
             story_data = await tool.execute(tool_request)
             
-            # Return the response in the expected format
-            return {
+            # Return the response in the expected format. Returning the response
+            # directly skips FastAPI's jsonable_encoder pass, so the story is
+            # serialized exactly once.
+            return DefaultJSONResponse({
                 "success": True,
-                "data": story_data,
+                "data": story_data.model_dump(),
                 "metadata": {
                     "generated_at": datetime.now().isoformat(),
                     "user": request.username,
@@ -179,12 +281,87 @@ def create_app() -> FastAPI:
                     "age_group": "3",
                     "scene_count": 5
                 }
-            }
+            })
             
+        except HTTPException:
+            # Keep status codes chosen by the tool (e.g. 429 when overloaded)
+            raise
         except Exception as e:
             logger.error(f"Error generating story: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to generate story: {str(e)}")
 
+    # Add streaming generate-story endpoint
+    @app.post("/generate-story/stream", tags=["story-generation"], dependencies=auth_dependencies)
+    async def generate_story_stream(request: GenerateStoryRequest):
+        """
+        Generate a story and stream it as newline-delimited JSON events.
+
+        Emits the title first, then each scene's text, then each scene's image as it
+        becomes ready, followed by a final ``done`` (or ``error``) event.
+        """
+        logger.info(f"Streaming story for user: {request.username}")
+
+        tool = get_registry().get_tool("generate_story")
+        tool_request = build_tool_request(request)
+
+        async def event_lines():
+            async for event in tool.stream(tool_request):
+                yield dumps_json(event) + b"\n"
+
+        return StreamingResponse(
+            event_lines(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    # Add background job endpoints for story generation
+    @app.post("/jobs", tags=["jobs"], status_code=202, dependencies=auth_dependencies)
+    async def create_job(request: StoryJobRequest):
+        """
+        Queue a story generation job and return its id immediately.
+
+        Poll ``GET /jobs/{job_id}`` for the result, or pass ``callback_url`` to
+        receive the finished job as a POST.
+        """
+        tool = get_registry().get_tool("generate_story")
+        tool_request = build_tool_request(request)
+
+        async def generate():
+            from app.llm.limiter import job_calls
+
+            # Queued jobs wait their turn for the model instead of timing out
+            with job_calls():
+                story = await tool.execute(tool_request)
+            return story.model_dump()
+
+        callback_url = str(request.callback_url) if request.callback_url else None
+        if callback_url:
+            try:
+                await get_job_manager().validate_callback_url(callback_url)
+            except CallbackURLError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        try:
+            job = get_job_manager().submit("generate_story", generate, callback_url)
+        except JobQueueFullError as e:
+            raise HTTPException(
+                status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+            )
+        except JobManagerStoppedError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+
+        logger.info(f"Queued story job {job.id} for user: {request.username}")
+        return {**job.to_dict(), "status_url": f"/jobs/{job.id}"}
+
+    @app.get("/jobs/{job_id}", tags=["jobs"], dependencies=auth_dependencies)
+    async def get_job(job_id: str):
+        """
+        Get the status of a job, including its result once it has finished.
+        """
+        job = get_job_manager().get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job.to_dict()
+
     return app
 
 
@@ -0,0 +1,131 @@
+"""
+Startup profiling script.
+
+Boots the application (imports plus the FastAPI lifespan) in a fresh interpreter
+started with ``python -X importtime``, prints where the time went and checks it
+against the [startup] budgets in config.toml. Exits with status 1 when a budget
+is exceeded, so it can guard cold-start time in CI.
+
+Usage:
+    python scripts/profile_startup.py [--json] [--top N]
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path using the script's location
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import get_config
+from app.core.profiling import check_budget, parse_importtime, summarize_imports
+
+# Prefix of the line carrying the child's phase report
+REPORT_MARKER = "STARTUP_REPORT "
+
+
+def boot() -> None:
+    """Import the app and run its startup and shutdown; runs in the child process."""
+    from app.core.profiling import get_startup_profiler
+
+    start = time.perf_counter()
+    from app.main import app
+
+    import_seconds = time.perf_counter() - start
+
+    ready_seconds = 0.0
+
+    async def run_lifespan():
+        nonlocal ready_seconds
+        async with app.router.lifespan_context(app):
+            ready_seconds = time.perf_counter() - start
+
+    asyncio.run(run_lifespan())
+    report = get_startup_profiler().report()
+    report["app_import_seconds"] = round(import_seconds, 4)
+    # Wall time from importing the app until it is ready to serve
+    report["total_seconds"] = round(ready_seconds, 4)
+    print(REPORT_MARKER + json.dumps(report), flush=True)
+
+
+def profile(top: int) -> dict:
+    """
+    Boot the app in a child interpreter and collect its startup report.
+
+    Args:
+        top: Number of modules and packages to list
+
+    Returns:
+        Report with import times, lifespan phases and total startup time
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), "--child"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    lines = [line for line in result.stdout.splitlines() if line.startswith(REPORT_MARKER)]
+    if result.returncode != 0 or not lines:
+        sys.stderr.write(result.stderr[-4000:])
+        raise RuntimeError(f"Application failed to start (exit status {result.returncode})")
+
+    report = json.loads(lines[-1][len(REPORT_MARKER):])
+    report["imports"] = summarize_imports(parse_importtime(result.stderr), top=top)
+    return report
+
+
+def print_report(report: dict) -> None:
+    """Print a startup report as text."""
+    imports = report["imports"]
+    print(f"Total:    {report['total_seconds']:.3f}s (until ready to serve)")
+    print(f"Imports:  {imports['total_seconds']:.3f}s")
+    print(f"Lifespan: {report['startup_seconds']:.3f}s (includes imports made during startup)")
+
+    print("\nSlowest modules (cumulative):")
+    for module, seconds in imports["modules"].items():
+        print(f"  {seconds:8.3f}s  {module}")
+
+    print("\nTime by package (own modules):")
+    for package, seconds in imports["packages"].items():
+        print(f"  {seconds:8.3f}s  {package}")
+
+    print("\nLifespan phases:")
+    for phase, seconds in report["phases"].items():
+        print(f"  {seconds:8.3f}s  {phase}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile application startup time")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--top", type=int, default=15, help="Number of modules and packages to list")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        boot()
+        return 0
+
+    report = profile(args.top)
+    violations = check_budget(report, get_config().get("startup", {}) or {})
+    report["violations"] = violations
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        print()
+        for violation in violations:
+            print(f"Budget exceeded: {violation}")
+        if not violations:
+            print("Startup is within budget.")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
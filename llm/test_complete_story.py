@@ -4,7 +4,6 @@ Test script for complete story generation with images
 """
 
 import asyncio
-import json
 from tools.generate_story.tool import GenerateStoryTool
 from tools.generate_story.schemas import GenerateStoryRequest
 
@@ -38,40 +37,27 @@ async def test_complete_story():
         # Execute the tool
         result = await tool.execute(request)
         
-        if result and hasattr(result, 'result'):
+        if result and result.scenes:
             print("✅ Story generation successful!")
+            print(f"Story title: {result.title}")
+            print(f"Story theme: {result.theme or 'Unknown'}")
+            print(f"Number of scenes: {len(result.scenes)}")
             
-            # Parse the result
-            try:
-                story_data = json.loads(result.result)
-                print(f"Story title: {story_data.get('title', 'Unknown')}")
-                print(f"Story theme: {story_data.get('theme', 'Unknown')}")
+            for scene in result.scenes:
+                image = scene.image_url or scene.image
                 
-                scenes = story_data.get('scenes', [])
-                print(f"Number of scenes: {len(scenes)}")
+                print(f"  Scene {scene.scene_number}:")
+                print(f"    Text: {scene.story_text[:50]}...")
+                print(f"    Has image: {'✅' if image else '❌'}")
                 
-                for i, scene in enumerate(scenes, 1):
-                    scene_num = scene.get('scene_number', i)
-                    story_text = scene.get('story_text', 'No description')
-                    has_image = 'image' in scene and scene['image']
-                    
-                    print(f"  Scene {scene_num}:")
-                    print(f"    Text: {story_text[:50]}...")
-                    print(f"    Has image: {'✅' if has_image else '❌'}")
-                    
-                    if has_image:
-                        image_data = scene['image']
-                        if image_data.startswith('data:image/png;base64,'):
-                            print(f"    Image format: ✅ Valid base64")
-                            print(f"    Image size: {len(image_data)} characters")
-                        else:
-                            print(f"    Image format: ❌ Invalid format")
-                
-                print("\n🎉 Complete story generation test successful!")
-                
-            except json.JSONDecodeError as e:
-                print(f"❌ Failed to parse story JSON: {e}")
-                print(f"Raw result: {result.result[:200]}...")
+                if image:
+                    if image.startswith('data:image/png;base64,') or image.startswith('/images/'):
+                        print(f"    Image format: ✅ Valid image reference")
+                        print(f"    Image size: {len(image)} characters")
+                    else:
+                        print(f"    Image format: ❌ Invalid format")
+            
+            print("\n🎉 Complete story generation test successful!")
         else:
             print("❌ Story generation failed - no result returned")
             
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded CPU work executors
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_executor_backpressure():
+    """Work beyond max_workers + max_queue is rejected, and queue depth is reported"""
+    from app.core.executor import BoundedExecutor, ExecutorOverloadedError
+
+    executor = BoundedExecutor("test", max_workers=2, max_queue=1)
+    try:
+        tasks = [asyncio.create_task(executor.run(time.sleep, 0.3)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert executor.queue_depth == 1
+
+        try:
+            await executor.run(time.sleep, 0)
+            raise AssertionError("Expected the executor to reject the fourth task")
+        except ExecutorOverloadedError:
+            pass
+
+        await asyncio.gather(*tasks)
+        assert executor.queue_depth == 0
+        assert await executor.run(sum, [1, 2, 3]) == 6
+    finally:
+        executor.shutdown()
+    print("✅ Executor back-pressure test passed!")
+
+
+async def test_cancelled_tasks_hold_their_slot():
+    """A cancelled caller's running task keeps its slot until the task finishes"""
+    from app.core.executor import BoundedExecutor, ExecutorOverloadedError
+
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+    try:
+        waiter = asyncio.create_task(executor.run(time.sleep, 0.3))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        try:
+            await executor.run(time.sleep, 0)
+            raise AssertionError("Admitted work while the worker was still busy")
+        except ExecutorOverloadedError:
+            pass
+
+        await asyncio.sleep(0.35)
+        assert await executor.run(sum, [1, 2]) == 3
+    finally:
+        executor.shutdown()
+    print("✅ Executor cancellation test passed!")
+
+
+async def test_image_overload_fails_the_story():
+    """Executor overload during image rendering is surfaced as a 429"""
+    from fastapi import HTTPException
+
+    from app.core.executor import ExecutorOverloadedError
+    from tools.generate_story import tool as tool_module
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    async def overloaded(prompt, style="animated"):
+        raise ExecutorOverloadedError("Executor images is overloaded")
+
+    async def fake_llm_text(input_data):
+        yield '{"title": "Busy", "scenes": [{"scene_number": 1, "story_text": "A busy day"}]}'
+
+    original = tool_module.image_generator.generate_image
+    tool_module.image_generator.generate_image = overloaded
+    try:
+        tool = GenerateStoryTool()
+        tool.image_settings["delivery"] = "inline"
+        tool._iter_llm_text = fake_llm_text
+        request = GenerateStoryRequest(username="TestUser", prompt="busy", scene_count=5)
+        try:
+            await tool.execute(request)
+            raise AssertionError("Overload was not surfaced")
+        except HTTPException as e:
+            assert e.status_code == 429 and "Retry-After" in e.headers
+
+        events = [event async for event in tool.stream(request)]
+        assert events[-1]["event"] == "error" and "retry_after" in events[-1]
+    finally:
+        tool_module.image_generator.generate_image = original
+    print("✅ Image overload test passed!")
+
+
+async def test_mock_rendering_keeps_event_loop_free():
+    """Mock renders run off the event loop so other coroutines keep running"""
+    from tools.generate_story.image_generator import ImageGenerator
+
+    generator = ImageGenerator()
+    generator.api_key = None
+    generator.stability_api_key = None
+    generator.cache = None
+
+    ticks = 0
+    rendering = True
+
+    async def ticker():
+        nonlocal ticks
+        while rendering:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    images = await asyncio.gather(*(
+        generator.generate_image(f"a friendly robot {i}", "kids") for i in range(8)
+    ))
+    rendering = False
+    await ticker_task
+
+    assert all(image.startswith("data:image/png;base64,") for image in images)
+    assert ticks > 1
+    print(f"✅ Event loop stayed responsive during rendering ({ticks} ticks)")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_executor_backpressure())
+    asyncio.run(test_cancelled_tasks_hold_their_slot())
+    asyncio.run(test_image_overload_fails_the_story())
+    asyncio.run(test_mock_rendering_keeps_event_loop_free())
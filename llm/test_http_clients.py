@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled HTTP clients shared per upstream
+"""
+import asyncio
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_client_replaced_on_new_loop_is_closed():
+    """A client from a finished event loop is closed when a new loop replaces it"""
+    from app.core.http import HTTPClientRegistry
+
+    registry = HTTPClientRegistry()
+
+    async def get_client():
+        client = registry.get("ollama")
+        assert registry.get("ollama") is client
+        return client
+
+    first = asyncio.run(get_client())
+
+    async def replace():
+        second = registry.get("ollama")
+        await asyncio.sleep(0)
+        await registry.aclose()
+        return second
+
+    second = asyncio.run(replace())
+    assert second is not first
+    assert first.is_closed and second.is_closed
+    print("✅ HTTP client replacement test passed!")
+
+
+if __name__ == '__main__':
+    test_client_replaced_on_new_loop_is_closed()
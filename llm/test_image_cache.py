@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed scene image cache
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_image_cache_tiers():
+    """Memory LRU, disk persistence and size-bounded disk eviction"""
+    from tools.generate_story.image_cache import ImageCache, make_cache_key
+
+    assert make_cache_key("A  Brave Knight ", "Kids", "mock", "800x600") == \
+        make_cache_key("a brave knight", "kids", "mock", "800x600")
+    assert make_cache_key("a brave knight", "kids", "mock", "800x600") != \
+        make_cache_key("a brave knight", "kids", "dalle", "1024x1024")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ImageCache(directory=directory, memory_max_entries=2, disk_max_bytes=250)
+        for name in ("a", "b", "c"):
+            await cache.put(name * 64, name.encode() * 100)
+
+        # Oldest entry was evicted from memory, and from disk once over 250 bytes
+        assert list(cache._memory) == ["b" * 64, "c" * 64]
+        assert await cache.get("a" * 64) is None
+        assert cache.stats()["disk_bytes"] <= 250
+
+        # A fresh instance finds surviving entries on disk
+        reopened = ImageCache(directory=directory)
+        assert await reopened.get("c" * 64) == b"c" * 100
+        assert "c" * 64 in reopened._memory
+    print("✅ Image cache tier test passed!")
+
+
+async def test_generator_uses_cache():
+    """Repeated prompts are rendered once"""
+    from tools.generate_story.image_cache import ImageCache
+    from tools.generate_story.image_generator import ImageGenerator
+
+    with tempfile.TemporaryDirectory() as directory:
+        generator = ImageGenerator()
+        generator.api_key = None
+        generator.stability_api_key = None
+        generator.cache = ImageCache(directory=directory)
+
+        renders = 0
+        original = generator._generate_mock_image
+
+        async def counting_mock(prompt, style):
+            nonlocal renders
+            renders += 1
+            return await original(prompt, style)
+
+        generator._generate_mock_image = counting_mock
+        first = await generator.generate_image("A moonlit forest", "kids")
+        second = await generator.generate_image("a moonlit  forest", "kids")
+
+        assert first.startswith("data:image/png;base64,")
+        assert first == second
+        assert renders == 1
+    print("✅ Image generator cache test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_image_cache_tiers())
+    asyncio.run(test_generator_uses_cache())
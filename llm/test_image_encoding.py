@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the configurable image encoding stage
+"""
+import io
+import os
+import sys
+
+from PIL import Image
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_encoding_formats():
+    """Each format round-trips, is detected by signature, and reuses its buffer safely"""
+    from tools.generate_story.encoding import EncodingSettings, encode_image, sniff_mime_type
+    from tools.generate_story.mock_renderer import render_mock_image
+
+    image = render_mock_image("a night with the moon", "kids")
+    baseline = encode_image(image, EncodingSettings())
+
+    for config in (
+        {"format": "png", "quantize": True},
+        {"format": "webp", "quality": 80},
+        {"format": "webp", "lossless": True},
+        {"format": "jpg", "quality": 70},
+    ):
+        settings = EncodingSettings.from_config(config)
+        data = encode_image(image, settings)
+        assert sniff_mime_type(data) == settings.mime_type
+        decoded = Image.open(io.BytesIO(data))
+        assert decoded.size == image.size
+        print(f"  {settings.tag}: {len(data)} bytes")
+
+    # Quantized PNG of the flat-color mock art is smaller than the default PNG
+    quantized = encode_image(image, EncodingSettings(quantize=True))
+    assert len(quantized) < len(baseline)
+
+    # Earlier results are not changed by later encodes into the shared buffer
+    assert encode_image(image, EncodingSettings()) == baseline
+    assert EncodingSettings(quantize=True).tag != EncodingSettings().tag
+    print("✅ Image encoding test passed!")
+
+
+def test_lossless_encodings_preserve_pixels():
+    """PNG, quantized PNG and lossless WebP decode to exactly the rendered pixels"""
+    from tools.generate_story.encoding import EncodingSettings, encode_image
+    from tools.generate_story.mock_renderer import render_mock_image
+
+    image = render_mock_image("a night with the moon", "kids")
+    for settings in (
+        EncodingSettings(),
+        EncodingSettings(quantize=True),
+        EncodingSettings(format="webp", lossless=True, quantize=True),
+    ):
+        decoded = Image.open(io.BytesIO(encode_image(image, settings))).convert("RGB")
+        assert decoded.tobytes() == image.tobytes(), settings.tag
+
+    # An image with more colors than the palette is not quantized
+    gradient = Image.linear_gradient("L").convert("RGB").resize((64, 64))
+    settings = EncodingSettings(quantize=True, colors=16)
+    decoded = Image.open(io.BytesIO(encode_image(gradient, settings))).convert("RGB")
+    assert decoded.tobytes() == gradient.tobytes()
+    print("✅ Lossless image encoding test passed!")
+
+
+if __name__ == '__main__':
+    test_encoding_formats()
+    test_lossless_encodings_preserve_pixels()
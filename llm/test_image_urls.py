@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for serving scene images by URL from the blob store
+"""
+import os
+import sys
+import tempfile
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_image_endpoint():
+    """Images are served with a strong ETag, immutable caching and 304 revalidation"""
+    from fastapi.testclient import TestClient
+
+    from app.core import blobs
+    from app.core.blobs import BlobStore
+    from app.main import create_app
+
+    original = blobs._blob_store
+    blobs._blob_store = BlobStore(tempfile.mkdtemp())
+    try:
+        digest = blobs.get_blob_store().put(b"\x89PNG fake image", "image/png")
+        client = TestClient(create_app())
+
+        response = client.get(f"/images/{digest}")
+        assert response.status_code == 200
+        assert response.content == b"\x89PNG fake image"
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == f'"{digest}"'
+        assert "immutable" in response.headers["cache-control"]
+
+        revalidated = client.get(f"/images/{digest}", headers={"If-None-Match": f'"{digest}"'})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+        assert client.get(f"/images/{'0' * 64}").status_code == 404
+        assert client.get("/images/not-a-hash").status_code == 404
+    finally:
+        blobs._blob_store = original
+    print("✅ Image endpoint test passed!")
+
+
+def test_blob_store_is_size_bounded():
+    """Least recently used blobs are removed once the store exceeds its limit"""
+    from app.core.blobs import BlobNotFoundError, BlobStore
+
+    store = BlobStore(tempfile.mkdtemp(), max_bytes=250)
+    first = store.put(b"a" * 100)
+    time.sleep(0.01)
+    second = store.put(b"b" * 100)
+    time.sleep(0.01)
+    store.locate(first)  # serving a blob counts as a use
+    time.sleep(0.01)
+    third = store.put(b"c" * 100)
+
+    store.locate(first)
+    store.locate(third)
+    try:
+        store.locate(second)
+        raise AssertionError("Least recently used blob was kept")
+    except BlobNotFoundError:
+        pass
+
+    # A fresh store learns the existing size from disk
+    reopened = BlobStore(store.directory, max_bytes=250)
+    reopened.put(b"d" * 100)
+    remaining = [path for path in store.directory.glob("??/*")]
+    assert sum(path.stat().st_size for path in remaining) <= 250
+    print("✅ Blob store size limit test passed!")
+
+
+if __name__ == '__main__':
+    test_image_endpoint()
+    test_blob_store_is_size_bounded()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for background story generation jobs
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def wait_for(manager, job_id, timeout=2.0):
+    """Poll a job until it finishes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.done:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+async def test_job_manager_runs_bounded_jobs():
+    """Jobs run on a fixed number of workers and excess submissions are rejected"""
+    from app.core.jobs import FAILED, SUCCEEDED, JobManager, JobManagerStoppedError, JobQueueFullError
+
+    manager = JobManager(workers=2, max_queue=2, ttl_seconds=0.1)
+    try:
+        manager.submit("test", lambda: asyncio.sleep(0))
+        raise AssertionError("Submitted to a stopped manager")
+    except JobManagerStoppedError:
+        pass
+
+    manager.start()
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def work(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await release.wait()
+            return {"value": value}
+        finally:
+            running -= 1
+
+    jobs = [manager.submit("test", lambda i=i: work(i)) for i in range(2)]
+    await asyncio.sleep(0.01)
+    jobs += [manager.submit("test", lambda i=i: work(i)) for i in range(2, 4)]
+    try:
+        manager.submit("test", lambda: work(99))
+        raise AssertionError("Submitted to a full queue")
+    except JobQueueFullError as e:
+        assert e.retry_after == manager.retry_after
+
+    async def broken():
+        raise RuntimeError("model unavailable")
+
+    release.set()
+    for i, job in enumerate(jobs):
+        finished = await wait_for(manager, job.id)
+        assert finished.status == SUCCEEDED
+        assert finished.to_dict()["result"] == {"value": i}
+    assert peak == 2
+
+    failed = await wait_for(manager, manager.submit("test", broken).id)
+    assert failed.status == FAILED
+    assert failed.error == "model unavailable"
+
+    # Finished jobs expire after the TTL
+    await asyncio.sleep(0.2)
+    assert manager.get(failed.id) is None
+
+    await manager.stop()
+    assert not manager.running
+    print("✅ Job manager test passed!")
+
+
+def test_jobs_endpoints():
+    """POST /jobs queues a story and GET /jobs/{id} reports its result"""
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+    from tools.generate_story.schemas import OutputSchema
+    from tools.generate_story.tool import GenerateStoryTool
+
+    async def fake_execute(self, input_data, token=None):
+        return OutputSchema(title=f"Story of {input_data.prompt}", scenes=[])
+
+    original = GenerateStoryTool.execute
+    GenerateStoryTool.execute = fake_execute
+    try:
+        with TestClient(create_app()) as client:
+            response = client.post("/jobs", json={"username": "TestUser", "prompt": "a fox"})
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            assert response.json()["status_url"] == f"/jobs/{job_id}"
+
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                job = client.get(f"/jobs/{job_id}").json()
+                if job["status"] == "succeeded":
+                    break
+                time.sleep(0.01)
+            assert job["result"]["title"] == "Story of a fox"
+            assert client.get("/jobs/unknown").status_code == 404
+
+            metadata = client.post("/jobs", json={
+                "username": "TestUser", "prompt": "a fox",
+                "callback_url": "http://169.254.169.254/latest/meta-data/",
+            })
+            assert metadata.status_code == 422
+    finally:
+        GenerateStoryTool.execute = original
+    print("✅ Jobs endpoint test passed!")
+
+
+def test_jobs_wait_for_the_model():
+    """Job model calls wait past the interactive max_wait instead of failing"""
+    from fastapi.testclient import TestClient
+
+    from app.llm import limiter as limiter_module
+    from app.llm.limiter import FairLimiter, ModelOverloadedError
+    from app.main import create_app
+    from tools.generate_story.schemas import OutputSchema
+    from tools.generate_story.tool import GenerateStoryTool
+
+    async def slow_execute(self, input_data, token=None):
+        async with limiter_module.get_limiter().slot(input_data.username):
+            await asyncio.sleep(0.2)
+        return OutputSchema(title=f"Story of {input_data.prompt}", scenes=[])
+
+    original_execute = GenerateStoryTool.execute
+    original_limiter = limiter_module._limiter
+    GenerateStoryTool.execute = slow_execute
+    limiter_module._limiter = FairLimiter(max_concurrency=1, max_queue=0, max_wait=0.05)
+    try:
+        with TestClient(create_app()) as client:
+            job_ids = [
+                client.post("/jobs", json={"username": "TestUser", "prompt": prompt}).json()["job_id"]
+                for prompt in ("a fox", "a hen")
+            ]
+            deadline = time.monotonic() + 3.0
+            while time.monotonic() < deadline:
+                jobs = [client.get(f"/jobs/{job_id}").json() for job_id in job_ids]
+                if all(job["status"] in ("succeeded", "failed") for job in jobs):
+                    break
+                time.sleep(0.02)
+            assert [job["status"] for job in jobs] == ["succeeded", "succeeded"], jobs
+
+        # Interactive calls are still shed after max_wait
+        async def interactive():
+            limiter = limiter_module._limiter
+            await limiter.acquire("alice")
+            try:
+                limiter.max_queue = 1
+                await limiter.acquire("bob")
+                raise AssertionError("Interactive call waited beyond max_wait")
+            except ModelOverloadedError:
+                pass
+            finally:
+                limiter.release()
+
+        asyncio.run(interactive())
+    finally:
+        GenerateStoryTool.execute = original_execute
+        limiter_module._limiter = original_limiter
+    print("✅ Job model wait test passed!")
+
+
+async def test_callback_urls_must_be_public():
+    """Callbacks to loopback, private and link-local hosts are refused"""
+    from app.core.jobs import CallbackURLError, JobManager
+
+    manager = JobManager()
+    for url in (
+        "http://127.0.0.1:8000/hook",
+        "http://localhost/hook",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://10.0.0.5/hook",
+        "http://[::1]/hook",
+        "http://[::ffff:192.168.1.1]/hook",
+        "ftp://93.184.216.34/hook",
+    ):
+        try:
+            await manager.validate_callback_url(url)
+            raise AssertionError(f"Accepted callback URL {url}")
+        except CallbackURLError:
+            pass
+    await manager.validate_callback_url("https://93.184.216.34/hook")
+
+    restricted = JobManager(callback_hosts=["hooks.example.com"])
+    try:
+        await restricted.validate_callback_url("https://93.184.216.34/hook")
+        raise AssertionError("Accepted a host outside the allowlist")
+    except CallbackURLError:
+        pass
+
+    await JobManager(allow_private_callbacks=True).validate_callback_url("http://127.0.0.1/hook")
+    print("✅ Callback URL validation test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_job_manager_runs_bounded_jobs())
+    test_jobs_endpoints()
+    test_jobs_wait_for_the_model()
+    asyncio.run(test_callback_urls_must_be_public())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for admission control in front of the model
+"""
+import asyncio
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_limiter_serves_users_round_robin():
+    """Waiting calls are served one user at a time, in rotation"""
+    from app.llm.limiter import FairLimiter
+
+    limiter = FairLimiter(max_concurrency=1, max_queue=10, max_wait=5)
+    order = []
+
+    async def call(username, index):
+        async with limiter.slot(username):
+            order.append(f"{username}{index}")
+            await asyncio.sleep(0.01)
+
+    await limiter.acquire("warmup")
+    tasks = [asyncio.create_task(call("alice", i)) for i in range(3)]
+    tasks += [asyncio.create_task(call("bob", i)) for i in range(2)]
+    await asyncio.sleep(0)
+    assert limiter.queued == 5
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["alice0", "bob0", "alice1", "bob1", "alice2"]
+    assert limiter.active == 0 and limiter.queued == 0
+    print("✅ Fair limiter ordering test passed!")
+
+
+async def test_limiter_sheds_excess_load():
+    """Calls beyond the queue, or waiting too long, are rejected with a retry hint"""
+    from app.llm.limiter import FairLimiter, ModelOverloadedError
+
+    limiter = FairLimiter(max_concurrency=1, max_queue=1, max_wait=0.05)
+    await limiter.acquire("alice")
+
+    waiter = asyncio.create_task(limiter.acquire("bob"))
+    await asyncio.sleep(0)
+    try:
+        await limiter.acquire("carol")
+        raise AssertionError("Admitted a call beyond the queue limit")
+    except ModelOverloadedError as e:
+        assert e.retry_after >= 1
+
+    try:
+        await waiter
+        raise AssertionError("Waited beyond max_wait")
+    except ModelOverloadedError:
+        pass
+    assert limiter.queued == 0
+
+    limiter.release()
+    assert limiter.active == 0
+    print("✅ Fair limiter load shedding test passed!")
+
+
+async def test_overloaded_story_request_returns_429():
+    """An overloaded model turns into 429 instead of a fallback story"""
+    from fastapi import HTTPException
+
+    from app.llm.limiter import ModelOverloadedError
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    async def overloaded_llm(input_data):
+        raise ModelOverloadedError("Model is overloaded", retry_after=7)
+        yield
+
+    tool = GenerateStoryTool()
+    tool._iter_llm_text = overloaded_llm
+    try:
+        await tool.execute(GenerateStoryRequest(username="TestUser", prompt="A shy turtle"))
+        raise AssertionError("Overloaded request did not fail")
+    except HTTPException as e:
+        assert e.status_code == 429
+        assert e.headers["Retry-After"] == "7"
+    print("✅ Overloaded story request test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_limiter_serves_users_round_robin())
+    asyncio.run(test_limiter_sheds_excess_load())
+    asyncio.run(test_overloaded_story_request_returns_429())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the array-based, layer-cached mock image renderer
+"""
+import os
+import random
+import sys
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def render_with_draw_calls(prompt, style, width=800, height=600):
+    """Reference renderer drawing everything line by line with PIL"""
+    from tools.generate_story import mock_renderer
+
+    image = Image.new('RGB', (width, height), color='#1a1a2e')
+    draw = ImageDraw.Draw(image)
+    for y in range(height):
+        progress = y / height
+        draw.line([(0, y), (width, y)], fill=(int(26 + progress * 50), int(26 + progress * 80), int(46 + progress * 100)))
+
+    colors = mock_renderer.COLOR_PALETTES.get(style, mock_renderer.COLOR_PALETTES['kids'])
+    rng = random.Random(hash(prompt) % 1000)
+    for _ in range(20):
+        x = rng.randint(50, width - 50)
+        y = rng.randint(50, height - 50)
+        size = rng.randint(2, 6)
+        color = rng.choice(colors)
+        draw.polygon([
+            (x, y - size), (x + size//2, y - size//2), (x + size, y),
+            (x + size//2, y + size//2), (x, y + size), (x - size//2, y + size//2),
+            (x - size, y), (x - size//2, y - size//2)
+        ], fill=color)
+    template = mock_renderer.scene_template(prompt)
+    if template == 'night':
+        mock_renderer._draw_moon(draw, width, height, colors)
+        for _ in range(30):
+            star_x = rng.randint(50, width - 50)
+            star_y = rng.randint(50, height // 2)
+            size = rng.randint(1, 3)
+            draw.ellipse([star_x - size, star_y - size, star_x + size, star_y + size], fill=colors[4])
+        mock_renderer._draw_clouds(draw, width, height, colors)
+    else:
+        mock_renderer.SCENE_LAYERS[template][0][0](draw, width, height, colors)
+
+    for i in range(3):
+        draw.line([(i, i), (width - i, i)], fill='#FFD700', width=1)
+        draw.line([(i, height - i), (width - i, height - i)], fill='#FFD700', width=1)
+        draw.line([(i, i), (i, height - i)], fill='#FFD700', width=1)
+        draw.line([(width - i, i), (width - i, height - i)], fill='#FFD700', width=1)
+    return image
+
+
+def test_renderer_is_pixel_compatible():
+    """Composing cached layers matches the line-by-line PIL drawing exactly"""
+    from tools.generate_story.mock_renderer import render_mock_image
+
+    prompts = ["a rabbit in a nest", "a brave knight", "a magical forest", "a night with the moon",
+               "stars over the sea", "the ocean", "a friendly robot"]
+    for prompt in prompts:
+        for style in ("kids", "mystery", "adventure", "unknown"):
+            expected = np.array(render_with_draw_calls(prompt, style))
+            actual = np.array(render_mock_image(prompt, style))
+            assert np.array_equal(expected, actual), f"{prompt!r} / {style!r} differs"
+    print("✅ Mock renderer pixel compatibility test passed!")
+
+
+if __name__ == '__main__':
+    test_renderer_is_pixel_compatible()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for story generation through Ollama's chat API
+"""
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_chat_requests_keep_prefix_stable():
+    """Stories are requested with a shared system message and keep_alive"""
+    from app.llm.manager import OllamaClient
+    from tools.generate_story import tool as tool_module
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.path, json.loads(request.content)))
+        lines = [
+            {"message": {"role": "assistant", "content": "Once upon "}, "done": False},
+            {"message": {"role": "assistant", "content": "a time"}, "done": False},
+            {"done": True, "prompt_eval_count": 12, "prompt_eval_duration": 5_000_000},
+        ]
+        return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    class RecordedOllama(OllamaClient):
+        @property
+        def client(self):
+            return http_client
+
+    original_model = tool_module.get_model
+    tool_module.get_model = lambda: RecordedOllama(model="fake", base_url="http://ollama", keep_alive="30m")
+    try:
+        tool = GenerateStoryTool()
+        for prompt in ("A brave fox", "A sleepy owl"):
+            request = GenerateStoryRequest(username="TestUser", prompt=prompt, temperature=0)
+            text = "".join([chunk async for chunk in tool._iter_llm_text(request)])
+            assert text == "Once upon a time"
+    finally:
+        tool_module.get_model = original_model
+        await http_client.aclose()
+
+    (first_path, first), (_, second) = requests
+    assert first_path == "/api/chat"
+    assert first["keep_alive"] == "30m"
+    assert first["options"] == {"temperature": 0}
+    scenes_schema = first["format"]["properties"]["scenes"]
+    assert scenes_schema["minItems"] == scenes_schema["maxItems"] == 5
+    assert scenes_schema["items"]["required"] == ["scene_number", "story_text"]
+    assert "$defs" not in first["format"]
+    assert [message["role"] for message in first["messages"]] == ["system", "user"]
+    assert first["messages"][0] == second["messages"][0]
+    assert "A brave fox" in first["messages"][1]["content"]
+    assert "A sleepy owl" in second["messages"][1]["content"]
+    print("✅ Ollama chat request test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_chat_requests_keep_prefix_stable())
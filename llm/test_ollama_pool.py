@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for load balancing model calls over several Ollama instances
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_pool(urls, **kwargs):
+    """Build a pool whose backends answer with fake clients"""
+    from app.llm.manager import OllamaClient
+    from app.llm.pool import OllamaPool
+
+    calls = {url: 0 for url in urls}
+    broken = set()
+    # Backends that fail after yielding their first chunk
+    truncating = set()
+
+    class FakeClient(OllamaClient):
+        async def astream_chat(self, messages, options=None, response_format=None):
+            async for chunk in self.astream(messages[-1]["content"], options):
+                yield chunk
+
+        async def astream(self, prompt, options=None):
+            calls[self.base_url] += 1
+            if self.base_url in broken:
+                raise RuntimeError("connection refused")
+            await asyncio.sleep(0.05)
+            yield f"{prompt} from {self.base_url}"
+            if self.base_url in truncating:
+                raise RuntimeError("connection reset")
+
+    pool = OllamaPool(model="fake", base_urls=urls, **kwargs)
+    for backend in pool.backends:
+        backend.client = FakeClient(model="fake", base_url=backend.base_url)
+    pool.truncating = truncating
+    return pool, calls, broken
+
+
+async def collect(pool, prompt):
+    return "".join([chunk async for chunk in pool.astream(prompt)])
+
+
+async def test_pool_spreads_calls_over_backends():
+    """Concurrent calls go to the backend with the fewest outstanding requests"""
+    pool, calls, _ = make_pool(["http://a", "http://b", "http://c"])
+
+    results = await asyncio.gather(*(collect(pool, f"story {i}") for i in range(6)))
+    assert all(result.startswith("story") for result in results)
+    assert calls == {"http://a": 2, "http://b": 2, "http://c": 2}
+    assert all(backend.outstanding == 0 for backend in pool.backends)
+    print("✅ Pool routing test passed!")
+
+
+async def test_pool_fails_over_and_ejects_backends():
+    """Failed backends are retried elsewhere, ejected, and trialled after the cooldown"""
+    from app.llm.pool import CLOSED, OPEN, NoBackendAvailableError
+
+    pool, calls, broken = make_pool(["http://a", "http://b"], failure_threshold=2, cooldown=0.1)
+    broken.add("http://a")
+
+    for i in range(3):
+        assert (await collect(pool, f"story {i}")).endswith("http://b")
+    a, b = pool.backends
+    assert a.state == OPEN
+    assert calls["http://a"] == 2  # not called again once ejected
+
+    broken.add("http://b")
+    try:
+        await collect(pool, "story")
+        raise AssertionError("Call succeeded with every backend failing")
+    except (RuntimeError, NoBackendAvailableError):
+        pass
+
+    # After the cooldown a single trial call closes the breaker again
+    broken.clear()
+    await asyncio.sleep(0.15)
+    assert (await collect(pool, "story")).startswith("story")
+    await asyncio.gather(*(collect(pool, "story") for _ in range(2)))
+    assert a.state == CLOSED
+    print("✅ Pool failover test passed!")
+
+
+async def test_pool_ejects_backends_failing_mid_stream():
+    """Errors after the first chunk count as failures; abandoned streams do not"""
+    from app.llm.pool import CLOSED, OPEN
+
+    pool, calls, _ = make_pool(["http://a"], failure_threshold=2, cooldown=60)
+    backend = pool.backends[0]
+
+    # The consumer stopping early is neutral
+    stream = pool.astream("story")
+    assert (await stream.__anext__()).startswith("story")
+    await stream.aclose()
+    assert backend.state == CLOSED and backend.failures == 0 and backend.latency is None
+    assert backend.outstanding == 0
+
+    pool.truncating.add("http://a")
+    for _ in range(2):
+        chunks = []
+        try:
+            async for chunk in pool.astream("story"):
+                chunks.append(chunk)
+            raise AssertionError("Mid-stream failure was not raised")
+        except RuntimeError:
+            pass
+        assert len(chunks) == 1
+    assert backend.state == OPEN
+    assert backend.latency is None
+    print("✅ Pool mid-stream failure test passed!")
+
+
+async def test_pool_health_checks():
+    """Health checks eject unreachable backends and restore recovered ones"""
+    from app.llm.pool import CLOSED, OPEN, OllamaPool
+
+    down = {"b"}
+
+    def handler(request):
+        if request.url.host in down:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, json={"version": "0.1.0"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    class CheckedPool(OllamaPool):
+        @property
+        def client(self):
+            return client
+
+    pool = CheckedPool(model="fake", base_urls=["http://a", "http://b"], failure_threshold=1)
+    await pool.check_health()
+    assert [backend.state for backend in pool.backends] == [CLOSED, OPEN]
+    assert pool.select().base_url == "http://a"
+
+    down.clear()
+    await pool.check_health()
+    assert [backend.state for backend in pool.backends] == [CLOSED, CLOSED]
+    await client.aclose()
+    print("✅ Pool health check test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_pool_spreads_calls_over_backends())
+    asyncio.run(test_pool_fails_over_and_ejects_backends())
+    asyncio.run(test_pool_ejects_backends_failing_mid_stream())
+    asyncio.run(test_pool_health_checks())
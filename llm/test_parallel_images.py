@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent per-scene image generation
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_parallel_images():
+    """Scene images render concurrently, bounded, and tolerate per-scene failures"""
+    from tools.generate_story import tool as tool_module
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_generate_image(prompt: str, style: str = "animated"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            if "broken" in prompt:
+                raise RuntimeError("provider error")
+            if "slow" in prompt:
+                await asyncio.sleep(5)
+            await asyncio.sleep(0.2)
+            return f"image:{prompt}"
+        finally:
+            in_flight -= 1
+
+    original = tool_module.image_generator.generate_image
+    tool_module.image_generator.generate_image = fake_generate_image
+    try:
+        tool = GenerateStoryTool()
+        tool.image_settings = {"max_concurrency": 3, "scene_timeout": 1.0, "delivery": "inline"}
+
+        scenes = [{"scene_number": i, "story_text": f"scene {i}"} for i in range(1, 6)]
+        scenes[1]["story_text"] = "broken scene"
+        scenes[3]["story_text"] = "slow scene"
+        text = json.dumps({"title": "Scenes", "theme": "kids", "scenes": scenes})
+
+        async def fake_llm_text(input_data):
+            yield text
+
+        tool._iter_llm_text = fake_llm_text
+        request = GenerateStoryRequest(username="TestUser", prompt="story", scene_count=5)
+
+        start = time.perf_counter()
+        events = [event async for event in tool._story_events(request)]
+        elapsed = time.perf_counter() - start
+        scenes = events[-1]["story"]["scenes"]
+
+        print(f"Rendered {len(scenes)} scenes in {elapsed:.2f}s (peak concurrency {peak})")
+        assert peak <= 3
+        assert elapsed < 2.0
+        assert scenes[0]["image"] == "image:scene 1"
+        assert scenes[1]["image"] == "image:story"
+        assert scenes[3]["image"] == "image:story"
+        print("✅ Parallel scene image generation test passed!")
+    finally:
+        tool_module.image_generator.generate_image = original
+
+
+if __name__ == '__main__':
+    asyncio.run(test_parallel_images())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled, hot-reloadable prompt registry
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_prompt(directory, name, human, system="You are a storyteller."):
+    path = Path(directory) / f"{name}.yaml"
+    path.write_text(f"system: |\n  {system}\nhuman: |\n  {human}\n")
+    # Make sure the change is visible even on coarse file timestamps
+    stamp = time.time_ns() + 10**9
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_prompts_are_compiled_and_validated():
+    """Templates are rendered from compiled segments and bad placeholders fail at load"""
+    from app.core.prompts import PromptError, PromptRegistry
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_prompt(directory, "story", "Write {scene_count} scenes about {prompt}. Use {{braces}}.")
+        registry = PromptRegistry(reload=False)
+        prompts = registry.register(Path(directory), placeholders=("prompt", "scene_count"))
+        assert registry.register(Path(directory), placeholders=()) is prompts
+
+        prompt = prompts["story"]
+        assert prompt.system == "You are a storyteller."
+        assert prompt.placeholders == {"prompt", "scene_count"}
+        assert len(prompt.version) == 12
+        assert prompt.render(prompt="a fox", scene_count=3, unused="x") == \
+            "Write 3 scenes about a fox. Use {braces}."
+
+        write_prompt(directory, "story", "Write about {promt}.")
+        try:
+            PromptRegistry(reload=False).register(Path(directory), placeholders=("prompt",))
+            raise AssertionError("Unknown placeholder was accepted")
+        except PromptError:
+            pass
+    print("✅ Prompt compilation test passed!")
+
+
+async def test_prompts_reload_on_change():
+    """Edited prompts are picked up in the background; broken edits keep the old version"""
+    from app.core.prompts import PromptRegistry
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_prompt(directory, "story", "Tell a story about {prompt}.")
+        registry = PromptRegistry(reload=True, poll_interval=0.01)
+        prompts = registry.register(Path(directory), placeholders=("prompt",))
+        first = prompts["story"]
+
+        registry.start_watching()
+        try:
+            write_prompt(directory, "story", "Tell a funny story about {prompt}.")
+            for _ in range(100):
+                if prompts["story"] is not first:
+                    break
+                await asyncio.sleep(0.01)
+            second = prompts["story"]
+            assert second.render(prompt="owls") == "Tell a funny story about owls."
+            assert second.version != first.version
+
+            write_prompt(directory, "story", "Tell a story about {unknown}.")
+            await registry.check_for_changes()
+            assert prompts["story"] is second
+        finally:
+            await registry.stop_watching()
+    print("✅ Prompt reload test passed!")
+
+
+if __name__ == '__main__':
+    test_prompts_are_compiled_and_validated()
+    asyncio.run(test_prompts_reload_on_change())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for coalescing identical in-flight story generations
+"""
+import asyncio
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def test_singleflight_shares_one_call():
+    """Concurrent calls with the same key run the work once"""
+    from app.core.singleflight import SingleFlight
+
+    group = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return calls
+
+    results = await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+    assert results == [1] * 5
+    assert calls == 1
+    assert len(group) == 0
+
+    # Finished work is not cached: the next call runs again
+    assert await group.do("key", work) == 2
+    print("✅ SingleFlight coalescing test passed!")
+
+
+async def test_singleflight_cancellation():
+    """A cancelled waiter does not cancel work that others still await"""
+    from app.core.singleflight import SingleFlight
+
+    group = SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0.2)
+        return "done"
+
+    first = asyncio.create_task(group.do("key", work))
+    second = asyncio.create_task(group.do("key", work))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    assert await second == "done"
+
+    # The last waiter leaving cancels the shared work
+    lone = asyncio.create_task(group.do("other", work))
+    await asyncio.sleep(0.05)
+    lone.cancel()
+    await asyncio.sleep(0.01)
+    assert len(group) == 0
+
+    # A call arriving while cancelled work is still winding down starts afresh
+    calls = 0
+
+    async def slow_to_stop():
+        nonlocal calls
+        calls += 1
+        try:
+            await asyncio.sleep(0.2)
+            return calls
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.1)
+            raise
+
+    abandoned = asyncio.create_task(group.do("slow", slow_to_stop))
+    await asyncio.sleep(0.05)
+    abandoned.cancel()
+    await asyncio.sleep(0)
+    assert len(group) == 0
+    assert await group.do("slow", slow_to_stop) == 2
+    print("✅ SingleFlight cancellation test passed!")
+
+
+async def test_identical_stories_coalesced():
+    """Identical story requests from different users share one generation"""
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    runs = 0
+
+    async def fake_story_events(input_data):
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.1)
+        yield {
+            "event": "done",
+            "story": {
+                "title": "Shared",
+                "scenes": [{"scene_number": 1, "story_text": input_data.prompt}],
+            },
+        }
+
+    tool = GenerateStoryTool()
+    tool._story_events = fake_story_events
+
+    def request(username, prompt="A brave fox"):
+        return GenerateStoryRequest(username=username, prompt=prompt, scene_count=1)
+
+    results = await asyncio.gather(
+        tool.execute(request("alice")),
+        tool.execute(request("bob")),
+        tool.execute(request("carol", prompt="A sleepy owl")),
+    )
+    assert runs == 2
+    assert results[0] is results[1]
+    assert results[2].scenes[0].story_text == "A sleepy owl"
+
+    key = tool._request_key(request("alice"))
+    assert tool.prompts["summarize"].version in key
+    print("✅ Story request coalescing test passed!")
+
+
+if __name__ == '__main__':
+    asyncio.run(test_singleflight_shares_one_call())
+    asyncio.run(test_singleflight_cancellation())
+    asyncio.run(test_identical_stories_coalesced())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for startup profiling and the cold-start budget check
+"""
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       200 |        200 |       langchain_core.utils
+import time:       300 |        500 |     langchain_core
+import time:       400 |        900 |   app.main
+Some other log line
+"""
+
+
+def test_parse_importtime():
+    """Import times are parsed per module and summarized per package"""
+    from app.core.profiling import parse_importtime, summarize_imports
+
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+    assert [(record.module, record.depth) for record in records] == [
+        ("_io", 0), ("langchain_core.utils", 2), ("langchain_core", 1), ("app.main", 0)
+    ]
+    assert records[2].self_seconds == 0.0003 and records[2].cumulative_seconds == 0.0005
+
+    summary = summarize_imports(records, top=2)
+    assert summary["total_seconds"] == 0.001
+    assert list(summary["modules"]) == ["app.main", "langchain_core"]
+    assert summary["packages"] == {"langchain_core": 0.0005, "app": 0.0004}
+    print("✅ Import time parsing test passed!")
+
+
+def test_phases_and_budget():
+    """Lifespan phases are timed and checked against their budgets"""
+    from app.core.profiling import StartupProfiler, check_budget
+
+    profiler = StartupProfiler()
+    profiler.start()
+    with profiler.phase("tool_discovery"):
+        time.sleep(0.02)
+    with profiler.phase("route_registration"):
+        pass
+    profiler.finish()
+
+    report = profiler.report()
+    assert report["phases"]["tool_discovery"] >= 0.02
+    assert report["startup_seconds"] >= report["phases"]["tool_discovery"]
+
+    assert check_budget(report, {"budget_seconds": 5, "phase_budgets": {"tool_discovery": 1}}) == []
+    violations = check_budget(
+        {**report, "imports": {"total_seconds": 2.5}},
+        {"budget_seconds": 0.01, "import_budget_seconds": 2, "phase_budgets": {"tool_discovery": 0.001}},
+    )
+    assert len(violations) == 3
+    assert any(violation.startswith("phase tool_discovery") for violation in violations)
+    print("✅ Startup budget test passed!")
+
+
+if __name__ == '__main__':
+    test_parse_importtime()
+    test_phases_and_budget()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for the orchestrator's persistent story store
+"""
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "orchestor"))
+
+
+def test_story_store_lookup_and_expiry():
+    """Stories are found by id and fingerprint until their TTL runs out"""
+    from stories import build_llm_request, parse_temperature
+    from story_store import StoryStore, is_deterministic, request_fingerprint
+
+    store = StoryStore(":memory:", ttl_seconds=0.2)
+    request = build_llm_request("TestUser", "A brave fox", parse_temperature({"temperature": 0}))
+    fingerprint = request_fingerprint(request)
+
+    assert is_deterministic(request)
+    assert not is_deterministic(build_llm_request("TestUser", "A brave fox"))
+    assert fingerprint == request_fingerprint(build_llm_request("TestUser", "A brave fox", 0))
+    assert fingerprint != request_fingerprint(build_llm_request("TestUser", "A brave fox", 0.7))
+
+    store.put({"id": "story-1", "story": {"title": "Fox"}}, fingerprint)
+    store.put({"id": "fallback-1", "story": {"title": "Fallback"}})
+    assert store.get("story-1")["story"]["title"] == "Fox"
+    assert store.get_by_fingerprint(fingerprint)["id"] == "story-1"
+    assert store.get("fallback-1") is not None
+    assert store.get("missing") is None
+
+    time.sleep(0.3)
+    assert store.get("story-1") is None
+    assert store.get_by_fingerprint(fingerprint) is None
+    assert store.purge_expired() == 2
+    store.close()
+    print("✅ Story store test passed!")
+
+
+def test_parse_temperature_rejects_invalid_values():
+    """Only numbers between 0 and 2 are accepted as temperatures"""
+    from stories import parse_temperature
+
+    assert parse_temperature({}) is None
+    assert parse_temperature({"temperature": 0.5}) == 0.5
+    for value in ("hot", True, -1, 3):
+        try:
+            parse_temperature({"temperature": value})
+        except ValueError:
+            continue
+        raise AssertionError(f"Accepted invalid temperature {value!r}")
+    print("✅ Temperature validation test passed!")
+
+
+if __name__ == '__main__':
+    test_story_store_lookup_and_expiry()
+    test_parse_temperature_rejects_invalid_values()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental story streaming from the LLM
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+STORY = {
+    "title": "Milo's Garden Adventure",
+    "theme": "adventure",
+    "target_age": "5-10 years",
+    "scenes": [
+        {"scene_number": i, "story_text": f"Milo explores part {i} of the garden"}
+        for i in range(1, 6)
+    ],
+}
+
+
+def test_incremental_parser():
+    """Fields and scenes are reported as soon as they are complete"""
+    from app.llm.json_stream import IncrementalJSONParser
+
+    text = "Here is your story:\n" + json.dumps(STORY, indent=2) + "\nEnjoy!"
+    parser = IncrementalJSONParser(array_key="scenes")
+    events = []
+    for i in range(0, len(text), 5):
+        events.extend(parser.feed(text[i:i + 5]))
+
+    fields = {event.key: event.value for event in events if event.kind == "field"}
+    scenes = [event.value for event in events if event.kind == "item"]
+    assert fields["title"] == STORY["title"]
+    assert fields["theme"] == "adventure"
+    assert scenes == STORY["scenes"]
+    assert parser.text == text
+    print("✅ Incremental JSON parser test passed!")
+
+
+async def test_images_start_while_llm_streams():
+    """Scene 1's image is rendered before the LLM has finished writing"""
+    from app.core.blobs import BlobStore
+    from app.llm.manager import OllamaClient
+    from tools.generate_story import tool as tool_module
+    from tools.generate_story.schemas import GenerateStoryRequest
+    from tools.generate_story.tool import GenerateStoryTool
+
+    timeline = []
+    text = json.dumps(STORY)
+
+    class FakeOllama(OllamaClient):
+        async def astream_chat(self, messages, options=None, response_format=None):
+            for i in range(0, len(text), 20):
+                await asyncio.sleep(0.01)
+                yield text[i:i + 20]
+            timeline.append("llm done")
+
+    async def fake_generate_image_bytes(prompt, style="animated"):
+        timeline.append(f"image: {prompt}")
+        return prompt.encode()
+
+    original_model = tool_module.get_model
+    original_image = tool_module.image_generator.generate_image_bytes
+    original_blob_store = tool_module.get_blob_store
+    blob_store = BlobStore(tempfile.mkdtemp())
+    tool_module.get_model = lambda: FakeOllama(model="fake", base_url="http://fake")
+    tool_module.image_generator.generate_image_bytes = fake_generate_image_bytes
+    tool_module.get_blob_store = lambda: blob_store
+    try:
+        tool = GenerateStoryTool()
+        tool.image_settings["delivery"] = "url"
+        request = GenerateStoryRequest(username="TestUser", prompt="garden", scene_count=5)
+        events = [event async for event in tool.stream(request)]
+    finally:
+        tool_module.get_model = original_model
+        tool_module.image_generator.generate_image_bytes = original_image
+        tool_module.get_blob_store = original_blob_store
+
+    kinds = [event["event"] for event in events]
+    print(f"Events: {kinds}")
+    assert kinds[0] == "title"
+    assert events[0] == {"event": "title", "title": STORY["title"]}
+    assert kinds.count("scene") == 5 and kinds.count("image") == 5
+    assert kinds[-1] == "done"
+    assert timeline.index("image: Milo explores part 1 of the garden") < timeline.index("llm done")
+
+    # Images are delivered as blob URLs rather than inline data
+    image_events = [event for event in events if event["event"] == "image"]
+    assert all(event["image"] is None for event in image_events)
+    path, content_type = blob_store.locate(image_events[0]["image_url"].rsplit("/", 1)[1])
+    assert content_type == "image/png" and path.read_bytes().startswith(b"Milo")
+    print("✅ Streaming story test passed!")
+
+
+if __name__ == '__main__':
+    test_incremental_parser()
+    asyncio.run(test_images_start_while_llm_streams())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared tool instances held by the tool registry
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_registry_reuses_tool_instances():
+    """Tools are instantiated once and handed out to every caller"""
+    from app.core.discovery import ToolDiscoveryError, ToolRegistry
+
+    with tempfile.TemporaryDirectory() as directory:
+        registry = ToolRegistry(index_path=Path(directory) / "index.json")
+        registry.discover_tools(Path(os.path.dirname(os.path.abspath(__file__))))
+    instances = registry.instantiate_tools()
+    assert set(instances) == set(registry.tools)
+
+    tool = registry.get_tool("generate_story")
+    assert tool is instances["generate_story"]
+    assert registry.get_tool("generate_story") is tool
+
+    try:
+        registry.get_tool("missing_tool")
+        raise AssertionError("Unknown tool was returned")
+    except ToolDiscoveryError:
+        pass
+    print("✅ Tool registry instance test passed!")
+
+
+def test_tool_construction_is_cheap():
+    """Prompts are parsed once per process and the router is built on first use"""
+    from tools.generate_story.tool import GenerateStoryTool
+
+    first = GenerateStoryTool()
+    second = GenerateStoryTool()
+    assert second.prompts is first.prompts
+
+    assert "router" not in second.__dict__
+    paths = {route.path for route in second.router.routes}
+    assert paths == {"/generate-story/create", "/generate-story/health"}
+    assert second.router is second.router
+    print("✅ Tool construction test passed!")
+
+
+def test_discovery_uses_cached_index_without_importing_tools():
+    """A warm index lists tools and their schemas without importing tool modules"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    script = """
+import json, sys
+from pathlib import Path
+from app.core.discovery import ToolRegistry
+registry = ToolRegistry(index_path=Path(sys.argv[1]))
+manifests = registry.discover_tools(Path.cwd())
+print(json.dumps({
+    "tools": sorted(manifests),
+    "imported": "tools.generate_story.tool" in sys.modules,
+    "langchain": any(name.startswith("langchain") for name in sys.modules),
+}))
+"""
+
+    def discover(index_path):
+        output = subprocess.run(
+            [sys.executable, "-c", script, str(index_path)],
+            cwd=base_dir, capture_output=True, text=True, check=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = Path(directory) / "index.json"
+        cold = discover(index_path)
+        assert cold["imported"]
+        index = json.loads(index_path.read_text())
+        entry = index["tools"]["generate_story"]
+        assert entry["input_schema"] == "tools.generate_story.schemas:GenerateStoryRequest"
+
+        warm = discover(index_path)
+        assert warm["tools"] == cold["tools"]
+        assert not warm["imported"] and not warm["langchain"]
+    print("✅ Cached tool index test passed!")
+
+
+def test_tool_metadata_served_with_etags():
+    """Tool listings and schemas are prebuilt and revalidated with ETags"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.core.discovery import ToolRegistry
+    from tools.generate_story.schemas import GenerateStoryRequest
+
+    with tempfile.TemporaryDirectory() as directory:
+        registry = ToolRegistry(index_path=Path(directory) / "index.json")
+        registry.discover_tools(Path(os.path.dirname(os.path.abspath(__file__))))
+    app = FastAPI()
+    registry.register_routes(app)
+    client = TestClient(app)
+
+    listing = client.get("/tools/")
+    assert listing.status_code == 200
+    assert {"name": "generate_story", "description": registry.manifests["generate_story"].description} in listing.json()
+    assert listing.headers["cache-control"] == "no-cache"
+
+    schema = client.get("/tools/generate_story/input-schema")
+    assert schema.json() == GenerateStoryRequest.model_json_schema()
+    etag = schema.headers["etag"]
+
+    revalidated = client.get("/tools/generate_story/input-schema", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert client.get("/tools/", headers={"If-None-Match": etag}).status_code == 200
+    print("✅ Tool metadata caching test passed!")
+
+
+if __name__ == '__main__':
+    test_registry_reuses_tool_instances()
+    test_tool_construction_is_cheap()
+    test_discovery_uses_cached_index_without_importing_tools()
+    test_tool_metadata_served_with_etags()
@@ -5,6 +5,14 @@ A tool for generating picture stories based on user prompts.
 Creates a structured story with multiple scenes and image prompts.
 """
 
-from .tool import GenerateStoryTool
-
 __all__ = ["GenerateStoryTool"]
+
+
+def __getattr__(name):
+    # Import the tool (and its LLM and imaging dependencies) only when it is used,
+    # so loading the schemas during tool discovery stays cheap
+    if name == "GenerateStoryTool":
+        from .tool import GenerateStoryTool
+
+        return GenerateStoryTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
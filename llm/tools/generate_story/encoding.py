@@ -0,0 +1,136 @@
+"""
+Image Encoding Module
+
+Encodes rendered images for delivery. The output format (PNG, WebP or JPEG),
+its compression settings and optional palette quantization are configured under
+[images.encoding] in the tool configuration. Quantizing is well suited to the
+flat-color mock art, which uses fewer than 256 distinct colors, and makes the
+PNGs both smaller and faster to encode. It is only applied when the image fits
+the palette exactly, so the decoded pixels always equal the rendered ones.
+"""
+
+import io
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from PIL import Image
+
+# MIME type and PIL format name for each supported output format
+FORMATS: Dict[str, Dict[str, str]] = {
+    "png": {"mime_type": "image/png", "pil_format": "PNG"},
+    "webp": {"mime_type": "image/webp", "pil_format": "WEBP"},
+    "jpeg": {"mime_type": "image/jpeg", "pil_format": "JPEG"},
+}
+
+_buffers = threading.local()
+
+
+@dataclass(frozen=True)
+class EncodingSettings:
+    """Settings for encoding an image"""
+    format: str = "png"
+    png_compress_level: int = 6
+    quality: int = 85
+    lossless: bool = False
+    quantize: bool = False
+    colors: int = 256
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "EncodingSettings":
+        """
+        Create encoding settings from the ``[images.encoding]`` tool configuration.
+
+        Args:
+            settings: Encoding settings dictionary
+
+        Returns:
+            Validated EncodingSettings
+        """
+        image_format = str(settings.get("format", "png")).lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        if image_format not in FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        return cls(
+            format=image_format,
+            png_compress_level=min(9, max(0, int(settings.get("png_compress_level", 6)))),
+            quality=min(100, max(1, int(settings.get("quality", 85)))),
+            lossless=bool(settings.get("lossless", False)),
+            quantize=bool(settings.get("quantize", False)),
+            colors=min(256, max(2, int(settings.get("colors", 256)))),
+        )
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of the encoded images"""
+        return FORMATS[self.format]["mime_type"]
+
+    @property
+    def tag(self) -> str:
+        """Short identifier of these settings, used in cache keys"""
+        if self.format == "png":
+            options = f"l{self.png_compress_level}"
+        else:
+            options = "lossless" if self.lossless and self.format == "webp" else f"q{self.quality}"
+        if self.quantize:
+            # "x" marks exact (median cut) palettes; "-p" entries cached before were lossy
+            options += f"-x{self.colors}"
+        return f"{self.format}-{options}"
+
+
+def encode_image(image: Image.Image, settings: EncodingSettings) -> bytes:
+    """
+    Encode an image with the given settings.
+
+    The image is written into a per-thread buffer that is reused across calls,
+    so only the final bytes are allocated per image.
+
+    Args:
+        image: RGB image to encode
+        settings: Encoding settings
+
+    Returns:
+        Encoded image bytes
+    """
+    # getcolors returns None when the image has more than ``colors`` colors, in
+    # which case a palette could not hold it losslessly
+    if settings.quantize and settings.format != "jpeg" and image.getcolors(settings.colors) is not None:
+        # Median cut keeps every color when they all fit the palette
+        image = image.quantize(
+            colors=settings.colors,
+            method=Image.Quantize.MEDIANCUT,
+            dither=Image.Dither.NONE,
+        )
+
+    if settings.format == "png":
+        options = {"compress_level": settings.png_compress_level}
+    elif settings.format == "webp":
+        options = {"quality": settings.quality, "lossless": settings.lossless, "method": 4}
+    else:
+        options = {"quality": settings.quality, "optimize": False}
+
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _buffers.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    image.save(buffer, format=FORMATS[settings.format]["pil_format"], **options)
+    return buffer.getvalue()
+
+
+def sniff_mime_type(data: bytes) -> str:
+    """
+    Detect the MIME type of encoded image bytes from their signature.
+
+    Args:
+        data: Encoded image bytes
+
+    Returns:
+        The image MIME type, defaulting to image/png
+    """
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
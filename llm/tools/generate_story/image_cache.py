@@ -0,0 +1,239 @@
+"""
+Image Cache Module
+
+Content-addressed cache for generated scene images. Images are keyed on the
+normalized prompt, style, provider and output size, and kept in two tiers:
+a bounded in-memory LRU for hot entries and an on-disk store that survives
+restarts and is evicted oldest-first once it grows past its size limit.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.core.metrics import get_metrics
+
+_WHITESPACE = re.compile(r"\s+")
+
+_metrics = get_metrics()
+_hits = _metrics.counter("image_cache_hits_total", "Image cache hits by tier")
+_misses = _metrics.counter("image_cache_misses_total", "Image cache misses")
+_evictions = _metrics.counter("image_cache_evictions_total", "Image cache evictions by tier")
+_bytes = _metrics.gauge("image_cache_bytes", "Bytes held by the image cache by tier")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivially different spellings share a cache entry."""
+    return _WHITESPACE.sub(" ", prompt or "").strip().lower()
+
+
+def make_cache_key(prompt: str, style: str, provider: str, size: str) -> str:
+    """
+    Build the content address for an image.
+
+    Args:
+        prompt: Image prompt
+        style: Artistic style
+        provider: Provider that renders the image ("dalle", "stability", "mock")
+        size: Output size, e.g. "1024x1024"
+
+    Returns:
+        Hex SHA-256 digest identifying the image
+    """
+    material = "\x1f".join([normalize_prompt(prompt), normalize_prompt(style), provider, size])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ImageCache:
+    """Two-tier (memory LRU + disk) cache of encoded image bytes."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = ".cache/images",
+        memory_max_entries: int = 128,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize the image cache.
+
+        Args:
+            directory: Directory for the disk tier, or None to disable it
+            memory_max_entries: Maximum number of images kept in memory
+            memory_max_bytes: Maximum total size of images kept in memory
+            disk_max_bytes: Maximum total size of the disk tier
+        """
+        self.directory = Path(directory) if directory else None
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_index: Optional[Dict[str, int]] = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "ImageCache":
+        """
+        Create a cache from the ``[images.cache]`` tool configuration.
+
+        Args:
+            settings: Cache settings dictionary
+
+        Returns:
+            Configured ImageCache instance
+        """
+        directory = settings.get("directory", ".cache/images") if settings.get("disk", True) else None
+        return cls(
+            directory=directory,
+            memory_max_entries=int(settings.get("memory_max_entries", 128)),
+            memory_max_bytes=int(settings.get("memory_max_mb", 64)) * 1024 * 1024,
+            disk_max_bytes=int(settings.get("disk_max_mb", 512)) * 1024 * 1024,
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up an image.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            The cached image bytes, or None on a miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+        if data is not None:
+            _hits.inc(tier="memory")
+            return data
+
+        if self.directory is not None:
+            data = await asyncio.to_thread(self._read_disk, key)
+            if data is not None:
+                _hits.inc(tier="disk")
+                self._put_memory(key, data)
+                return data
+
+        _misses.inc()
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """
+        Store an image in both tiers.
+
+        Args:
+            key: Cache key from make_cache_key
+            data: Encoded image bytes
+        """
+        self._put_memory(key, data)
+        if self.directory is not None:
+            try:
+                await asyncio.to_thread(self._write_disk, key, data)
+            except OSError as e:
+                logger.warning(f"Could not write image cache entry {key[:12]}: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry counts and sizes for both tiers."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk_index or {}),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _put_memory(self, key: str, data: bytes) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if len(data) > self.memory_max_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while len(self._memory) > self.memory_max_entries or self._memory_bytes > self.memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+                _evictions.inc(tier="memory")
+            _bytes.set(self._memory_bytes, tier="memory")
+
+    def _path(self, key: str) -> Path:
+        """Disk location of an entry, sharded by the first two hex digits."""
+        return self.directory / key[:2] / key
+
+    def _load_disk_index(self) -> Dict[str, int]:
+        """Scan the disk tier once to learn its current entries and size."""
+        if self._disk_index is None:
+            index: Dict[str, int] = {}
+            if self.directory.exists():
+                for path in self.directory.glob("??/*"):
+                    if path.is_file() and not path.name.endswith(".tmp"):
+                        index[path.name] = path.stat().st_size
+            self._disk_index = index
+            self._disk_bytes = sum(index.values())
+            _bytes.set(self._disk_bytes, tier="disk")
+        return self._disk_index
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read an entry from disk, refreshing its mtime for eviction order."""
+        with self._lock:
+            if key not in self._load_disk_index():
+                return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                self._disk_bytes -= self._disk_index.pop(key, 0)
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        """Atomically write an entry to disk and enforce the size limit."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            index = self._load_disk_index()
+            self._disk_bytes += len(data) - index.get(key, 0)
+            index[key] = len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk(index)
+            _bytes.set(self._disk_bytes, tier="disk")
+
+    def _evict_disk(self, index: Dict[str, int]) -> None:
+        """Remove the least recently used disk entries until under the limit."""
+        entries = []
+        for key in index:
+            try:
+                entries.append((self._path(key).stat().st_mtime, key))
+            except OSError:
+                entries.append((0.0, key))
+        entries.sort()
+
+        target = self.disk_max_bytes * 0.9
+        for _, key in entries:
+            if self._disk_bytes <= target:
+                break
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+            self._disk_bytes -= index.pop(key)
+            _evictions.inc(tier="disk")
+        logger.info(f"Evicted image cache entries, disk tier now {self._disk_bytes} bytes")
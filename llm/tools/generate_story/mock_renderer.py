@@ -0,0 +1,434 @@
+"""
+Mock Image Renderer
+
+Renders the animated-style placeholder images used when no image provider is
+configured (local development, load tests and provider outages). The gradient
+background, the star particles and the gold border are composed as NumPy array
+operations.
+
+Scene shapes never change for a given (scene template, palette, size), so they
+are drawn with PIL once into cached layers and composed with the gradient and
+border into a base image. Rendering an image then only copies the cached base
+and stamps the prompt-specific particles (and, for night scenes, stars) into
+the pixels the static shapes leave uncovered.
+"""
+
+import io
+import random
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from .encoding import EncodingSettings, encode_image
+
+# Default size of the rendered images
+MOCK_WIDTH, MOCK_HEIGHT = 800, 600
+
+# Color palettes for different styles
+COLOR_PALETTES: Dict[str, List[str]] = {
+    'fantasy': ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
+    'adventure': ['#FF8C42', '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
+    'mystery': ['#6C5CE7', '#A29BFE', '#FD79A8', '#FDCB6E', '#00B894'],
+    'kids': ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
+    'digital art': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
+}
+
+BORDER_COLOR = '#FFD700'  # Gold border
+BORDER_WIDTH = 3
+
+
+class SceneLayers(NamedTuple):
+    """Prerendered static content for one (template, palette, size)"""
+    base: np.ndarray  # Gradient, static scene shapes and border (read-only)
+    particle_free: np.ndarray  # Pixels particles may be drawn on
+    star_free: np.ndarray  # Pixels night-scene stars may be drawn on
+
+
+def render_mock_image(prompt: str, style: str, width: int = MOCK_WIDTH, height: int = MOCK_HEIGHT) -> Image.Image:
+    """
+    Render an animated-style mock image for a prompt.
+
+    Args:
+        prompt: Text description of the image; keywords select the scene
+        style: Artistic style, used to pick the color palette
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        The rendered RGB image
+    """
+    palette = style if style in COLOR_PALETTES else 'kids'
+    colors = COLOR_PALETTES[palette]
+    template = scene_template(prompt)
+    rng = random.Random(hash(prompt) % 1000)  # Consistent randomness for same prompt
+
+    layers = scene_layers(template, palette, width, height)
+    pixels = layers.base.copy()
+    _stamp_particles(pixels, layers.particle_free, rng, colors, width, height)
+    if template == 'night':
+        _stamp_stars(pixels, layers.star_free, rng, colors, width, height)
+    return Image.fromarray(pixels, 'RGB')
+
+
+def scene_template(prompt: str) -> str:
+    """Pick the scene template for a prompt based on its keywords"""
+    prompt_lower = prompt.lower()
+    for template, keywords in SCENE_KEYWORDS:
+        if any(word in prompt_lower for word in keywords):
+            return template
+    return 'generic'
+
+
+@lru_cache(maxsize=32)
+def scene_layers(template: str, palette: str, width: int, height: int) -> SceneLayers:
+    """
+    Build (once, on first use) the static layers for a scene template, palette and size.
+
+    Args:
+        template: Scene template name from scene_template
+        palette: Key of COLOR_PALETTES
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        The composed base image and the masks of pixels left uncovered
+    """
+    colors = COLOR_PALETTES[palette]
+    under_drawers, over_drawers = SCENE_LAYERS[template]
+    under_rgb, under_mask = _draw_layer(under_drawers, colors, width, height)
+    over_rgb, over_mask = _draw_layer(over_drawers, colors, width, height)
+    border_mask = _border_mask(width, height)
+
+    base = _gradient(width, height).copy()
+    base[under_mask] = under_rgb[under_mask]
+    base[over_mask] = over_rgb[over_mask]
+    base[border_mask] = _rgb(BORDER_COLOR)
+
+    star_free = ~(over_mask | border_mask)
+    particle_free = star_free & ~under_mask
+    for array in (base, particle_free, star_free):
+        array.flags.writeable = False
+    return SceneLayers(base, particle_free, star_free)
+
+
+def render_mock_png(
+    prompt: str,
+    style: str,
+    width: int = MOCK_WIDTH,
+    height: int = MOCK_HEIGHT,
+    encoding: EncodingSettings = EncodingSettings(),
+) -> bytes:
+    """
+    Render a mock image and encode it (as PNG unless configured otherwise).
+
+    This is a module-level function so it can run in a process pool.
+
+    Args:
+        prompt: Text description of the image
+        style: Artistic style
+        width: Image width in pixels
+        height: Image height in pixels
+        encoding: Output encoding settings
+
+    Returns:
+        Encoded image bytes
+    """
+    return encode_image(render_mock_image(prompt, style, width, height), encoding)
+
+
+@lru_cache(maxsize=1)
+def render_fallback_png() -> bytes:
+    """Render the plain colored rectangle used when mock rendering fails"""
+    buffer = io.BytesIO()
+    Image.new('RGB', (512, 512), color='#FF6B6B').save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=8)
+def _gradient(width: int, height: int) -> np.ndarray:
+    """Build the vertical blue gradient background (read-only, shared)"""
+    progress = np.arange(height, dtype=np.float64) / height
+    rows = np.stack([
+        26 + progress * 50,  # Dark blue to lighter blue
+        26 + progress * 80,
+        46 + progress * 100,
+    ], axis=1).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    pixels.flags.writeable = False
+    return pixels
+
+
+@lru_cache(maxsize=None)
+def _star_mask(size: int) -> np.ndarray:
+    """Rasterize the eight-point star particle of a given size once"""
+    extent = 2 * size + 1
+    mask = Image.new('1', (extent, extent), 0)
+    x = y = size
+    points = [
+        (x, y - size), (x + size//2, y - size//2), (x + size, y),
+        (x + size//2, y + size//2), (x, y + size), (x - size//2, y + size//2),
+        (x - size, y), (x - size//2, y - size//2)
+    ]
+    ImageDraw.Draw(mask).polygon(points, fill=1)
+    return np.array(mask, dtype=bool)
+
+
+@lru_cache(maxsize=None)
+def _rgb(color: str) -> Tuple[int, int, int]:
+    """Convert a hex color to an RGB tuple"""
+    return ImageColor.getrgb(color)
+
+
+@lru_cache(maxsize=None)
+def _dot_mask(size: int) -> np.ndarray:
+    """Rasterize the round night-sky star of a given size once"""
+    extent = 2 * size + 1
+    mask = Image.new('1', (extent, extent), 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, 2 * size, 2 * size], fill=1)
+    return np.array(mask, dtype=bool)
+
+
+def _stamp(pixels: np.ndarray, free: np.ndarray, mask: np.ndarray, x: int, y: int, size: int, color: str):
+    """Paint a centered shape mask into the pixels that are free to draw on"""
+    window = (slice(y - size, y + size + 1), slice(x - size, x + size + 1))
+    pixels[window][mask & free[window]] = _rgb(color)
+
+
+def _stamp_particles(pixels: np.ndarray, free: np.ndarray, rng: random.Random, colors: list, width: int, height: int):
+    """Add floating particles/stars for animated effect"""
+    for _ in range(20):
+        x = rng.randint(50, width - 50)
+        y = rng.randint(50, height - 50)
+        size = rng.randint(2, 6)
+        color = rng.choice(colors)
+        _stamp(pixels, free, _star_mask(size), x, y, size, color)
+
+
+def _stamp_stars(pixels: np.ndarray, free: np.ndarray, rng: random.Random, colors: list, width: int, height: int):
+    """Draw night-sky stars (continuing the particle random sequence)"""
+    for _ in range(30):
+        star_x = rng.randint(50, width - 50)
+        star_y = rng.randint(50, height // 2)
+        size = rng.randint(1, 3)
+        _stamp(pixels, free, _dot_mask(size), star_x, star_y, size, colors[4])
+
+
+def _draw_layer(drawers: List[Callable], colors: list, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw shapes onto a transparent layer and return its RGB values and coverage mask"""
+    layer = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    for drawer in drawers:
+        drawer(draw, width, height, colors)
+    pixels = np.array(layer)
+    return pixels[..., :3], pixels[..., 3] > 0
+
+
+@lru_cache(maxsize=8)
+def _border_mask(width: int, height: int) -> np.ndarray:
+    """Pixels covered by the animated-style border"""
+    # The bottom and right edges are one pixel narrower, matching the original
+    # line-drawn border whose outermost bottom/right lines fell outside the image
+    mask = np.zeros((height, width), dtype=bool)
+    mask[:BORDER_WIDTH, :] = True
+    mask[height - BORDER_WIDTH + 1:, :] = True
+    mask[:, :BORDER_WIDTH] = True
+    mask[:, width - BORDER_WIDTH + 1:] = True
+    mask.flags.writeable = False
+    return mask
+
+
+def _draw_rabbit_scene(draw, width: int, height: int, colors: list):
+    """Draw a rabbit-themed animated scene"""
+    # Draw a cozy nest
+    nest_x, nest_y = width // 2, height // 2 + 50
+    nest_color = colors[3]  # Green for grass
+
+    # Draw nest base
+    for i in range(5):
+        radius = 80 + i * 5
+        draw.ellipse([nest_x - radius, nest_y - radius, nest_x + radius, nest_y + radius],
+                    outline=nest_color, width=2)
+
+    # Draw rabbit silhouette
+    rabbit_x, rabbit_y = width // 2, height // 2
+    # Rabbit body
+    draw.ellipse([rabbit_x - 30, rabbit_y - 20, rabbit_x + 30, rabbit_y + 40],
+                fill=colors[4])  # Light color for rabbit
+    # Rabbit head
+    draw.ellipse([rabbit_x - 20, rabbit_y - 40, rabbit_x + 20, rabbit_y],
+                fill=colors[4])
+    # Rabbit ears
+    draw.ellipse([rabbit_x - 15, rabbit_y - 60, rabbit_x - 5, rabbit_y - 30],
+                fill=colors[4])
+    draw.ellipse([rabbit_x + 5, rabbit_y - 60, rabbit_x + 15, rabbit_y - 30],
+                fill=colors[4])
+
+    # Draw flowers around the nest
+    for i in range(8):
+        angle = i * 45
+        flower_x = nest_x + int(100 * (angle % 90) / 90)
+        flower_y = nest_y + int(100 * (angle // 90))
+        _draw_flower(draw, flower_x, flower_y, colors[i % len(colors)])
+
+
+def _draw_knight_scene(draw, width: int, height: int, colors: list):
+    """Draw a knight-themed animated scene"""
+    # Draw castle silhouette
+    castle_x, castle_y = width // 2, height // 2
+    castle_color = colors[2]  # Blue for castle
+
+    # Castle base
+    draw.rectangle([castle_x - 60, castle_y + 20, castle_x + 60, castle_y + 80],
+                  fill=castle_color)
+    # Castle towers
+    draw.rectangle([castle_x - 50, castle_y - 40, castle_x - 30, castle_y + 20],
+                  fill=castle_color)
+    draw.rectangle([castle_x + 30, castle_y - 40, castle_x + 50, castle_y + 20],
+                  fill=castle_color)
+    # Castle flags
+    draw.polygon([(castle_x - 40, castle_y - 40), (castle_x - 40, castle_y - 60),
+                 (castle_x - 20, castle_y - 50)], fill=colors[0])
+    draw.polygon([(castle_x + 40, castle_y - 40), (castle_x + 40, castle_y - 60),
+                 (castle_x + 20, castle_y - 50)], fill=colors[0])
+
+    # Draw knight
+    knight_x, knight_y = castle_x - 100, castle_y + 40
+    # Knight body
+    draw.rectangle([knight_x - 15, knight_y - 30, knight_x + 15, knight_y + 20],
+                  fill=colors[1])
+    # Knight head
+    draw.ellipse([knight_x - 10, knight_y - 50, knight_x + 10, knight_y - 30],
+                fill=colors[4])
+    # Knight sword
+    draw.line([(knight_x + 20, knight_y - 10), (knight_x + 40, knight_y - 30)],
+             fill=colors[3], width=3)
+
+
+def _draw_forest_scene(draw, width: int, height: int, colors: list):
+    """Draw a forest-themed animated scene"""
+    # Draw trees
+    for i in range(5):
+        tree_x = 100 + i * 120
+        tree_y = height // 2 + 50
+
+        # Tree trunk
+        draw.rectangle([tree_x - 10, tree_y, tree_x + 10, tree_y + 80],
+                      fill=colors[3])
+        # Tree leaves
+        draw.ellipse([tree_x - 30, tree_y - 40, tree_x + 30, tree_y + 20],
+                    fill=colors[1])
+
+        # Add some smaller trees
+        if i % 2 == 0:
+            small_tree_x = tree_x + 40
+            small_tree_y = tree_y + 20
+            draw.rectangle([small_tree_x - 5, small_tree_y, small_tree_x + 5, small_tree_y + 40],
+                          fill=colors[3])
+            draw.ellipse([small_tree_x - 15, small_tree_y - 20, small_tree_x + 15, small_tree_y + 10],
+                        fill=colors[2])
+
+    # Draw grass at the bottom
+    for x in range(0, width, 20):
+        draw.line([(x, height - 50), (x + 10, height - 30)],
+                 fill=colors[1], width=2)
+
+
+def _draw_moon(draw, width: int, height: int, colors: list):
+    """Draw the moon of the night scene"""
+    moon_x, moon_y = width - 150, 100
+    draw.ellipse([moon_x - 40, moon_y - 40, moon_x + 40, moon_y + 40],
+                fill=colors[4])
+
+
+def _draw_clouds(draw, width: int, height: int, colors: list):
+    """Draw the clouds of the night scene, in front of the stars"""
+    cloud_positions = [(100, 80), (300, 120), (500, 90)]
+    for cloud_x, cloud_y in cloud_positions:
+        draw.ellipse([cloud_x - 30, cloud_y - 15, cloud_x + 30, cloud_y + 15],
+                    fill=colors[2])
+        draw.ellipse([cloud_x - 20, cloud_y - 20, cloud_x + 20, cloud_y + 10],
+                    fill=colors[2])
+        draw.ellipse([cloud_x - 10, cloud_y - 25, cloud_x + 10, cloud_y + 5],
+                    fill=colors[2])
+
+
+def _draw_ocean_scene(draw, width: int, height: int, colors: list):
+    """Draw an ocean-themed animated scene"""
+    # Draw ocean waves
+    for y in range(height // 2, height, 20):
+        wave_color = colors[2]  # Blue for water
+        for x in range(0, width, 40):
+            # Draw wave pattern
+            points = [(x, y), (x + 20, y - 10), (x + 40, y)]
+            draw.line(points, fill=wave_color, width=3)
+
+    # Draw sun
+    sun_x, sun_y = width - 100, 100
+    draw.ellipse([sun_x - 30, sun_y - 30, sun_x + 30, sun_y + 30],
+                fill=colors[4])
+
+    # Draw some fish
+    fish_positions = [(200, height // 2 + 50), (400, height // 2 + 30), (600, height // 2 + 70)]
+    for fish_x, fish_y in fish_positions:
+        # Fish body
+        draw.ellipse([fish_x - 15, fish_y - 8, fish_x + 15, fish_y + 8],
+                    fill=colors[0])
+        # Fish tail
+        draw.polygon([(fish_x - 15, fish_y), (fish_x - 25, fish_y - 10),
+                     (fish_x - 25, fish_y + 10)], fill=colors[0])
+
+
+def _draw_generic_scene(draw, width: int, height: int, colors: list):
+    """Draw a generic animated scene"""
+    # Draw a central focal point
+    center_x, center_y = width // 2, height // 2
+
+    # Draw a magical circle
+    for i in range(3):
+        radius = 60 + i * 20
+        draw.ellipse([center_x - radius, center_y - radius, center_x + radius, center_y + radius],
+                    outline=colors[i % len(colors)], width=3)
+
+    # Draw some floating elements
+    for i in range(6):
+        angle = i * 60
+        element_x = center_x + int(80 * (angle % 90) / 90)
+        element_y = center_y + int(80 * (angle // 90))
+        size = 10 + (i % 3) * 5
+        draw.ellipse([element_x - size, element_y - size, element_x + size, element_y + size],
+                    fill=colors[i % len(colors)])
+
+
+def _draw_flower(draw, x: int, y: int, color: str):
+    """Draw a simple flower"""
+    # Flower petals
+    for i in range(6):
+        angle = i * 60
+        petal_x = x + int(8 * (angle % 90) / 90)
+        petal_y = y + int(8 * (angle // 90))
+        draw.ellipse([petal_x - 3, petal_y - 3, petal_x + 3, petal_y + 3],
+                    fill=color)
+    # Flower center
+    draw.ellipse([x - 2, y - 2, x + 2, y + 2], fill='#FFD700')
+
+
+# Scene templates in keyword priority order
+SCENE_KEYWORDS: List[Tuple[str, List[str]]] = [
+    ('rabbit', ['rabbit', 'bunny', 'animal']),
+    ('knight', ['knight', 'castle', 'sword']),
+    ('forest', ['forest', 'tree', 'nature']),
+    ('night', ['moon', 'star', 'night']),
+    ('ocean', ['ocean', 'sea', 'water']),
+]
+
+# Static shapes drawn below and above the per-image stars, by scene template
+SCENE_LAYERS: Dict[str, Tuple[List[Callable], List[Callable]]] = {
+    'rabbit': ([_draw_rabbit_scene], []),
+    'knight': ([_draw_knight_scene], []),
+    'forest': ([_draw_forest_scene], []),
+    'night': ([_draw_moon], [_draw_clouds]),
+    'ocean': ([_draw_ocean_scene], []),
+    'generic': ([_draw_generic_scene], []),
+}
@@ -2,7 +2,8 @@
 Schemas for the Generate Story Tool
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -27,6 +28,7 @@ class GenerateStoryRequest(BaseModel):
     genre: Optional[str] = Field("fantasy", description="Story genre (fantasy, adventure, mystery, etc.)")
     age_group: Optional[str] = Field("children", description="Target age group (children, young_adult, adult)")
     scene_count: Optional[int] = Field(5, description="Number of scenes to generate (minimum 5)")
+    temperature: Optional[float] = Field(None, ge=0, le=2, description="Sampling temperature; 0 makes generation deterministic (defaults to the model configuration)")
 
 
 class GenerateStoryResponse(BaseModel):
@@ -37,6 +39,58 @@ class GenerateStoryResponse(BaseModel):
     metadata: Optional[dict] = Field(None, description="Additional metadata about the generation")
 
 
+class GeneratedScene(BaseModel):
+    """Schema for a generated scene with its image"""
+    scene_number: int = Field(..., description="Scene number, starting at 1")
+    story_text: str = Field("", description="Text of the scene")
+    image: Optional[str] = Field(None, description="Inline base64 data URI of the scene image")
+    image_url: Optional[str] = Field(None, description="URL of the scene image in the blob store")
+
+
 class OutputSchema(BaseModel):
     """Output schema for the execute method"""
-    result: str = Field(..., description="The result from the LLM execution")
+    title: str = Field(..., description="Title of the story")
+    theme: Optional[str] = Field(None, description="Theme of the story")
+    target_age: Optional[str] = Field(None, description="Target age of the story")
+    scenes: List[GeneratedScene] = Field(default_factory=list, description="Generated scenes in order")
+
+
+class LLMScene(BaseModel):
+    """Schema for a scene as written by the LLM"""
+    scene_number: int = Field(..., description="Scene number, starting at 1")
+    story_text: str = Field(..., description="2-3 sentences describing the scene with visual details")
+
+
+class LLMStory(BaseModel):
+    """Schema for the story JSON the LLM is asked to produce"""
+    title: str = Field(..., description="Title of the story")
+    theme: str = Field(..., description="Theme of the story")
+    target_age: str = Field(..., description="Target age of the story")
+    scenes: List[LLMScene] = Field(..., description="Scenes in order")
+
+
+@lru_cache(maxsize=None)
+def llm_story_schema() -> Dict[str, Any]:
+    """
+    JSON schema of LLMStory with nested definitions inlined.
+
+    Constrained decoders expect a self-contained schema, so ``$ref`` entries
+    are replaced by the definitions they point to.
+
+    Returns:
+        The JSON schema (shared; copy before modifying)
+    """
+    schema = LLMStory.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref:
+                return inline(definitions[ref.rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return inline(schema)
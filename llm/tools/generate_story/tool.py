@@ -4,28 +4,41 @@ Generate Story Tool
 A FastAPI tool for generating picture stories based on user prompts.
 """
 
+import asyncio
+import contextlib
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import cached_property
+from typing import Dict, Any, AsyncIterator, List, Optional, Set
 
 from fastapi import APIRouter, HTTPException
 from loguru import logger
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema.output_parser import StrOutputParser
 from pathlib import Path
+from app.core.blobs import get_blob_store
+from app.core.config import get_config
+from app.core.executor import ExecutorOverloadedError
 from app.core.interfaces import ToolInterface
-from app.llm.manager import get_model
-import yaml
-import textwrap
+from app.core.metrics import get_metrics
+from app.core.prompts import get_prompt_registry
+from app.core.singleflight import SingleFlight
+from app.llm.json_stream import IncrementalJSONParser
+from app.llm.limiter import ModelOverloadedError, get_limiter
+from app.llm.manager import OllamaClient, get_model
+from app.llm.tolerant_json import parse_json_tolerant
 
 from .schemas import (
     GenerateStoryRequest,
     GenerateStoryResponse,
     Story,
     StoryScene,
-    OutputSchema
+    GeneratedScene,
+    OutputSchema,
+    llm_story_schema
 )
+from .encoding import sniff_mime_type
 from .image_generator import image_generator
 from .prompts.story_generation import (
     STORY_GENERATION_PROMPT,
@@ -33,6 +46,17 @@ from .prompts.story_generation import (
     STORY_VALIDATION_PROMPT
 )
 
+# Placeholders the story prompt templates may use
+PROMPT_PLACEHOLDERS = ("prompt", "username", "age_group", "genre", "scene_count")
+
+# Seconds clients are asked to wait when the image executor is overloaded
+IMAGE_RETRY_AFTER = 5
+
+# Fallback rate = story_outputs_total{source="fallback"} / story_outputs_total
+_story_outputs = get_metrics().counter(
+    "story_outputs_total", "Stories produced, by source (llm, llm_partial or fallback)"
+)
+
 
 class GenerateStoryTool(ToolInterface):
     """Tool for generating picture stories"""
@@ -41,15 +65,25 @@ class GenerateStoryTool(ToolInterface):
     name = "generate_story"
     description = "Generate picture stories based on user prompts with multiple scenes and image descriptions"
     
+    # Concurrent identical generations share one LLM call and one set of image renders
+    _inflight = SingleFlight("generate_story")
+    
     def __init__(self):
-        self.router = APIRouter(prefix="/generate-story", tags=["story-generation"])
-        self._setup_routes()
-        self.prompts = self._load_prompts()
+        self.prompts = get_prompt_registry().register(Path(__file__).parent / "prompts", PROMPT_PLACEHOLDERS)
+        self.image_settings = self._load_image_settings()
+        self.structured_output = self._load_structured_output()
+
+    @cached_property
+    def router(self) -> APIRouter:
+        """The tool's own API router, built on first use"""
+        router = APIRouter(prefix="/generate-story", tags=["story-generation"])
+        self._setup_routes(router)
+        return router
     
-    def _setup_routes(self):
+    def _setup_routes(self, router: APIRouter):
         """Set up the API routes"""
         
-        @self.router.post("/create", response_model=GenerateStoryResponse)
+        @router.post("/create", response_model=GenerateStoryResponse)
         async def create_story(request: GenerateStoryRequest) -> GenerateStoryResponse:
             """
             Generate a picture story based on user input
@@ -84,7 +118,7 @@ class GenerateStoryTool(ToolInterface):
                     error=f"Failed to generate story: {str(e)}"
                 )
         
-        @self.router.get("/health")
+        @router.get("/health")
         async def health_check():
             """Health check endpoint"""
             return {"status": "healthy", "tool": "generate-story"}
@@ -179,7 +213,7 @@ class GenerateStoryTool(ToolInterface):
     @classmethod
     def get_output_schema(cls):
         """Get the output schema for this tool."""
-        return GenerateStoryResponse
+        return OutputSchema
 
     async def execute(self, input_data: GenerateStoryRequest, token: Optional[Dict[str, Any]] = None) -> OutputSchema:
         """
@@ -190,109 +224,331 @@ class GenerateStoryTool(ToolInterface):
             token: Optional authentication token information
             
         Returns:
-            Output schema with LLM result
+            Output schema with the generated story and its scenes
+        """
+        logger.info(f"Executing generate story tool for user: {input_data.username}")
+        return await self._inflight.do(
+            self._request_key(input_data), lambda: self._execute_story(input_data)
+        )
+
+    def _request_key(self, input_data: GenerateStoryRequest) -> tuple:
+        """
+        Build the coalescing key for a story request.
+
+        The username is not part of the key because it does not affect the
+        generated story; the prompt-template version is, so requests made before
+        and after a template change are never merged.
+
+        Args:
+            input_data: Validated input data for story generation
+
+        Returns:
+            Hashable key identifying the generated story
+        """
+        return (
+            input_data.prompt,
+            input_data.genre,
+            input_data.age_group,
+            input_data.scene_count,
+            input_data.temperature,
+            self.prompts["summarize"].version,
+        )
+
+    async def _execute_story(self, input_data: GenerateStoryRequest) -> OutputSchema:
+        """
+        Generate a story and build the tool output.
+
+        Args:
+            input_data: Validated input data for story generation
+
+        Returns:
+            Output schema with the generated story and its scenes
         """
         try:
-            logger.info(f"Executing generate story tool for user: {input_data.username}")
             logger.info(f"Prompt: {input_data.prompt}")
-            
-            llm_client = get_model()
-            prompt_type = "summarize" 
-            prompt = self.prompts[prompt_type]
-            logger.info(f"Using prompt type: {prompt_type}")
-            
-            # Format the prompt with input data
-            formatted_prompt = f"{prompt['system']}\n\n{prompt['human'].format(prompt=input_data.prompt, username=input_data.username, age_group=input_data.age_group, genre=input_data.genre, scene_count=input_data.scene_count)}"
-            
-            logger.info(f"Executing LLM with formatted prompt")
-            try:
-                result = await llm_client.invoke(formatted_prompt)
-                logger.info(f"LLM response received, length: {len(result)}")
-            
-                # Check if result is empty or None
-                if not result or result.strip() == "":
-                    logger.warning("LLM returned empty response, using fallback")
-                    return await self._generate_story_with_images(input_data)
-                
-                # Parse the LLM response to get story structure
-                try:
-                    logger.info("Parsing LLM response as JSON")
-                    story_data = json.loads(result)
-                    logger.info("Successfully parsed LLM response")
-                    
-                    # Generate images for each scene
-                    scenes = story_data.get('scenes', [])
-                    logger.info(f"Generating images for {scenes} scenes")
-                    for scene in scenes: 
-                        scene_text = scene.get('story_text', '')
-                        if scene_text:
-                            # Generate image for this scene
-                            logger.info(f"Generating image for scene {scene.get('scene_number', 'unknown')}")
-                            image_data = await image_generator.generate_image(
-                                prompt=scene_text,
-                                style=story_data.get('animated','theme', 'digital art')
-                            )
-                            if image_data:
-                                scene['image'] = image_data
-                            else:
-                                # Fallback if image generation fails
-                                scene['image'] = await image_generator.generate_image(
-                                    prompt=input_data.prompt,
-                                    style='digital art'
-                                )
-                        scene_image = scene.get('image', None)
-                        if scene_image:
-                            scene['image'] = scene_image
-                        else:
-                            scene['image'] = await image_generator.generate_image(
-                                    prompt=input_data.prompt,
-                                    style='digital art'
-                                )
-
-                    logger.info("All scene images generated successfully")
-                    logger.info(f"Story data: {story_data}")
-                    # Return the enhanced story with images
-                    return OutputSchema(result=json.dumps(story_data))
-                    
-                except json.JSONDecodeError as parse_error:
-                    logger.warning(f"Failed to parse LLM response as JSON: {parse_error}")
-                    logger.warning(f"Raw LLM response: {result}")
-                    
-                    # Try to extract JSON from the response (sometimes LLM adds extra text)
-                    try:
-                        # Look for JSON-like content between curly braces
-                        import re
-                        json_match = re.search(r'\{.*\}', result, re.DOTALL)
-                        if json_match:
-                            json_str = json_match.group(0)
-                            
-                            # Fix common LLM JSON issues
-                            # 1. Add missing commas between array elements (scenes)
-                            json_str = re.sub(r'}\s*{\s*"scene_number"', '},{"scene_number"', json_str)
-                            # 2. Fix missing commas in object arrays
-                            json_str = re.sub(r'}\s*}\s*]', '}]', json_str)
-                            # 3. Fix trailing commas
-                            json_str = re.sub(r',\s*}', '}', json_str)
-                            json_str = re.sub(r',\s*]', ']', json_str)
-                            
-                            story_data = json.loads(json_str)
-                            logger.info("Successfully extracted and fixed JSON from LLM response")
-                        else:
-                            raise ValueError("No JSON found in response")
-                    except Exception as extract_error:
-                        logger.warning(f"Failed to extract JSON from response: {extract_error}")
-                        # Generate a simple story with images
-                        return await self._generate_story_with_images(input_data)
-                    
-            except Exception as llm_error:
-                logger.warning(f"LLM call failed, using fallback: {str(llm_error)}")
-                # Generate a simple story with images
-                return await self._generate_story_with_images(input_data)
 
+            story_data: Dict[str, Any] = {}
+            async for event in self._story_events(input_data):
+                if event["event"] == "done":
+                    story_data = event["story"]
+
+            logger.info(f"Story generated: {story_data.get('title')}")
+            # Return the enhanced story with images
+            return self._build_output(story_data, input_data)
+
+        except ModelOverloadedError as e:
+            logger.warning(f"Shedding story request for user {input_data.username}: {str(e)}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+        except ExecutorOverloadedError as e:
+            logger.warning(f"Shedding story request for user {input_data.username}: {str(e)}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(IMAGE_RETRY_AFTER)})
         except Exception as e:
             logger.error(f"Error executing generate story tool: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to execute tool: {str(e)}")
 
+    async def stream(self, input_data: GenerateStoryRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a story and yield it progressively as events.
+
+        Events are dictionaries with an ``event`` key: ``title`` as soon as the title
+        is known, one ``scene`` per scene with its text, one ``image`` per scene as each
+        image becomes ready (in completion order), and finally ``done``. An ``error``
+        event is emitted if generation fails.
+
+        Args:
+            input_data: Validated input data for story generation
+
+        Yields:
+            Story events
+        """
+        try:
+            logger.info(f"Streaming story for user: {input_data.username}")
+            async for event in self._story_events(input_data):
+                if event["event"] == "done":
+                    event = {"event": "done", "scene_count": len(event["story"]["scenes"])}
+                yield event
+
+        except ModelOverloadedError as e:
+            logger.warning(f"Shedding story stream for user {input_data.username}: {str(e)}")
+            yield {"event": "error", "error": str(e), "retry_after": e.retry_after}
+        except ExecutorOverloadedError as e:
+            logger.warning(f"Shedding story stream for user {input_data.username}: {str(e)}")
+            yield {"event": "error", "error": str(e), "retry_after": IMAGE_RETRY_AFTER}
+        except Exception as e:
+            logger.error(f"Error streaming story: {str(e)}")
+            yield {"event": "error", "error": f"Failed to generate story: {str(e)}"}
+
+    async def _story_events(self, input_data: GenerateStoryRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a story, yielding events as its parts become available.
+
+        The LLM output is parsed incrementally, so each scene's image starts rendering
+        as soon as the scene is complete while the LLM is still writing later scenes.
+        If the LLM fails or its output has no parseable scenes, the fallback story is
+        used. The final ``done`` event carries the complete story with images.
+
+        Args:
+            input_data: Validated input data for story generation
+
+        Yields:
+            ``title``, ``scene`` and ``image`` events, then ``done`` with the story
+        """
+        semaphore = asyncio.Semaphore(self.image_settings["max_concurrency"])
+        pending: Set[asyncio.Task] = set()
+        story_data: Dict[str, Any] = {}
+        scenes: List[Dict[str, Any]] = []
+        title_sent = False
+
+        def add_scene(scene: Dict[str, Any]) -> Dict[str, Any]:
+            scenes.append(scene)
+            scene.setdefault('scene_number', len(scenes))
+            pending.add(asyncio.create_task(self._render_scene_image(
+                scene,
+                style=story_data.get('theme', 'digital art'),
+                fallback_prompt=input_data.prompt,
+                semaphore=semaphore
+            )))
+            return {
+                "event": "scene",
+                "scene_number": scene['scene_number'],
+                "story_text": scene.get('story_text', ''),
+            }
+
+        def image_event(scene: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "event": "image",
+                "scene_number": scene['scene_number'],
+                "image": scene.get('image'),
+                "image_url": scene.get('image_url'),
+            }
+
+        def title_event() -> Dict[str, Any]:
+            return {"event": "title", "title": story_data.get('title', f"Adventure of {input_data.prompt}")}
+
+        try:
+            parser = IncrementalJSONParser(array_key="scenes")
+            try:
+                async for chunk in self._iter_llm_text(input_data):
+                    for parsed in parser.feed(chunk):
+                        if parsed.kind == "field":
+                            story_data[parsed.key] = parsed.value
+                            if parsed.key == "title" and not title_sent:
+                                title_sent = True
+                                yield title_event()
+                        elif isinstance(parsed.value, dict):
+                            yield add_scene(parsed.value)
+
+                    # Report images that finished while the LLM is still writing
+                    for task in [task for task in pending if task.done()]:
+                        pending.discard(task)
+                        yield image_event(task.result())
+            except ModelOverloadedError:
+                # Shed load instead of serving a fallback story
+                raise
+            except Exception as llm_error:
+                logger.warning(f"LLM call failed, using fallback: {str(llm_error)}")
+
+            logger.info(f"LLM response received, length: {len(parser.text)}")
+            source = "llm"
+            if not scenes:
+                parsed_story = None
+                if parser.text.strip():
+                    parsed_story = self._parse_story_text(parser.text)
+                else:
+                    logger.warning("LLM returned empty response, using fallback")
+                if not parsed_story or not parsed_story.get('scenes'):
+                    source = "fallback"
+                    parsed_story = self._build_fallback_story_data(input_data)
+
+                story_data.update({key: value for key, value in parsed_story.items() if key != 'scenes'})
+                if not title_sent:
+                    title_sent = True
+                    yield title_event()
+                for scene in parsed_story['scenes']:
+                    yield add_scene(scene)
+            if source == "llm" and len(scenes) < input_data.scene_count:
+                source = "llm_partial"
+            _story_outputs.inc(source=source)
+
+            if not title_sent:
+                yield title_event()
+
+            logger.info(f"Waiting for images of {len(pending)} scenes")
+            for next_done in asyncio.as_completed(pending):
+                yield image_event(await next_done)
+            pending.clear()
+
+            story_data['scenes'] = scenes
+            generated = sum(1 for scene in scenes if scene.get('image') or scene.get('image_url'))
+            logger.info(f"Generated images for {generated}/{len(scenes)} scenes")
+            yield {"event": "done", "story": story_data}
+
+        finally:
+            # Stop outstanding renders if the consumer goes away early
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+    def _build_output(self, story_data: Dict[str, Any], input_data: GenerateStoryRequest) -> OutputSchema:
+        """
+        Convert the story dictionary assembled from the LLM output into the output schema.
+
+        Values the LLM left out or returned with the wrong type are replaced with
+        defaults, so a loosely formatted story never fails validation.
+
+        Args:
+            story_data: Story dictionary from the ``done`` event
+            input_data: Validated input data for story generation
+
+        Returns:
+            Output schema with the story and its scenes
+        """
+        def optional_text(value: Any) -> Optional[str]:
+            return str(value) if value is not None else None
+
+        scenes = []
+        for index, scene in enumerate(story_data.get('scenes', []), 1):
+            try:
+                scene_number = int(scene.get('scene_number', index))
+            except (TypeError, ValueError):
+                scene_number = index
+            scenes.append(GeneratedScene(
+                scene_number=scene_number,
+                story_text=str(scene.get('story_text') or ''),
+                image=scene.get('image'),
+                image_url=scene.get('image_url'),
+            ))
+
+        return OutputSchema(
+            title=str(story_data.get('title') or f"Adventure of {input_data.prompt}"),
+            theme=optional_text(story_data.get('theme')),
+            target_age=optional_text(story_data.get('target_age')),
+            scenes=scenes,
+        )
+
+    async def _iter_llm_text(self, input_data: GenerateStoryRequest) -> AsyncIterator[str]:
+        """
+        Invoke the LLM for a story and yield its output text as it is generated.
+
+        Args:
+            input_data: Validated input data for story generation
+
+        Yields:
+            Chunks of the LLM response
+        """
+        llm_client = get_model()
+        prompt_type = "summarize" 
+        prompt = self.prompts[prompt_type]
+        logger.info(f"Using prompt type: {prompt_type}")
+        
+        # Format the prompt with input data
+        human_prompt = prompt.render(prompt=input_data.prompt, username=input_data.username, age_group=input_data.age_group, genre=input_data.genre, scene_count=input_data.scene_count)
+        
+        # Wait for a model slot; fails fast with ModelOverloadedError when saturated
+        limiter = get_limiter()
+        async with limiter.slot(input_data.username) if limiter else contextlib.nullcontext():
+            logger.info(f"Executing LLM with formatted prompt")
+            if isinstance(llm_client, OllamaClient):
+                options = {"temperature": input_data.temperature} if input_data.temperature is not None else None
+                # The system message is identical for every story, so Ollama can
+                # reuse its cached evaluation and only process the user turn
+                messages = [
+                    {"role": "system", "content": prompt.system},
+                    {"role": "user", "content": human_prompt},
+                ]
+                response_format = self._story_format(input_data.scene_count)
+                async for chunk in llm_client.astream_chat(messages, options=options, response_format=response_format):
+                    yield chunk
+            else:
+                if input_data.temperature is not None:
+                    llm_client = llm_client.bind(temperature=input_data.temperature)
+                message = await llm_client.ainvoke(f"{prompt.system}\n\n{human_prompt}")
+                yield getattr(message, "content", message)
+
+    def _parse_story_text(self, result: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the complete LLM output into a story dictionary.
+
+        Malformed output (surrounding prose, missing or trailing commas, output cut
+        off mid-story) is repaired where possible; scenes that were written in full
+        are kept even if others are missing or unreadable.
+
+        Args:
+            result: Full LLM response text
+
+        Returns:
+            The parsed story dictionary, or None if it could not be parsed
+        """
+        try:
+            parsed = parse_json_tolerant(result)
+        except ValueError as parse_error:
+            logger.warning(f"Failed to parse LLM response as JSON: {parse_error}")
+            logger.warning(f"Raw LLM response: {result}")
+            return None
+
+        if parsed.repairs or parsed.truncated:
+            logger.warning(
+                f"Repaired LLM response (repairs: {parsed.repairs}, truncated: {parsed.truncated})"
+            )
+        story_data = parsed.value
+        if not isinstance(story_data, dict):
+            return None
+
+        scenes = story_data.get('scenes')
+        if isinstance(scenes, list):
+            # A scene whose text (or other value) was cut off mid-way is incomplete
+            cut = parsed.truncated_at or ()
+            cut_scene = cut[1] if len(cut) >= 3 and cut[0] == 'scenes' else None
+            complete = [
+                scene for index, scene in enumerate(scenes)
+                if index != cut_scene
+                and isinstance(scene, dict) and isinstance(scene.get('story_text'), str) and scene['story_text'].strip()
+            ]
+            if len(complete) < len(scenes):
+                logger.warning(f"Dropped {len(scenes) - len(complete)} incomplete scenes from LLM response")
+            story_data['scenes'] = complete
+        return story_data
+
     async def _generate_story_with_llm(self, request: GenerateStoryRequest) -> Story:
         """
         Generate a story using LLM with proper prompt engineering
@@ -391,96 +647,139 @@ class GenerateStoryTool(ToolInterface):
         """Get the FastAPI router for this tool"""
         return self.router
     
-    async def _generate_story_with_images(self, input_data: GenerateStoryRequest) -> OutputSchema:
+    def _build_fallback_story_data(self, input_data: GenerateStoryRequest) -> Dict[str, Any]:
         """
-        Generate a simple story with images when LLM fails
+        Build a simple text-only story used when the LLM fails
         """
-        try:
-            scenes = []
-            scene_descriptions = [
-                f"Scene 1: The beginning of {input_data.prompt}",
-                f"Scene 2: The adventure continues with {input_data.prompt}",
-                f"Scene 3: A challenge appears in {input_data.prompt}",
-                f"Scene 4: Overcoming obstacles in {input_data.prompt}",
-                f"Scene 5: The happy ending of {input_data.prompt}"
-            ]
-            
-            for i, description in enumerate(scene_descriptions, 1):
-                # Generate image for each scene
-                image_data = await image_generator.generate_image(
-                    prompt=description,
-                    style=input_data.genre
-                )
-                
-                scenes.append({
-                    "scene_number": i,
-                    "story_text": description,
-                    "image": image_data
-                })
-            
-            story_data = {
-                "title": f"Adventure of {input_data.prompt}",
-                "theme": input_data.genre,
-                "target_age": f"{input_data.age_group} years",
-                "scenes": scenes
-            }
-            
-            logger.info(f"Generated simple story with {story_data} scenes")
+        scene_descriptions = [
+            f"Scene 1: The beginning of {input_data.prompt}",
+            f"Scene 2: The adventure continues with {input_data.prompt}",
+            f"Scene 3: A challenge appears in {input_data.prompt}",
+            f"Scene 4: Overcoming obstacles in {input_data.prompt}",
+            f"Scene 5: The happy ending of {input_data.prompt}"
+        ]
 
-            return OutputSchema(result=json.dumps(story_data))
-            
-        except Exception as e:
-            logger.error(f"Error generating story with images: {str(e)}")
-            # Ultimate fallback - return basic structure
-            fallback_result = {
-                "title": f"Story of {input_data.prompt}",
-                "theme": "adventure",
-                "target_age": "5-10 years",
-                "scenes": [
-                    {
-                        "scene_number": 1,
-                        "story_text": f"A beautiful scene showing {input_data.prompt}",
-                        "image": await image_generator.generate_image(input_data.prompt, "digital art")
-                    }
-                ]
-            }
-            return OutputSchema(result=json.dumps(fallback_result))
+        return {
+            "title": f"Adventure of {input_data.prompt}",
+            "theme": input_data.genre,
+            "target_age": f"{input_data.age_group} years",
+            "scenes": [
+                {"scene_number": i, "story_text": description}
+                for i, description in enumerate(scene_descriptions, 1)
+            ]
+        }
 
-    def _load_prompts(self) -> Dict[str, Any]:
+    async def _render_scene_image(
+        self,
+        scene: Dict[str, Any],
+        style: str,
+        fallback_prompt: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
         """
-        Load prompts from YAML files in the prompts directory.
+        Generate the image for one scene.
+
+        At most ``images.max_concurrency`` renders sharing ``semaphore`` are in flight
+        at once and each attempt is bounded by ``images.scene_timeout`` seconds. A scene
+        whose image fails or times out is retried once with the story prompt; if that
+        also fails its image is set to None so the other scenes are unaffected.
+
+        With ``images.delivery = "url"`` the image is stored in the blob store and the
+        scene gets an ``image_url`` pointing at ``/images/{hash}``; otherwise the scene
+        gets an inline base64 data URI under ``image``.
+
+        Args:
+            scene: Scene dictionary, updated in place with an ``image_url`` or ``image`` key
+            style: Artistic style for the scene image
+            fallback_prompt: Prompt used when the scene's own image cannot be generated
+            semaphore: Semaphore bounding concurrent renders for the story
 
         Returns:
-            Dictionary mapping prompt types to prompt templates
+            The updated scene dictionary
         """
-        prompts = {}
-        prompts_dir = Path(__file__).parent / "prompts"
+        timeout = self.image_settings["scene_timeout"]
+        deliver_url = self.image_settings.get("delivery") == "url"
 
-        if not prompts_dir.exists():
-            raise ValueError("Prompts directory not found for the tool")
+        async def render(prompt: str, image_style: str) -> Optional[str]:
+            if not deliver_url:
+                return await image_generator.generate_image(prompt=prompt, style=image_style)
+            image_bytes = await image_generator.generate_image_bytes(prompt=prompt, style=image_style)
+            if image_bytes is None:
+                return None
+            digest = await get_blob_store().aput(image_bytes, sniff_mime_type(image_bytes))
+            return f"/images/{digest}"
 
-        # Load each YAML file in the prompts directory
-        for prompt_file in prompts_dir.glob("*.yaml"):
+        async def attempt(prompt: str, image_style: str) -> Optional[str]:
             try:
-                with open(prompt_file, "r") as f:
-                    prompt_data = yaml.safe_load(f)
+                return await asyncio.wait_for(render(prompt, image_style), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Image generation timed out after {timeout}s")
+            except ExecutorOverloadedError:
+                # Overload fails the request instead of degrading to a missing image
+                raise
+            except Exception as e:
+                logger.warning(f"Image generation failed: {str(e)}")
+            return None
 
-                prompt_type = prompt_file.stem  # Use filename as prompt type
+        scene_number = scene.get('scene_number', 'unknown')
+        async with semaphore:
+            logger.info(f"Generating image for scene {scene_number}")
+            image_data = None
+            scene_text = scene.get('story_text', '')
+            if scene_text:
+                image_data = await attempt(scene_text, style)
+            if not image_data:
+                # Fallback if image generation fails
+                image_data = await attempt(fallback_prompt, 'digital art')
+        if not image_data:
+            logger.error(f"No image could be generated for scene {scene_number}")
+        if deliver_url:
+            scene['image_url'] = image_data
+        else:
+            scene['image'] = image_data
+        return scene
 
-                if "system" in prompt_data:
-                    prompt_data["system"] = textwrap.dedent(prompt_data["system"]).strip()
-                if "human" in prompt_data:
-                    prompt_data["human"] = textwrap.dedent(prompt_data["human"]).strip()
+    def _load_image_settings(self) -> Dict[str, Any]:
+        """
+        Load image generation settings from the tool configuration.
 
-                prompts[prompt_type] = prompt_data
-            except Exception as e:
-                raise ValueError(f"Error loading prompt file {prompt_file}: {str(e)}")
+        Returns:
+            Dictionary with ``max_concurrency``, ``scene_timeout`` and ``delivery`` values
+        """
+        images_config = get_config().get_tool_config("generate_story").get("images", {})
+        delivery = images_config.get("delivery", "url")
+        if delivery not in ("url", "inline"):
+            logger.warning(f"Unknown image delivery mode {delivery!r}, using url")
+            delivery = "url"
+        return {
+            "max_concurrency": max(1, int(images_config.get("max_concurrency", 4))),
+            "scene_timeout": float(images_config.get("scene_timeout", 90)),
+            "delivery": delivery,
+        }
 
-        if not prompts:
-            raise ValueError("No valid prompts found")
+    def _load_structured_output(self) -> bool:
+        """
+        Load whether the LLM's output is constrained to the story JSON schema.
 
-        return prompts
+        Returns:
+            The ``llm.structured_output`` setting of the tool configuration
+        """
+        llm_config = get_config().get_tool_config("generate_story").get("llm", {})
+        return bool(llm_config.get("structured_output", True))
 
+    def _story_format(self, scene_count: int) -> Optional[Dict[str, Any]]:
+        """
+        Build the JSON schema the LLM's story must conform to.
 
-# Create tool instance
-generate_story_tool = GenerateStoryTool()
+        Args:
+            scene_count: Number of scenes the story must have
+
+        Returns:
+            The LLMStory schema requiring exactly ``scene_count`` scenes, or None
+            when structured output is disabled
+        """
+        if not self.structured_output:
+            return None
+        schema = llm_story_schema()
+        scenes = {**schema["properties"]["scenes"], "minItems": scene_count, "maxItems": scene_count}
+        return {**schema, "properties": {**schema["properties"], "scenes": scenes}}
@@ -1,12 +1,9 @@
-import textwrap
-import yaml
 from pathlib import Path
-from typing import Dict, Any
 
-from langchain.prompts import ChatPromptTemplate
 from langchain.schema.output_parser import StrOutputParser
 
 from app.core.interfaces import ToolInterface
+from app.core.prompts import get_prompt_registry
 from app.llm.manager import get_model
 from .schemas import InputSchema, OutputSchema
 
@@ -19,7 +16,9 @@ class TextProcessorTool(ToolInterface):
 
     def __init__(self):
         """Initialize the tool and load prompts."""
-        self.prompts = self._load_prompts()
+        self.prompts = get_prompt_registry().register(
+            Path(__file__).parent / "prompts", placeholders=("text", "max_length")
+        )
 
     @classmethod
     def get_input_schema(cls):
@@ -51,20 +50,14 @@ class TextProcessorTool(ToolInterface):
 
         prompt = self.prompts[prompt_type]
 
-        # Build the LangChain chain
-        chain = (
-            ChatPromptTemplate.from_messages(
-                [("system", prompt["system"]), ("human", prompt["human"])]
-            )
-            | llm_client
-            | StrOutputParser()
-        )
-
-        # Format the prompt with the input text
-        formatted_prompt = {"text": input_data.text, "max_length": input_data.max_length}
+        # The template is compiled once by the prompt registry
+        messages = [
+            ("system", prompt.system),
+            ("human", prompt.render(text=input_data.text, max_length=input_data.max_length)),
+        ]
 
         # Execute the chain
-        result = await chain.ainvoke(formatted_prompt)
+        result = await (llm_client | StrOutputParser()).ainvoke(messages)
 
         # Return the result
         return OutputSchema(
@@ -72,38 +65,3 @@ class TextProcessorTool(ToolInterface):
             original_length=len(input_data.text),
             processed_length=len(result),
         )
-
-    def _load_prompts(self) -> Dict[str, Any]:
-        """
-        Load prompts from YAML files in the prompts directory.
-
-        Returns:
-            Dictionary mapping prompt types to prompt templates
-        """
-        prompts = {}
-        prompts_dir = Path(__file__).parent / "prompts"
-
-        if not prompts_dir.exists():
-            raise ValueError("Prompts directory not found for the tool")
-
-        # Load each YAML file in the prompts directory
-        for prompt_file in prompts_dir.glob("*.yaml"):
-            try:
-                with open(prompt_file, "r") as f:
-                    prompt_data = yaml.safe_load(f)
-
-                prompt_type = prompt_file.stem  # Use filename as prompt type
-
-                if "system" in prompt_data:
-                    prompt_data["system"] = textwrap.dedent(prompt_data["system"]).strip()
-                if "human" in prompt_data:
-                    prompt_data["human"] = textwrap.dedent(prompt_data["human"]).strip()
-
-                prompts[prompt_type] = prompt_data
-            except Exception as e:
-                raise ValueError(f"Error loading prompt file {prompt_file}: {str(e)}")
-
-        if not prompts:
-            raise ValueError("No valid prompts found")
-
-        return prompts
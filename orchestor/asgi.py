@@ -0,0 +1,305 @@
+"""
+TinyTales Orchestor API - ASGI mode
+
+Async counterpart of the Flask app in app.py. Handlers are native coroutines and
+share one pooled httpx.AsyncClient that is opened and closed by the application
+lifespan, so a single process can hold many in-flight story requests without
+tying up a worker thread per request.
+
+Run with:
+    uvicorn asgi:app --port 3001
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import httpx
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from stories import (
+    build_llm_request,
+    transform_llm_response,
+    build_fallback_story,
+    build_stream_start_event,
+    StreamedStory,
+    encode_stream_event,
+    busy_response_headers,
+    image_request_headers,
+    image_response_headers,
+    parse_temperature,
+)
+from story_store import (
+    cache_first_enabled,
+    create_story_store,
+    is_deterministic,
+    request_fingerprint,
+)
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+PORT = int(os.getenv('PORT', 3001))
+LLM_API_URL = os.getenv('LLM_API_URL', 'http://localhost:8000')
+LLM_API_TIMEOUT = float(os.getenv('LLM_API_TIMEOUT', 60))
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', 100))
+STORY_CACHE_FIRST = cache_first_enabled()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the pooled LLM client and the story store on startup and close them on shutdown"""
+    app.state.story_store = create_story_store()
+    app.state.llm_client = httpx.AsyncClient(
+        base_url=LLM_API_URL,
+        timeout=LLM_API_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_CONNECTIONS
+        )
+    )
+    try:
+        yield
+    finally:
+        await app.state.llm_client.aclose()
+        app.state.story_store.close()
+
+
+async def save_story(store, story, fingerprint=None):
+    """Persist a story, logging rather than failing the request on errors"""
+    try:
+        await asyncio.to_thread(store.put, story, fingerprint)
+    except Exception as e:
+        print(f'Story store error: {str(e)}')
+
+
+app = FastAPI(title='TinyTales Orchestor API', lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=['*'],
+    allow_methods=['*'],
+    allow_headers=['*'],
+)
+
+
+@app.get('/health')
+async def health_check():
+    """Health check endpoint"""
+    return {
+        'success': True,
+        'message': 'TinyTales Orchestor API is running',
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+@app.post('/createstory')
+async def create_story(request: Request):
+    """Create a new story based on user prompt"""
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+
+        if not data:
+            return JSONResponse({
+                'success': False,
+                'error': 'No data provided'
+            }, status_code=400)
+
+        username = data.get('username')
+        prompt = data.get('prompt')
+
+        # Validate input
+        if not username or not prompt:
+            return JSONResponse({
+                'success': False,
+                'error': 'Username and prompt are required'
+            }, status_code=400)
+
+        try:
+            temperature = parse_temperature(data)
+        except ValueError as e:
+            return JSONResponse({
+                'success': False,
+                'error': str(e)
+            }, status_code=400)
+
+        story_store = request.app.state.story_store
+        llm_request = build_llm_request(username, prompt, temperature)
+        fingerprint = request_fingerprint(llm_request)
+
+        # Deterministic requests replay the stored story instead of regenerating it
+        if STORY_CACHE_FIRST and is_deterministic(llm_request):
+            cached_story = await asyncio.to_thread(story_store.get_by_fingerprint, fingerprint)
+            if cached_story is not None:
+                return {
+                    'success': True,
+                    'data': cached_story
+                }
+
+        # Call LLM framework API
+        try:
+            response = await request.app.state.llm_client.post(
+                '/generate-story',
+                json=llm_request
+            )
+
+            print(f"LLM API response status: {response}")
+
+            # The LLM framework is at capacity; let the client retry later
+            if response.status_code == 429:
+                return JSONResponse({
+                    'success': False,
+                    'error': 'Story service is busy, please try again shortly'
+                }, status_code=429, headers=busy_response_headers(response.headers))
+
+            if response.status_code != 200:
+                raise Exception(f"LLM API HTTP error: {response.status_code}")
+
+            story_data = transform_llm_response(response.json(), username, prompt)
+            await save_story(story_store, story_data, fingerprint)
+
+            return {
+                'success': True,
+                'data': story_data
+            }
+
+        except Exception as llm_error:
+            print(f'LLM API error: {str(llm_error)}')
+            # Fallback to mock response if LLM API fails; it is stored by id
+            # only so it is never replayed for a later request
+            story_data = build_fallback_story(username, prompt)
+            await save_story(story_store, story_data)
+            return {
+                'success': True,
+                'data': story_data
+            }
+
+    except Exception as e:
+        print(f'Error creating story: {str(e)}')
+        return JSONResponse({
+            'success': False,
+            'error': 'Internal server error'
+        }, status_code=500)
+
+
+@app.post('/createstory/stream')
+async def create_story_stream(request: Request):
+    """Create a story and relay it as newline-delimited JSON events"""
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+
+    username = data.get('username') if data else None
+    prompt = data.get('prompt') if data else None
+
+    # Validate input
+    if not username or not prompt:
+        return JSONResponse({
+            'success': False,
+            'error': 'Username and prompt are required'
+        }, status_code=400)
+
+    try:
+        temperature = parse_temperature(data)
+    except ValueError as e:
+        return JSONResponse({
+            'success': False,
+            'error': str(e)
+        }, status_code=400)
+
+    llm_client = request.app.state.llm_client
+    story_store = request.app.state.story_store
+    llm_request = build_llm_request(username, prompt, temperature)
+
+    async def relay():
+        start_event = build_stream_start_event(username, prompt)
+        streamed = StreamedStory(start_event)
+        saved = False
+        yield encode_stream_event(start_event)
+        try:
+            async with llm_client.stream(
+                'POST',
+                '/generate-story/stream',
+                json=llm_request
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(f"LLM API HTTP error: {response.status_code}")
+                async for chunk in response.aiter_raw():
+                    streamed.feed(chunk)
+                    # Store the story before relaying "done", so the advertised id
+                    # resolves by the time the client sees the stream finish
+                    if streamed.done and not saved:
+                        saved = True
+                        await save_story(story_store, streamed.story(), request_fingerprint(llm_request))
+                    yield chunk
+        except Exception as llm_error:
+            print(f'LLM API stream error: {str(llm_error)}')
+            yield encode_stream_event({'event': 'error', 'error': 'Story generation failed'})
+
+    return StreamingResponse(
+        relay(),
+        media_type='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.get('/story/{story_id}')
+async def get_story(story_id: str, request: Request):
+    """Get a previously generated story by id"""
+    story = await asyncio.to_thread(request.app.state.story_store.get, story_id)
+    if story is None:
+        return JSONResponse({
+            'success': False,
+            'error': 'Story not found'
+        }, status_code=404)
+
+    return {
+        'success': True,
+        'data': story
+    }
+
+
+@app.get('/images/{digest}')
+async def get_image(digest: str, request: Request):
+    """Relay a generated scene image from the LLM framework"""
+    try:
+        response = await request.app.state.llm_client.get(
+            f'/images/{digest}',
+            headers=image_request_headers(request.headers)
+        )
+    except httpx.HTTPError as e:
+        print(f'LLM API image error: {str(e)}')
+        return JSONResponse({
+            'success': False,
+            'error': 'Image unavailable'
+        }, status_code=502)
+
+    if response.status_code not in (200, 304):
+        return JSONResponse({
+            'success': False,
+            'error': 'Image not found'
+        }, status_code=404)
+
+    return Response(
+        response.content,
+        status_code=response.status_code,
+        headers=image_response_headers(response.headers)
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_error(request: Request, exc: StarletteHTTPException):
+    """Handle HTTP errors with the same envelope as the Flask app"""
+    error = 'Endpoint not found' if exc.status_code == 404 else exc.detail
+    return JSONResponse({
+        'success': False,
+        'error': error
+    }, status_code=exc.status_code)
@@ -12,14 +12,21 @@ load_dotenv()
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app
-
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 3001))
     debug = os.getenv('FLASK_ENV') == 'development'
+    # "asgi" serves the async FastAPI app with uvicorn, anything else the Flask app
+    mode = os.getenv('ORCHESTRATOR_MODE', 'flask').lower()
     
-    print(f'🚀 Starting TinyTales Orchestor API on port {port}')
+    print(f'🚀 Starting TinyTales Orchestor API on port {port} ({mode} mode)')
     print(f'📊 Health check: http://localhost:{port}/health')
     print(f'📝 Create story: POST http://localhost:{port}/createstory')
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    if mode == 'asgi':
+        import uvicorn
+
+        uvicorn.run('asgi:app', host='0.0.0.0', port=port, reload=debug)
+    else:
+        from app import app
+
+        app.run(host='0.0.0.0', port=port, debug=debug)
@@ -0,0 +1,225 @@
+"""
+Story helpers shared by the Flask and ASGI orchestrator apps.
+
+Builds the request sent to the LLM framework, transforms its response into the
+format expected by the web client, and provides the fallback story returned when
+the LLM framework is unavailable.
+"""
+import json
+import uuid
+from datetime import datetime
+
+# Image response headers relayed from the LLM framework so browser caching works
+IMAGE_RESPONSE_HEADERS = ('Content-Type', 'Content-Length', 'ETag', 'Cache-Control')
+
+# Scenes returned when the LLM framework cannot be reached
+FALLBACK_SCENES = [
+    {
+        "scene_number": 1,
+        "story_text": "Scene 1: The beginning of Generate a bedtime picture story of a rabbit and the moon",
+        "image": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAIAAAB7GkOtAAAl80lEQVR4nO3dB3hUVfrH8XunZCY9hITQEQQUEF2RIhAQaSpi6CCCohRBpCqrggUbWBAEEZCNYkVdhAVkFZAisNSACCq9KNIC6ZlMJpl2/8/kwjhMAgsJ+2fd9/t54jzzzJx7zr03cn9zZibnVV/bmaYAAOQxXOsdAABcGwQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhlUq/1HgAArglmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZVJXl4ABAImYAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQplYCg4AZGIGAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIJRJVVkODgAkYgYAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZWAkIAGRiBgAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUSVVZDg4AJGIGAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIJSJpeAAQCZmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZVJXl4ABAImYAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQplYCg4AZGIGAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCmVSV1YAAQCJmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZWAoOAGRiBgAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUSVVZDg4AJGIGAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIJSJpeAAQCZmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZVJXl4ABAImYAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUiZWAAEAmZgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCmVSV5eAAQCJmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEKZWAoOAGRiBgAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAwJ9G6tGDK99/+9jPO1e+/7bDlnutdwd/egQAyur3vbtmDO7yWq/WTzav8eYD7WYMSspKPXEV+8+35Xw8YdjoJpU+njBsTNPKgU/tWr1s2oB7Xk5qOqxB1NhmVYc1iHopqcnwhjE7v1sytlmVy+lcb3aZjXWnDu9b/+X7+u1/bpMSvTeq73XVKof9mhIdE20wmcrSFaAoivreXtu13gf8ub3arcUr85ddX3gqrnJ1W1bG4h+PrPrqsyHTPr5a/b/Vv2Prbn3vqB7dq8/95ePj3952MvDZmpGmhrHmwzu3JCYmbty4sXaj5uOGPfLhRx/HxMQEtSzR2GZVsrOzL7OxXzmLoVKYcW+W6z+6SXFjmlQ+fPTo21PePGWKbdrtodDIqLL0BhAAKKtxLa9L2br1nrs6nM3I6v/Qw127JI0Y97TBaDx77Gh89VqmkJDw6Ni8rIzUowfKV65mslh7PjV5xuCkNn0fXfnB2+ExsREx5Q0mU8dHRu/ZuDor9WRgs+sa3qYoypnfDnW5LuyD92ZPfu21yIiI+i3ajkpe8s6QrqOSl+xavWztp7PzsjJOHd6Xk5MTHR1dqfaNpw/vt+XZIyPCI2LjIsvFqQbDXYPGXqzzxxpE2ez5EWGhMQmVo+MrGk2myNgK+bnZ/pb3DB23/otkW3pa9tnTuRlnGt/T86d1y92uwvELNrzWu7XJHBJ0IPc9PuHjZ4cFPdiy+0OL337hYpu0e+jxXau/Dhzil399N3Xzsdz0M588O9yek5V+/Ne4ajUL8vNOH96nx1WF6rX+On91ZPn4a/3Lx58bAYCymtCu3p4fd7Rr3+HwkSPlEyo1b5n424lT016fHB0V6fZ4Rj75lCUiesLYETVq1spJPblPiX2uf9KZY4ezs7LeeWdG5249VVfhPmd4/xb1x89f0TzOGNjsucWb9RlAu14Pzh0/3O4oiAgLfTvlVI968Yv2pVnDI/z78FiDqAK3x2oyztmTO6x+pN1RMH3a1KRe9xs9rp/zQx5KbHixzofVj8wvKJw185277uvqchb+9fmXcm15k1583t9yeLtbH31tVo/GN8bERO/ekdK1e/eY6GizxaJfiN0uV9CBPHpPy7zsjOIPFthzL7ZJvxb1hr+VHDTEu7vS5z01qMVdSb2aN4gID8uz53+1ZU/h3k2zZs/esH79kYqNXV7tmv7a8b/ApKosB4cy8bjdm0/krl29as36DcvXbPhi3tz5n3/x/ux3ln6zfNiIkY/07GINDZ349JPbtm6tXqPGsq+X2XMyXQUOo8FwNjW1ebNmCeVjNmz4l7Mgv6b92MQpswKbaV6vwWgcOuOzqLgEdcLjppAQRVH+NqZ/1Lyv/zam/+j3lxbfGf3/Z5PRkJ6e3rxZ0yoJ8WvXfn+JzhVFNRrUHTt2TJoyLemejqMG9k9PTw/c24I8W7s6FZNnzfh6xao2LZr16tXT7XJ6XE5FUQrybJqmBR1IXnZG8aPLy85wFxZcbBNXgaP4EKqq7t+6/oVRQ5PfnbFw6bIeXZKSunbrMXLO62+80aZNm7pNEke8t8gSFn4tfuH436HO3Zd3rfcBf2K2zPS1n87+11cfVr/+hsTGtzw+bOiSJUsHDRpY98Z6t97V3RQS8tN3i/fu3Xtg/76KNeumn/it3i231m9wU+qvh5wud4X4uBb3D1k+d6rD6bKajdl2x+4ftgc2e+nbH/0DDasfqb/Gn779tDU8osCeFzgD8D/73l7b0HoReue39x68Mnmaw+m0mk0X63xovYhClzsyPOz2bg/+uGLRoQMHXG7X0aNH/S0rRIWfzcyuXrVK4859Ni6YZ3c4LGazqqr6cJqmBR1IaIhZ07zFH1QU7WKbWM3GzNy8oCHm7ssb8Ze4s+np1apUubl90s9rlv1+4kS5yIhCj1c/zGv0C8f/FL4FhDJRVfXghuWvff7Nr/t/WbT0n527dnv00SFGoz6z1EzmkJycbMXrvfvuuxtcX6N1q8TBg4dkpvo+btVUQ3Z2doeBYzTfXd/L9kJ7XlAzr8dT4oj+24vRO79r8Niizg2X7lzTNI/HYzCZNU0rdBaajMbAlm6322g898/E4OsqeNygA9EU7WIPXmwTRVGMvrlI8BBFx6j6nNsBJuu4yggAlImmaa36DOxxS4269ernZWdGhoYeP348JWVb53s7/bh6WZPrK09+ddLuvfu7d+9uCQ3rO2DQmJGPD3h1tqKqvquZqoZFRvuvarv37AtqVvQWTbA5I/uaDeqckX0vuk9X1LmqGhStU6dOu1cv69G927p16zZv2RLY0hoesS1le+d7fQ26deumaF5f/xcfS73Yg5fcvW0pKcWHsIRHbNqytWuXpN2rl3XtkrRpy9bS/56AkvBVYpSJqqqLZ09p2/Hu5NnvlqtcI/XY4ZffnpV6/Lc5M2c+8/yLBU734GHD1u7c88K4sU8//2J+nm3FgdTNS+aHRkQqiqLfWotujSbz6oOpw0df0Kxxp57+gfRm1ojIx2Z+0aGKJW/mF4G74X/W3+1ldm4yh7g1pWev3pPeejsnJ2f0uKciIqNee/E5f0uP27146y+jRo8Z98yENSuXFzpdqqrq7z7pnQeNdekHS3xWVQ3Fh1AUpV7zO9cePvvYqLHjxj9nt9u/2rbfaDYHdgKUEQGAMokoV/7Bl2e+MPQhZ0F+5qnjCTXrGE0mt8vV88GH047/WrFm3ZDQ0GO//95/0NCzvx+Nr1bTGh7x4Mvvvtqj5UcH8/2dfHQw32yxfvNZ8lezsgKbBY2lbzJnZF/LB1/PGdl3zAdfF3+2xPuX6NxssbTr88i2ZV9Gx1eKSahsDQ+3Z2QG7m2fZ6e0qBYzatSoH7Zvb9KkcavWd1jDIxVF8w9R4riXfjB496zWkoZQevx10ifPDV/8Xlba8V/jq9UKi44xW6yB2wJlxIfAwKV8NH7oQ2OeaR5vNoVF5GWc3ZrhnTVh1LjPvvtzDQGUiBkAcCl39h827cmhHrf79NEDlWvfaDSHPDBx+p9uCKBEzAAAQCi+BQQAQhEAACAUAQAAQhEAACCUib8uBwCZmAEAgFAEAAAIRQAAgFAEAMpkw4J5k3vfMaFjw9FNq0zq2eqdod2zilZ7vupWJE/1316+0UVF5PXby2+sj7Lg9afXf1FUyf2LMlVy1+n9lNhb6Q4NKDv1b/wlMEpr7+a1qz6a+fykNxrEh5mtYWdTT3+6asumlcvGlFSrq4xGN628/kjaHdfHz0g5dUVb6YUYL2crf2NFUfSxPtmdWinUuDe7TJXcL6gLX1JvpTs0oOwIAJTe9MFduvbs06ZBzX4DB+VlZz/5xNi77+08eNS4qPiErNRTel11c1EF9umDk+58YOiK96eFx8RGlitvMJo6DhyzZ+OqzNMng5rd2j5p+7cLGyS2P3HgF4PB4PV6QqxhMQmV92353nd1jo6JiqtQoUbtwK1q3tz41OF9n00cmZt+Vm+f2HNA+wEjfAW/6kfqNd/LFdV8N5jMUeXj7Tnnar6bfTXf/7r+i+TcjLPZZ09npZ602e2R4eGqwVewJSY6WlHViUu3TerVymQOadShy+Yl82vd3OTEwT1mi6V85er2nKzEngNOH9kfdBQ1b26sX9Zb9Xpk9cfvRsclRMdX1LzeU4f3Pbto46SerW5q1TE348zZY0crVK+Vm3E2/eQxPXhUg+G9n7NHN608I+WU/1ZRFP2c3Noh6cxvh0Ks4cXHAkqHxeBQer/v3XVvi9cnjH8mvkadlr0SV27ZeV/vvmnHjz7wzKvNyhdVYD9zcr8S+2z/JLfL9dX0V96pFadXQt/vCu/XvP6zn68IbuZ0rvly3oK/dzydbTfVnNChdpxZ8aSFVkxqUu/FiRMjIyNXrlyx1R4atNULi7d8P3/usJemBbbXA0DTNIPBMGXKlPM131/Otdnenfamf/PH2t469LXZ3ZvcEBMd/cOWjUaTb8H982Ot7NKj5/hOt71hDnEVFq7+ct7fP2/XqlWrlONZnhP7ExMTDzutnW6u+dwX3xXfH0VR3E7nktlvzrnpug6dOruchX/fvGfqiH7jO932itdzR7e+XRvVjo6KdHs8n6zdHpdzzDfcihVdevQcUDds9PnTq9/3n5OTmTZ3jZEljgWUDp8BoPQK8mw3NWy4IyWlYs06v6z/7sf1K/s9+HDm6RM18o5NfPrJetUr9e7Z49aQPHv2BVXgu3RJal4hxFmQX0IzZ6FBVT6fP//zRUtj0g48OWZUYmJiXWuhLSNt4sSJNputY8eOVbMOBW3l9XhadH8wLvtXf3t7dub5fTxX871169Yzpk4ZNbDfsH49AzcvyLO1rZOQ/O6M1q1bL1myRP+7GP9YDluufphup9OoKHPmzGnbrl2f1o1mzpx5551tb4pWXYUFxY9CLzbpKiw0GtSUbVv1odvfUNHjdiuK4nG52tWp8P7sd1q3SlywcGGjWFPx4RRFcZy/9Z+TF58ZVy3naIljAaXDDABlYiiqXdXknp4vTn5D+213wybNY0PNXbr3uK5Gdb2uetXada2hYXq12w8//LB1USX08vEVNE0roZmmKaph1apV4dGx//zhlnr1G3Roe2dsXLymef11uLr36Xt97dqBWxmMxrmj+rXu0c/f3uP2v8+u+eptLV7cvNuDi5csevONN11uV506dfybGwxqy9ub9e3ZvXHnPv9cME87X3DYGh5xYdlhTTEYduzY4fF4PF5t+/btmqbFxMaVeBTnK1leMPTMWXP8fbW8vdn9Pbo1uqv7jsMnbVFVfUW+iobTCwdripJvy/GdCs03hfE9VHRODCZTt169a9WqWdJYQGkQACg9s8V68ODBW2+77aPnHnvf6fTm554+fdpfgd3l9mheT5feD2QEVIHvOHDMt3PfCqwCf0EzVVUMBq+mebyel0YPm/P2mzNnzhwxcpTmC4Zzl+PiW3k9ngKHPbj9eb7ePB71fM33ELM5cPMSa777L8QXJoDqKXq57VVVr9cXSBc7Cq/Ho1+XA4d2BbxUNxgMRZd7zWgOsdvt5/tXfMWCvV5VUb+bN8P3kYDm9T1x/pwYDcZLjAWUAm8BofSq1G3wzfcbn58wwVNY4Cp0DB8+XFENJVZgv8xC7f4S6uFRMVXjohf9Y7HVajWbTaqqGo1GV0GBwWDYsnVL8fLuxdu7nYWBNd9/uvya74qij2U2+y7c+q76ZgOq71afFgRODv5tuXl96E2b/yjpvuOHHzrf22nX6mVNrq/cpk5Fg9GkD6eqSkZ6WoObGqz/4v1+/fppRTvjPyfWsPCLjgWUiu+fSum2BFr3GfTVPxY0ev31lC2bbAWud6dN8Xh9L0jXHEodPvqJ83XVz2wJqALve3flfKH24s38JdQdtpwjBeYN69bt2r3L6VXCwiM8mpbpDVm2bNn6E3lBWzW9t1fx9maLNbDm++Simu+jxj0dGRU5eeLz/s1DrGHrj2Y8Nf7ZCRNfWbFsicermS1Wo8mU6Q1ZuvTrHr17l1jS3X+nxKNoem8v33Oa5taUHj166EMvTDlX0t1oMq07kj7u6QnPPP9igcv90XdbDAaDPly/Rwb966R94cKFTsW0ctkSt8drtlhNISH6iHUaJ150LKBUeAsIpXd70v2pR/YP7n+/q7DA7XTaMtNdNf4SYg375tPkr2Zlnzl2pEK1Wpbw8IdemfVK9xafHHL4N/zkkMNXqP3izdo88GjX1k0U1ZB69MBtHb8yWKw16/+l832dnQ7HyUN7FlarGbhVie3dzkJTiMVssbTv88jWZV/GFNV8t4RH5KdnPjh4qH/zodM/XTDj5fnTC3LSUnPSUtcePGUKCandqHnn+zprmuZ05Pt3u8Q7JR6F/qyqqh636+GHH46tWDUmoXJkbJzZYtU3WTBn2vxCR9rvRxNq1o2Iia3btJU+XFT5CmPv76yqhpy0M/m2nDX7T+hXf33EPuPf+PSFESWOBZSOmrz/3FuQAK6iUU0q6d/uf2e773MR4L8QnwEA/ymBkx7gvxAzAAAQihkAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQA/lukHj24Innabz/vXJE8TV8YGcB/FAGAslr+t6n+27KYNaJPjWqVrUe2RsdEG0xXvMbZqCaV/LclPnLq8L51XyTrt2XZ56Bu/V0V3wHgv5xvQVt++CnLz/Lkt/4Sa16e/FYZ+8k+e/qJvl2y088W5Odrbs+Vbq4oykN1QpWLP1Kldr3uDw9t37jhnX2HlGWfg7r1d1V8B/jhR/3v/mExOFyxNZ/N2bjok7ysDFOIxemwF+TZ6loLCvLyxjSvXqF6rbTjv8ZXqxkeXe7Qzi23deiS8u3CEGvonf0e3f398kcmz31vdP/nFm18tUfiU/O/+/jZx+w5WXr7AruvOFeExTT1rSkVql9f7aZGi6ZOzE0/o9f4bdVzQIeHRyqKMrJJpUbtk1K+XXhTqw7H9//sLxrcqueAgjybq7DQYcv9a5u60XEJZmuo48JHNE07dWjv8//Y9FLX271er2+f7XnTBt53/4Q3P3lhZOBYX8+a3PaBocvffzs8plxkuTiD0dhhwIidq762ZaRlnz3lsOU6Cxx63a6lM18tsOfpXWlerz7c2BY1ImPjVVW9Z8gTv/xrVWbqydO+Kr7VzRZr7/NVfH0HohcZvqXJiQN/FBlu2a3/0d0p/tMSEhquKlqhIz/wrLbrNyxw35JGPNuoQ9K1/p8Cf0oEAK7YP2e//s2uo9HZv1nCInZmeg8tn69X611xMK3n7fXDw8PtdvvCrXv3bFyzuqiYbbbbkHRX+6nVq383b0Zil9731w5ffleXr94Y36H3gMD2jj0bo6Kj161bd6xykw9fGD38panta8eZFE96WKX7Gt+oB4Db6dT7PJ1tDxk9PrCBv/zv3UXlfxds2fv6jk1Bj0x5/IGn72n0WmjYM+Oe1Mvw/l695WcvBo/lcbkWTH9lZq24e7v1Ut0FB1wRfW+/ccRbH3RrUtdfOlgvFdBl5HONK1j1rjp27Kiq6qRJk5J63W/0uPYWWPq1vOm5+SublTdUL6rie1AtP6HffROX+AoDBBYZ3nEi23V8X2Ji4hFX6N031Rg59QP/aXni6WcVVZ327vQ/zuqmNUH7NuTuFgQASofPAHDF4qpeVy+08M472/bu2UM5ssNf0rZZQsjf3p3RskXzue++07ZOgtfr0YvZjh/z+Mcfzqug2H/asLKcM3v5qtXb/rlg39b17epW9LdvWTVyzpw5NputTZs2k/vd3aRTr9jsX58oqvFbx1Lgr/H7R9HgfyyNSjtwYYNz5X9btW49feqUtnUTfIvvX/iIXpXXYcv17/O0gfe17P5Q0FjOogrGZ3wVjJt2SUq6Pd7sKnC0rVPhwtLBvv+WznzV35Xv9ZTRkJ6e3rxZ027dujZPsDod+dXzjr1wvorvLWZbXnaWXsU3sMhwr1a36kWGG0Qpbmdh4GkZOaj/qEH9LzirHk/QvuVlZVzr/yPwZ6W+z2JwuEJjW9RYs3XnqX0/fvTp5wdPpe3dvLbQ47UYDVm2vGpVqvylQ9Lu1ct+P3GiXGREocsdaglp2f1B2/FDn3322S31bli5fuNrk141V6695tM5Z9PTg9t7vFaTMXlf3lNtbrijR/9qIa4qFSuMfXKcxWxK3penKMrgG8P1PsOjY9s/MDiwgW/5fpc7IjysefcHdy5fdOLkqeiIsOKP6EP4aq+7PRcbS++qQnxcy/sf/XbuWw6ny2o2ZubmVa9apel9fTb8fZ7d4bCYzfq/nSH1IvSu/Fu16D14efI0h9NpNZuy7Y7dP2yvVKtu2vHf6t1ya4MGN72yfJd+IE63J9QS4vF4XG6PJcQ3pXA43VazMfA07t+7V1GVG26sF3iWgvYtNMScvM/3fhRwpZgB4Mo4bLmqwTBoyJDZc+YO6N933rwPAp4sqpho0L/AU/RxaVEx287Dnzl1OrXAnle1apW4qIgDh39tdm/voqbF2p9X6LC/OHqosyB/5syZLqfzjxq/5wvker2e4g20ohq8RuMfNXiLP6LzV/3VvN4Sx9IrGN81cIzmu+vbN1NR8UXNVxzeUFTfMrgr/1Z3D36iaCvfPy69im/9WjVat0ocPHiIXsX33IbqBUWGi2q/6zOLgNNyvhJl4FkK2rei4vFAafAZAK5MaGRU18eeeqxz63bt2qWkbDu4f5+qqnq13lUrlnftkrR42dfduiRt2nKuBK6qKOUrV48qX+HD5LlvvTV18cIFBpOxWr2breGRG7dsLd5eFxZ9rsZvdGSEv8avKcTiL5BbvEFRUXVfDd5NATV4iz+i81f9nTm8V4ldFX1JQg2L+qOC8daUlM73dlpZVDpYr9Yb1JXL6Sy+lV7Fd8myb7r37D1k8MC4xm31Kr5BtYUDK7MGnpb169crihJ8li4chZquKDUCAFfGYcvdumLJkMGDUrZv97hd+wt9X3zUq/WuPZY7fNTYceOfy7fbF6Yc0Evg6uVzG95x97fffjl9+vRJr7/ZqL3vE8t6zdusO5J2sfaO3D9q/LqKavyaQiz+Z31Fg4s1KHQ6A8v/LkrZrxqMQY/4h9C8Xr0M78kaLce2qBHUlbfocqzXMfZXMC5eOlg/IWaLNbCAcNBWehXfZ55/0Z5nW3ngzObF85t26hV4IMWLDAeelifGP+f7EHjyK0FnKXAU/7bAlSIAcGVCI6NubnNP/3vuzEk/YzAaw2NiK11/Y+f7OrsKCk4c/OUf1Wqm/X60QvVaYVExZov106KSWLvWfpPy7QJTYcGWbdt/+vGH3pOTFUXp9dTkj559bNF72cXbX6LGr6IoepviDcyqGlj+NzI2zhIWFvSIf4g6jVvqZXhVdXrxrrzOQv+e6CMWFfKd6i8d/H1R6WD9WX9XTkd+8a2CKgYPCKji628ceMdssa74/AP/aQmx+vL1gUGPlniWArcFSoEPgfH/IdaVXc+Svy3H/Maoh5/88JtrvTsAfJgB4D9u19pvls58tUXXfpuXzH9k0nvXencAnMMMAACE4mugACCU70tv13ofAADXADMAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoUwsBQcAMjEDAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMqkqiwHBwASMQMAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFMrAQEADIxAwAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKpKosBwcAEjEDAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMrEUnAAIBMzAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFMqspycAAgETMAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoUwsBQcAMjEDAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChTKrKakAAIBEzAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFMLAUHADIxAwAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKpKosBwcAEjEDAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMrEUnAAIBMzAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFMqspycAAgETMAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKxEpAACATMwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChTKrKcnAAIBEzAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFMLAUHADIxAwAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAof59AMSEKK0S1NYJaqsENdTke+SG6JL/fDip2mXFSVCzKLNSK1ItXVcAgFL799fZxuUNO9K1DWe0ozbl5nK+K/UNUVdz/Yhcl3LUpl3FDgEAl6PoJf0lWYyKseiCf9qhFXqU+jGqyeCbE4QY1G1p3jy3YjYobSsZVp706u1DDMotsarVqBhU9ecsb2ahklhB3Xg2+BJvMSqtEgwpad5cl+/1/tfHvRajclt51WxQ7a5zja+PVK+L8I39S7Z2xkFIAMDVZFLVf/Nyfk+2dkdFQ6pDOZ6vpRUoGU6ldqSy8axSN0qrHK4eylUqhiqn8hW9H1VVG5ZTj9q0TKcSZtKaxxnWpGrbMs4962c0qM3i1J+yNJv73DOqqt5cTj2Rrx23a5VDlWrhvkfqxagrT2mhRt+c42zBVT1uABDv388AjtmVUw7fRfnmcuqpfGVfzrlX4sftSpM49VCuVilMPZj7x8vzhFAlwnzucm80KKqiuM/NDf7wl3KqHieB4q3KzkzfndMORe8u1aE0Lu+Lkx0ZvPwHgP/fALAYlAizklHoi4FUh9a+krov59xTDo/vNtSohBuVHOcfm6iKsums5tF8d8pbzl3KAxlU3we/iqL+duGT/o8j/LOFHzK0OItSO1KtFu67X5bjBABc2YfAmqI0jVNDjb77IUYlv+iirxb9KIpywq41LKemFlxwac4oVCqH+u4khJ77vlBQzQGvpqw/o4WZlOsiLng8w3luQ/3WbFBaJ6iZTmVHhlbReundBABc7RmA06v8mKk1i1c9Xl8Y6C/D0wuV5vHq5jTtRL5yczllb/a5xnlu5YYo5acsrVF5tWakomnKzkxf+9vjgz8E1hRle7rWpqKa49Syzs8efs7Sbiuv1opUMgt9IeHy+uYcbRJ884H9AW8xAQCuCnXRsWLv0F+20KLv7RT/hg8A4H/hQ+CLqRSq1I9Wfyh6jQ8AEBQApx2+vwy4qjsDAPj/w4oLACAUAQAAQhEAACAUAQAAQhEAACBU0F/pAgCkYAYAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAIpM/wcVEiUHFGLvMAAAAABJRU5ErkJggg=="
+    },
+    {
+        "scene_number": 2,
+        "story_text": "Scene 2: The adventure continues with Generate a bedtime picture story of a rabbit and the moon",
+        "image": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAIAAAB7GkOtAAArPklEQVR4nO3dB3xT9f7/8XOy00FbWiizsmUoIlOg5QKyhZayZCnIEERZoqg4cIB6FXCAAoIoCnhFFBBlyBAUKEMRF5UpCJTSvdMkTfJ/JKfE2qLX/7XA78Hn9Xzcm0eanny/31DMO9+Enrf6wqFUBQAgj+5aLwAAcG0QAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglEG91isAAFwT7AAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMqgqp4MDAInYAQCAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhl4FRwACATOwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChDKrK6eAAQCJ2AAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglIEzAQGATOwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKoKqeDAwCJ2AEAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIZeBUcAAgEzsAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQyqyungAEAidgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGTgVHADIxA4AAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqCpnAwIAidgBAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACGXgVHAAIBM7AAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEMqsrp4ABAInYAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhk4FRwAyMQOAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiDqnI6OACQiB0AAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhl4ExAACATOwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChDKrK6eAAQCJ2AAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglOFaLwDXp9+OHF43b2ZBdmbauTORteuZrIF3z34zrEqN8hp/7yfvJ3zyfnrSWWtQsE5v6PfQc43a36596/C2DTvefzMvM/3CyV+sQRVseTlV69548dfjo+e+u+LJ++ftP/8/T/pgm+rz9p/XLv+Hu29ZMq/72Ae1y/95DUA5UhcdyS3P8QCfWfHtnlu5oa49KaJaVG5m+trvTm79aMXYecvLZfDcjLS3pgyfv2ptxdzzAVbLd7mGh4fc8fRn3/oPqB1suLmi8cShhOjo6N27d9dr3vah8fe88+7y0NDQV/5BAExtUz0rK+t/HmRqm+pfnkjtVK/SP1kDUI7YAeCKyEpJahPs7DlgaEp65vC7R/aNi/0w6beXh3VJOXOqUlQdg8kUGFIxLzM9+dTR8Go1DWbLgOnPvzYmtuOQe7e8/UpgaMWg0HCdwdDtnsk/796WmXy+5GG1bm6Rn5XRqHnr0Oyzt3frXrNa5PpPN6T8dkpRlNfH9p20ZN3hbRvm+XYASScSs7OzO8TEVK3X8MKJXxYvXGTLzXkounZwWISq03UfPfWygyedSFz59KTctBS322WyBLTo2e/MT4dy01KzUi/YcnMchTZbbk7WxaQF4weMn7/q9bF9p723eWav5jUbNU0+dewvHkuV2g0K8/MaWe2F+XkTmoa9+UPm1DbVX9l/3n+pKEqzLn2+2fhxsy59Uk6fMFkDSy3sWv9IcR0iAHBFmCzWsJDgwKBg18WUzz7/LD0rKywsbN6Lz4dUCC5yuSZOm24OCnzxyUduqF0nO/l8olLxieGxRU7nmtdmvV63Uu/4AarTnugIHN6u8WMrN7eN0Jc87Im1ewNDK9ozLqYEVTcFBKakZVSuHGm2BNwRZS18dYX2NNqsSx9FUe5rUsESFKyq6sxPD45vHKzT62fPnh07cLDe5fyxwHR39M2XHXznysXjn5nbrV6EUXGnWKt0bVjt/rlL+7dsGBoa8m3Cbr3BqCjK4IZhRwfdvW35/Gadet5Zx7rljn6PPDDurx/LvT3bPz1zZnBw8JbNm+P6D7jnxsCpl/6stOtFDsf2/7zz0Yfdz2fkOqImlV3Ytf2B4rrEh8C4IlxFRXvO5uzYtvWdd9+9vVuP9R+umn7/vUvffL1DTPTqj9bcMyBuVHzPmY9MaxRVddDA/s3NefnZGc5Cm16nS0lObtumTVxcbLtIk6OwoHb+mVKHuV2u/KyMqPY9tu3Z7y5yxsf33bhpk6PQ9sW5wremDP+LJRn0urS0tLZtWsfH942uav2zwdv1u6tS1ulpUyZHR0ffaLEX2Qtvr19lyRuvxXTosG7dOoOvPmPd+vWVPXmHv/i0gj3z8w2fDu3e4b8+lpy05JkzZ+bm5nbr1s2Wm6MoSmGe991X26VLp8OuV5VVK1c+/ehDN+ScKruwq/fDgxjsAFD+cjPS2vW7657u7aPqNohu1Wz6A+Ma1KgS077d6NGjb+0ef/DEubcXLjhy5EitWjdUqd0g7dzpGnUbmK0B3tcjOt0777zT4c6xm96aG16pssfjievXv9YNUSUP0+n1Veo0CKtSfe6InnGj7p96d79Zy9a07DXA6fbc69sB/BlV9Q4ePXD0lqWvhFeq9GeDL548vEO/YY0aN+nauVPFCO9h7W5rM6R/v5a97/zso2UeX4HSqpUrFy5aPOfF54eOHP3KrJkffbK2fv36f/1Y3C63qqqWwCBVVT2+9XgUpSA3W/F4vNc8vttU3datW3UGQ/zAQXXq1C61sKv104MgBADKn6qqx7/e/MKqz6YP6p6cdG7T5s0H9u7x3ax6PIrBZMrOzlLc7h49ejiLXB63K27Q0IwL3s9FPaouKyury6jJG9+ao+q8T7X2/LxSh7ldLlWne/exe//Vb/ik+M7vbPxq59pV9y9co837F6vSBu82ZurmpfNUne7PBrfb8p+ZMm7RKy/Pnz//gYmTfFsHvaIqHsWj897LO8Xp384GWEwhoSH1omrs2bNX/RuPxfc0733W93iHUD1ut6qoW5e9Fhoaqnrc2p+aourcHo9ep7/swsgAlDveAkL583g80YNG9W9Wq0GjxvlZGcFW69mzZw8c2N/7jl6Ht29oVbfa87Nmf3/kl379+pmtAUNGjJ4y8f67Z73pewb0Pg8GBIf4n8i//zmx1GE6vT5h3crEPdv7Na8zZ87Lc6ffbzCZXhjUwahTF00a+qdr+tuDB1YIrRkR+vEnay0Wi9HofYW0f7935T9s/yw+Pl7xPVkbTOYP3nt3+sMP79y6RVHVv/NYVEXR6/VOe6HRaFRVJSMttclNTb76z9Jhw4Z5fGN6D/PdyRIQeNmFXemfGgRiB4Dyp6rquoUvd+7WY8mbC0Kr3XDxzIlnXllw8ezpN+fPf/TJpwsdzjHj79tx6OenHpr6yJNPF+TlbvolOWHdSmtQsKIo2qXFd6k3GLcevTBh8h8Oa9mrf9u+w2qbHT3v6F2zTr2nXpxrDYtYdzS9Ww1L3uurSi5DG0S7/PuDF+RmH7cZvtq58/D3hx1uxWK1fvlr+sOPPT5j5rObN6x3uT1Gs6Vlz/5JbuubU6c++sri8OpRZccpO50lKNjjdqe7jevXfzps5OhdZ/PWrFljV/RfbFhf5HIbzRaDyaQdVq9l+8su7Nr9PHHdIgBQ/oLCwoc/8/rM8Xc5Cm0ZSWcja9XTGY0up3PgXfeknv21Su36JkvAmTO/DR89LuW3U5Vq1jYHBN317ILZA9q/czTfP8g7R/ONZsvGFUvXvJlZ8jBFURLWrfxw1mOL31iQcuaUtUJI9fqNk04kmvecXjRp6OSl60uupNSAf2fwjkPGxndorep0yaeONu+2Wm+2rn7j5VUOR07axezU5O1HzxtMphbd45/re5snJHL5E9PGzHu37DhlH4uiKPVatO/du7fHo1SIqPzgkD6qTpeTmlyQm7M18az27K8dNujRF1c8NanswoByxy+CAYBQfAYAAEIRAAAgFAEAAEIZ/vqfTgMArlfsAABAKAIAAIQiAABAKAIA18bmJXMVRVn94iO7PliadCJx1wdLr8Kk2kTapbaAzUvmTmldTVEU7bKUr1cve2HQvx7vdvOU1tVnD4iZP65fZvIV6XLxL+ZKDA78GXVxYt6ffhO4Yqa0rrbzZGrHupWWf59c1ao/kuW8OvOGmXXadP4FeOtrfD1frx5IKnlk4t4dW9+d/8Tsf99UKcBoCUhJvvD+1oQ9WzaU+mXjcuFfTKk1AFcUp4LAP5WXmb7iqYk56RdTzpyqHFVHbzTqDAZHfn7quV8jatYODAk7cSih07DxW5bO89ZjhYXr9YYqtW8szM9raLEX5uXeWS/oqfX7nx8YYzCaOg4dV/Kw3g/MWD5j/KsHkqa0rua/nNyq6i2demVcKG7yMpottZq2/CVhZ15musFksgRV6Dft2f/Mmjb57U9fGx1bISJS6+qyBATpjcYm0V3ee+L+J9fvey6+rcft9i4gP8/jdjvtdltuzrT2tYIrRqiqLnbSE7d2if1i2Wt9B9wZXpjeuWvfvKysaQ9OHXFH768+X/v2w6Myk5P8sw+Y/vyrY2JLrbzbqCk/795acpHaYbd2iT24cU2T6C7njv6k0+m00rHQyGqX/jTypneoV/mGeiXvVatpy6QTiStmTvSXlLUfMKLLiAeu9Y8d1wMCAP/UR/9+7F/xQ/o2r6e1fd03eaolIPDf818JCgzIzy9Yve/nI3u2r3n1udfrRGj1WL84A8f2uFSPtWVLXP8BM3q1eMlo8rZolTlMUZSRDQKmXJprZIOACXZ7r1EP3BbuK8y66C3MGtWm/o5fM8KyTpsDgr5Jdy2Y/VSTmK73NKv2Y99Buz5b+8yEkafPnpsyder0l99oe2PUqmdN3umsAY8+NE3r5+rWrZuqqv6ysJ9s5nG9Ym7tEvvbkcN3tHtxxmOPVrqhfvuB0VsSDvUZNCTt7Kmhj84qOXtx/9cfVz6sbeMZqzaXPszh2PafZR992O1CVr6+9gxf6ZgrxVolrlWjS38amxPyraXu9eTahC+9JWXzSh5PAKBc8BkA/qnEvTs6169c3Pa1Zs3Ywf2nPzB+yYLX2rdrt3jB67fXr+J2uUrWY7WtfPl6rFItWm0rm/Ky0rXarJLlWS6no1bepSavAf2bm/J0Ol0Tq71Tp86DBvQ3nfuxTezgQ1+s37V7T5A9KyP5XJGjsE7N6lkpyUGFWWvXfOQotHmHys3xL6BUWVj7Kpa8rHRt0iY33/zNgQNVatf/adcX3+3aMuyukRkXzpWaPT+rdP9X28reLrPLHHap82vlx+vDUo9OmzJJKx3LTU/1L6Zm5vFS93K7XO29JWW/+o/Pz8q41j9zXCf4DAD/1APNIi6mptWsXu3W7v0MJtMPWz5J/CWxbt16TbvE/rh9w2/nzoUFBzmcRZUrRbQbPHbT4rk2h9NqMiqKp7DIZTF4T3OvXfF4PGUP8ygee5HLbNC/sv/c1NbV7UVus0GXlW/7/tuDWmFWo1tujQwJ3v3ziQuJ3737/qqj51PTzp9u0v72yjr7gIEDn39m5oiRI29p1iw+LvbLPfuGDB1y7IfDfzbvbYPGbFkyz+ZwWE2mRUdy7m9aMTMnt0qliPsXr70jppVy+vubW7WtaDWWmr1xk5uSfz1eauUWo/6yh9mdRVazKTCkYueho6NMRTWqVJ4y7SGLr3WgsMhl1pd+aI2b3PTMxu8e69Qwpv+wksdzDkeUC3YAKAc6nc73K+Ueg9GUnZOtqt4vVb32t0v112N1HTXF473qrcfy1yKWVPawy5ZnaYVZTere0CEmevSo0UVFzlGjx7y5cPGI4UOWLXu7MD/35o49v96zp3GDetExMbt37z5w8GCnjp1cdlta2u+vnUsuQJu3+5ipvnl1WnuX0Ww5duzYrS1aLH/ivn5tm/aNiwtQXaVmHzNmbIbv3wWVWvnlD1NVReft/HK5Xc9MHu8sLJg/f36Rw+HxFP9pXPZebper0JZf6vir8lPF9Y8AwD/lfef9229739Hru22+tq/Zs/d/c6hvXOz32zb0jYvdk7DPe9Bl67EKvfVYvz+dXa5Fy2AyaeVZuz74vTyrZGHW1MkTOw0asXTOrN27v75n1Oi64YERNWrd2DrGVlCQnHwhvm/fvQkJO77Y8uBD07Zs2qg1tGj8C7js8hRFqd6gyedf7n5yxgyXvdBpt02YMEFRvf+9lKrrGvH3usxGzHrTP7ivdCzEXzrmzUrfYnQ6XcK+hFL3ulRS9ofjixz2q/XjxfWMAMA/VffWNjtOpj30yIw9exPiYuNWrd/06tLl902aumfvvvsmTd1+PEXve5ItVY9lNFu0eixrcAXtlsu2aAWFhX91Ln/NmjUJBw7Wql2nyOXW6XTbjiVPmDw14cDBByaM35x4ft/m9Y4q9Q8cPLhr184jdkvaudNGi7V6gyYHf0y8oVYtY4Xw5IKi9m3b/nw6qWmnXn+2gFLzKooSc+eo1Z+sdQRHHEjY8/WehJS0dJfbW8xbcvYdv2bs/ZMus7KH+QcvyM0+YTN+tXPnc7NmOdxKQGCQtpgNGzbsSbKVupfi644vdbzBZL7WP3ZcDwycCg7/0KBHXlz+xH2rCm1pZ3+NrN3AbA04f/78sFFjU8/+WqlmnYCQUKPZsvxYgf+VtXa9vrceq4/i8ThsBdot/m+VPGzw4y9PHdxbp9Nlp14syM3elnjOZA38fMWSj94oLsyyBAZ1GHTPXT075aRdVHX6oNCKve97VFWUJjFdX399/nfJeY7Cgp8Sfpz2zmcfLlv00PLNX65c9GcLKDmvqii39RmcfPLo2OGDnfbCIocjNyPNEXWLyRJQava7nl0wq3/7UiMYzZa/OKzjkHv7dmh1qXTsI53ZUrtRs969+zgKbUnHf15To1bJe6mXO97lsJMB+OfUt/gQGABE4i0gABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgA4P+K5FPHNi+dd/rHQ5uXztPOkQdcUQQAytlkX7WWdvn3D74SBWEl+7+uaANXeY325sTBtWpUt57aHxoSqvOdrg64ovhFMJSzya2raQVbr/2Nciv/wYqi7DqZ+q+6ld4r14Iwf/9X2Xm16f7OIv+r8hptUsuqJ06deuXll5KMFW+LH6GdowK4cggAlLNxjYNz8wuCAqxhkdVCKlXRGYwVwivlZ2f5W656jnt41wdLctJTslIuZCafz83PDw4MVHXes2mGhoQoqjpz/f7ZvoKw5l3j9q5bWadpq3PHfjaazeHVovKzM6MHjLhw8pdSZVu1m7bUnohjBt6zbfmCkIjIkEpVPG530onExz/ePXtAzE0x3fydZTnpKWnnz2jBo+p0i37Mmty62msHkvyXiqJo1V23do29ePq4yRJYaq4dKxbt+fg9rYPMYSvwPpbs7NCQ0MDQsMo165SsQmveNe7gxjUmi7Xj0Ht/+HLTyOcXLZ4y/PE1u2cPiH54xRfLn5hQkJWpHW/Pz0s6kaitqnJUnRHPL1w7b2bOpRawaFrAcAV4zyx4JcaFWB6PR6fTvfzyy9379C1y2B966tmcnNwF817SWq6OquHjOzUb/8LC+FYNQkNCvk3YrTd4TxVXsiDssV4t/m00Oe32bf9Z9uGq22NiYg6eyyo6mxgdHX3Sae15c60nP9jaOlznH/DxYX2eWuc952iRw7HuzZcW3lSra6/eRQ77hwlH5tw/9LFeLZ5zuzr2GxJ3a3Fn2fs7vgnPPq3VgcX1HzCiQcBk76k8vf8haNeLHI7t/1m2+sNu5zNzXVGTys71+cIXPzt8KtTXQfZthvvEppVan9emY6kDb2scGBiYn5//0b4jR3Zv18bJLNLFde8y54aore+8Hh135+D6QZu7913z0oyug0aUPL7w590VQkJ27tx5ulqrd56afN8z87rWizAortSAqrEtG3YdOfFa/2xxveEzAJQ7Va9Tv/nmmw4dOrw69+VJ9wwbP2yAv+WqmTG3MC+3U/3KSxa81qFDh3Xr1mnnIyxbEFbkcOgVZeHChZ1vv31QzK3z58/v1KlzkwqK014YVaJsq5kxNy8r0+3ynqnfabfrdeqB/fu0qW9vEOkqKvKViDk71/u9s6x5RX3Z6fyNY7a8XKfDrvNVdz39yEM1sk+WnSuiRq3GlzrI1JPf+Ee7LdL0lrcKre3iBa93rh/pdru0cWZMuX/5O8silfwfvtoS5sjavHXb/s9WJ+7bdXuDKv7jo2sEL1y4MDc3t2PHjs8P69Gq18DwrF8f9LWANTAX0gKGK0Fd8kv+FRkYUo1tGOhwFgUFBrTtd9ehTR8fP3rUWeQ8depUlToN0s56W64qVwhMyciKqlG9VZ87v/5wWb7NZjYaVVW9TFFXkctqNrlcLmeRy2zyNgfYHEW/l21dGrBJk5ue3XS47NTnzieFBAXYXW6zXpeRmxdVrdqtPfoZjKaGLW5bOG2U3eX2zqIoWuPYa/vPT25dTWsc8xaz+Kq7dAZDWmZ22bkebHfDtn2HijvIklIT9+7QZsnMzatZvfotXWN/2FZchaaN067fXXlnj69YseKWRjdu2bX7hdmzjNXqbX9/YUpaWunjfat6KzHvkY43/qv/8BomZ40qladOe8hsNPBuLcodpfAofx6Px+Vy6fTep2y7w24yGnv06OEscnncrrhBQ4uKigxaWZjHVyWmVYZpd7x0RuXicVTV5Xtp71ZVt9vtbRkrUbblHzDdV5ul0+tLTe303VejV3WKqno83oaZvLziFz2+6VTF1zj2xbJX/Y1j/uouvU5fdq787ExVpxszdmxVq/6+8fdWbXjLbQ1rX5rHu0ZVp/0DHt9D8Y3Te8Kj80beYcvPq1GjeniFoKMnfh01dsaOFYvUssdfYrflPz153MJXXpo/f/4DEyfRAoYrgbeAUN6876Z7evXq9f22Df37xe/cuTMhobjlaqiv5coSGLTvwMHed/Q6vG1DfHy8VvJVtiBMe1Pe9wRZfEUpU7alDThitrc2q+zUe/b6ysh8Dvo6yw5v+7RlnWod60fq9AZtOlVV0n2NYztLNI75q7ssAYFl5woMCet73/S3XnpO6yCrUzFQVVWtz2vr5k1942IPb/v09yo03zjh1aKCwyu/u2TxnDlz161ZrTPoazZqagkM3p2wr+zxmoCQ0Bq0gOEKIwBQzgxGU5FHGTBw0K6vdo2dMPG1pe+9tuz9CZMfTDhw8H5vy1WmyRKw61T69Mce3/XV1y1atnK5PUazxWi2ZLhNJQvC/P1Zpa7oDcbtx5NLDpiw1lub5eXxFHmU/v37a1N/ebK4jExvMOz0dZbt3psQFxd38HyOTqfTpgupXPXr839oHDOaLf4Z67eMLjuXLTdn3+Z1zksdZIl2q6IoGW7Thg0b9qc6J/iq0CZMmvrliVRtdm20pv/qsXHr9r5xses/33xrl1hFURq17bjzZOqfHW/LyT5ZSAsYrizeAkI5M5rNXe68Z9+G/4RWqhoaWc0cGFSQlnHXmHEXz5ysXLOOOTBw3Kvvr37t2ZWvFmanJmenJu84lmQwmeo1b9u7T2/v+/62gveO27ShLnvFW7b1/pKP3sjyD3j3c29o31VV1VXkHDlyZMUqNUIjqwVXjDCaLdpdVi+ct9JuS/3tVGTtBkGhFRu0jtGmqxBeeerg3qpa3Di2/ZdzBpPJP+Odj/37/aceKDWXNbhC0449h2sdZHpvB1nVug179+ntKCw8f+ynT2rWTv3tVKWoOoEVvFVo2jjf7/j8wMbVBnthwv6DP3z37cDnlyiKMmD688sfv+/jRVllj/e2hg31toApqrcFrIWvBayIFjCUNz4ExvVjUquq2r+jf/3gBeX/mIrOrMbmgv3Zxn9PGvngO59f6+UAXuwAcF3xv4L+P+X7HZ+vnz+rXd9he9etHDl70bVeDlCMHQAACMWHwAAgFAEAAEIRAAAglHYiFgCAOOwAAEAoAgAAhCIAAEAoAgAAhCIA8H/IxFZV/ZeXvSXpROLOD5Zol5ve8pawa5f/cCL/UGUXAFzHCAD833JXfetf3FKtXqP4keNub3lzxyFjNy6Zc0tF48Ylc/75RCWHKrsA4HrFuYBwtU1sVbV5l9gDG9fcFNP17C8/6nQ6rfc8ZsCIwrxcp91uy815uGODkIhIo8Vq++MtHo8n6fiRJz/Z80zf29xudwNLYWF+3rxRfQbPeOm9pybmpF30D/XpG893Hjpu09JXAkPDgsMidHp91xEPHNr6aW56alZKki03x1Fo05og18+fVZifpw3lcbu16aa2uyG4YiVVVXuOffCnr7dmJJ+/4O2FjzKaLYMuddB7H4hWW39Lq3NHf6+tbx8//NT3B/KzM1PP/lqpZm2TNVBVPHZbgfZlYEjY8UMJtw8bX3JtsQ883ryr9xzRwNVEAOBqK3I4tvmq0i9k5ZsmP9bF13ueFlC1T8uG/kL5Hn36Oh321QlHXvxmT6lbXr5/6CM9m79gDXj0oWlasftvUe1XPD15wjNzSw7lcjpXv/rc/DoRd8QPVIsKjzqDhtzW8IE5b5cso9fKZ+ImPtGyskUbqlu3bqqqzp49O3bgYL3LeaTQPKz9TU+s3NImXBfl64U/pobPGNZnpq+DvmRt/TfnspyXaut73HTDxLlvD7jU9v7gI48rqjpvwaval2v2Hfl5z/ZSaxvbox0BgKuPt4Bwtfkr11d9sr5C6lGt97x+ce95caF8jK/VvXODSG+dyx9v0Xrebbk5/ir2eaP6tO93d8VLFeraUI5Cm16nu5ic3LZN67jY2NsqGZ2Fts6ly+i9/18/f5Z/KO9rIr0uLS2tbZvW8fF920ZaHLaCqLwzT13qhb+lRAd9ydr6gSVq64sc9pJt7xNHD580evgfyuJdrlJry8tMv9Y/FkikLuVsoLi6xjQM1KrSA0Mqdhk6pqbJWf1S77m3EKZMq/tle95L1scvScyb7qtQLztU5UoR7Qffu3HxHJvDaTHqM3LyompUb93nzq8uldFrf//HNgr6vYned692g8ZsWjLP5nBYjAatg75qnQapl3rhn/N10I9pGPhntfVaO3yzrrHfb9vwy5Ejiqrc2LCR9qVW/l5qbVaTcUmi9/0o4GpiB4Cr7lLlutvtenryOEdhwfz5850Oh/aGjNbqri/R6l72Fo2/R97jdmsV6qWHUnVZWVndR03xeK96X+wbiovjfy+jLzWU/149xjzou5f3PxCtF75xnRs6xESPGTNW66C/bG2998H5JtLa3hWt7V3945e+eUutzVM8OXBV8RkArjZ/5bq/9zwkOEjrPfd4b/e2uu8p0epe9haNv0d+/oSBlx3KO4eqBlQI8T/T7ztwoPcdvbaUKKMvNZTT4Sh7L60Xft2Gz/sNGDR2zKiIlp21DvpSbfUla+u1tve1Gz6Nj4vdtWuXoij+L4vL3/84C6fkwjXh/U/l2swMqfyV67ac7FOFpq927jz8/WGnr/fc7nBohfLPz3klOzvn44OJqk5f6hZ/c7rH7dGK3ZNqRU9pG1VqKLfvL7Y1KFhVVX+b/Fe/Zkx/7PEZTz+3+dN1LrdiNFu0v/9Gs1Ubqv+gQWXvtf34xQmTH3z0yafz83K/OJayd+3KNncMKvlASj4u712Mxl2nUidMfvDhGU/k5xc8+NgTqqLMfWGW9uXHB37RHkLJWSy+69f0xwKJ2AHgGlhxolBRlE5Dx8V1aKWq6oVTR1t0/0hvthhVtcvgUfs+/SC0srdQPrhihDkgoNQtRrNFu3uDlu169+ntfUNHfbXsUG6HXTvMP6O3Gv7NOSvthVmpF7NTL3x57ILW/15yKIetoOy9Pn//rY/eyEo5c7JSVB1LQNCIWW+UeiClrhhNlk0r3/54YVbKb6cqR9UxWby/WDBs1FjtywBf+XupWa78HzlwGerbRwsudzsA4DrHh8AAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABC+VoxAADysAMAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQyqCqnA4OACRiBwAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhk4ExAAyMQOAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiDqnI6OACQiB0AAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAZOBQcAMrEDAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMqgqpwODgAkYgcAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglIFTwQGATOwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAog6pyNiAAkIgdAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAGTgUHADKxAwAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKoKqcDg4AJGIHAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIJSBU8EBgEzsAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqCqngwMAidgBAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBs4EBAAysQMAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQyqCqnA4OACRiBwAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUgVPBAYBM7AAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQKj/HgChJiUmUu0QqcZEqlaD95YbQy7/68OxNf9WnJQ6rIJRqROs/m9DAQD+Z//9ebZluO6bNM9XFz2ncpWmYd5n6hsrlOf5I3KcyqlcTzkOCAD4O3wv6f+SWa/ofU/4F2weu0tpHKoadN49gUmn7k915xUpRp3Suapuy3m3drxJp9xSUbXoFZ2q/pjpzrAr0ZXV3Smln+LNeiUmUncg1Z3j9L7e//Ss26xXWoSrRp2a7yw+uG6wWivIO/dPWZ6LNkICAMqTQVX/y8v5n7M8/6qiS7YpZws8qYVKukOpF6zsTlEaVPBUC1SP5yhVrEpSgaKNo6rqzWHqqVxPhkMJMHjaRui2J3v2pxd/10+vU9tEqD9kenKLir+jqmrTMPVcgedsvqeaVakZ6L2lUai6Jclj1Xv3HCmF5fq4AUC8/74DOJOvJNm8T8pNw9SkAiUxu/iV+Nl8pVWEejzHUzVAPZbz+8vzSKsSZCx+utfrFFVRior3Br9rFqZqcVJSJYtyKMN75YJN0YZLtiktw71x8k06L/8B4OoGgFmnBBmVdLs3BpJtni5V1cTs4m/ZXN5Lq14J1CvZjt/voirKnhSPy+O9Em4ufiovSad6P/hVFPX0H7/p/zjCv1v4Nt0TYVbqBas1A73X/8njBAD8/30I7FGU1hGqVe+9btIrBb4nfdX3P0VRzuV7bg5Tkwv/8NScbleqWb1XIq3F/16oVOeA26PsuugJMCi1gv5we7qj+I7apVGndIhUMxzKN+meKpa/XiYAoLx3AA638l2Gp00l1eX2hoH2MjzNrrStpO5N9ZwrUJqGKUeyig/OK1JurKD8kOlpHq7WDlY8HuVQhvf42yqV/hDYoygH0zwdq6jZDk/mpd3Dj5meFuFqnWAlw+4NCafbu+foGOndD/xS4i0mAEC5UD8+U+Yd+r/N6vt3O2X/hQ8A4Hr4EPjPVLUqjUPUb32v8QEAggLggs37mwHluhgAwNXDGRcAQCgCAACEIgAAQCgCAACEIgAAQKhSv6ULAJCCHQAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAAKDL9P5kGv0IowwZvAAAAAElFTkSuQmCC"
+    },
+    {
+        "scene_number": 3,
+        "story_text": "Scene 3: A challenge appears in Generate a bedtime picture story of a rabbit and the moon",
+        "image": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAIAAAB7GkOtAAAoOUlEQVR4nO3dCZyNZf/H8fs+++xjFluWyBolsjOSrRIzlqFEKWvJlnrKVhRaiEjxeJRWLSKkLFlCtgZF2UkJY8xm9jNz1v/rnJvTcWYqo548/X+f96vnvM7rdt3Xdd33M873XHOO66e+8G2aAgCQR3etJwAAuDYIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQyqBe6xkAAK4JVgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGVSV7eAAQCJWAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIZ2AoOAGRiBQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUQVXZDg4AJGIFAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGdgJCABkYgUAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglEFV2Q4OACRiBQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUga3gAEAmVgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGVSV7eAAQCJWAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIZ2AoOAGRiBQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhlUld2AAEAiVgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGdgKDgBkYgUAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglEFV2Q4OACRiBQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACCUga3gAEAmVgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGVSV7eAAQCJWAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAglIGdgABAJlYAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhlUle3gAEAiVgAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCEQAAIBQBAABCGdgKDgBkYgUAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAGAUvvl0L45gxJe6NXm8RZVp9/Xfs7A+AspZ/6qzm2FBQvH9J95/x1jmld+LqHZ84lxP2xZF9Bm29J3hjeI3vDO3OENonMyUkvs57Fm1/kef4uvzZU0Bv7/MVzrCeCf590Jw6YsXnVDUXJMxSq5FzKWf/fj0ukTBs965y/pfPPi/9Ru1OzR3l3Cgy2uwoLjavSQO5rfdNtB/zbff7V6+n/eGd63Z7/CggNbv2zZvV+JXT1UO+SxPxrO1+ZKGgP/zxAAKLWs1ORmYfa7Eu9LzbjQ74EHuyXEf5z8y4y+HVJPnYytUt1gMoVEROVdyEg5eTS6YmWD2ZL45PNzBsW37TNk3ZuvhERGhUZG6wyGTg+NOrhtw4WUs/7Nrr/p1qZd7wk6sXPrpg2TJ44vGxO9Y8eOnPQURVFeHdxt5MIV2hIh9dSPNaJDX5s3LywvJWnf7pbd++VdyHh/0ojcjFRtDubgEGterr2oyJqb80TramFlYlSdrnXig3vXfZqbnupyOU2W4FY9HyjMy1UURXtUFMWal7voyUEBUyo+8/YPPLpvw2e56WlZqedyMs43vivxwNZ19eI6Fb+W5BOHF08e6T/i5/NeaJ340MZ3XwuPKRcRW95otpw58n1c74G+I3qDISyqbEFOlq+r2/oM3vzBgoBObunQdc/qZZVq179wPllVVIPJZAkN7z7m2Rtbtb/WPx34JyEAUGomS1CZiLCQ0DDn+dTPv/g8IyurTJkys158PiI8zOF0jnj8SXNoyItPP1W1WvXslLOHlaiJ/eIddvvSOVNfvSG2S/dE1V502BbSr+WN4xavbRGj9282cfmOpFUfh4YEbV/xkcNmq1evflFhYVBoxN1Vggpnv6+NfmjbxuCQoLLXVR47duyCdxeviI932G1Lp4+/rVuf7rfW1Obwzqbdh3dsUlV12rRp8b3u1TvtPxSYHoi7aerHX3aqEWNUXKlB5ROa1A28MLe784DhAVMqPvO+LesOe3lhz8Z1IiMj9u9J6tajR3hISPETJy7fsXnxgoefnek/osNmWzl/+vybru/YuYvdVvTRjgMzh/X1P/Kvp5/Nyc17bdZ0X1ePdrx18nurAjrZ+NFbn3x8x/c/HOgyfEJU9ilzcOjuDOdr054hAFAqBlVlOziUjtPh2HEmZ9OG9Ru3bF2zceuHixYs/uDDN+a9uvKLNQ8PH/FQYoIlKGjSU49/s2tXlapVV322Kj87015o1et0qSkpLZo1KxcduXXr17bCgmr5pybNeN2/mdvliuv9kCkouOHd9zZQUpvVr/Pioo/yszPXny36z+h+o95YqSjKd+tXNq5fd+Wnyw4dOhhu1hfmXDixZ/vhHZvGPzrQN4fWtzR8TVEMel16enqLZk2vKxe7adNXLoczNuvnx0dP+XbP7oMHD+ZnZRa/tOJTKj5ze6G1fc3yC1+f89na9W1bNuvVK9HlcpZ4La16PhAwosNu1+vUpG92TXlxevxdnfo9OGCGy+l/ZOSAfunp6f53T6fXB3bisOtV5YPFi7cn7X3qyX/VadSuUuXKE59+unn8vfx1RqmoCw7nle4MyJabmb7pvXlff/JWlRtqt27c4NGHh65YsXLgwAG16tRteEcPg8n0/ZfLDx06dPTI4fLVaqWf+blug4Y31quf8tNxm91RNjam5b2D1yyYabXZLUZ9Vr51/97d/s2eXf3dR1Mf7z3upcldm1w4d+buznf17Nlz4OChr+5NKczPs4SEupzOyV2bfLTkk9gQkzU/v3rNmg8/OjJNsWxf+s75tPTK11XU5lCnUbN/PzFQG7F570HrFs6y2mwWoyHh0aeqmByVypcd/fgTFqNn+VvocFoMeu2JWa8rPqUSZ56Zk1el0nWNu9yzbcmifKvVbDSWeC3jbq8T17Ov/4hut7vI7ggLCW7e/f7v1i47czY5IjTY/8jxo0ftDvvJkyd9XZWLDO88eHTxToLMJnNI6Oa9B84d/u7t9z44ejYt/ezPU9d9f61/QPBPwreAUDqqqh7buuaFD7746ciBZSs/79Kt+5Ahg/V6bSnpNhhN2dlZist155131ruhapu41oMGDc5MOev5/Yqqy8rK6jhgtNvz1PNGtSg/L6CZy+m05ubUcaTUuKXZLR26bvp6e0K37kazWRtXUZQfv9ul1+tCdc6GDRs2b9H8/r73tWvT6vtNX3h+lHU63xzy8vN9I94x6DHviJ4f9WdHPWwvLJg7d67DZnO73cWvrviUSpy5Xu/JDG1QRfnNaym05hcf0e12O51OncHodrvtTmfAkSJbkUGv9+/Kbrc9O2roZZ2oqqLTudxuo8kycNDgefMX9O/XZ9GiNwvzL36YAVwhAgCl43a74+4Z0LNB1Vp1b8zLygwLCjp9+nRS0jdd7u783YZVTW6o+PzUafsPHenRo4c5KLhP/4GjRzzaf+o8z2uW6nkVDw6L8P2SYv/BwwHNdHq9qtNlnf25eqT5wNYvb7mx7omTJwtyso06df6IPp7f/2xY1aRRw3PZ+VEVKj06f+l3Bw7H90h0OZ1GS9CevXt9c7i9ZvkSR6wcE7Hs0+UWi8Vo9CSWqtM5bDZvNqgOm01RlKQ9e65k5t8kJXW5u/P+Dau6d++uuF2/dS0h4ZEBIyqqqlPcnTt7zu3Zo/v2Hbu8fwl/PbJ58+YdO3f6dxUeFVs5JvKyaXvnoCpKwiP/WjhjyrZtXz80YOAN0SExla7/+38e8I/Gh8AoHVVVl8+b0a7TnQvnvVamYtWUUyeee+X1lNM/z587d+zTkwttjkEPP7zp24PPPPHYU09PLsjLXXs0ZceKxUGhYYqiaI8W76PeYNxwLGXYqMuaNe6c6Ha5klKso8eMeWrCxKz0tPU/ZVetd0vH68x5cz9UFKVhh65NyqhZhrDazdvWbNzSrTcoltCbbrklx6Hb9GP6E0+N1+bw1vodBqMpYERVVU9YjVs3b963f5/NpQSHhLpUNV8xTnz66RkzZ+UrxgkTJn59OjdgSsVnrqq65bsOjBw1+omx4zeuW1NksyuqWuK1FORmB4yYn5frcCs9e/ac9vIr2dnZS785rCiK/5FRTzwZGhb+wuSJvq7ycy4Un7aiKOaQsF1rVwwaPChp926nw36oyJJ+5udr/dOBfxgCAKUTWib6/ufmPjP0AVthQWby6XLVauoNBofdnnj/g2mnfypfrZYpKOjUL7/0Gzg09ZeTsZWrWUJC73/utak9W719rMDXydvHCoxmyxfvL/zk9Qv+zRRFSRj9zFtjh3w0x3r+5xOxVaoHh0Xo9IbVpwvnj+gz+s3P9m38PKdB05P7V9VpdpvJEhwWFbtwyw8pmTmdhz65dP6MDwqt2hxCIqMMJlPAiHqjqVubJqpOl3LyaKNOn+jMlujylYaMn/Ld+s/MwaFDxk/Zs3qFveijT8Ij/2DmFkvLypEjR47cu3t3kyaN49rcZgkJLfFa2vYZEjCimp/ndNgffPDBMuUrRZarGBYVo6qq/xFLSEh+Rqb/3WvTe2BAJy5b0dvHClRVubntXfffdXtO+nlVpw+NjLr7kbF/+48D/tn4EBgonbfHDX1g9NgWsUZDcGheRuquDNfr40c+8f6XV3Lu6KYVs7KyIiMjZycl/9YR4G/DCgAondv7PTzr8aFOh+PcyaMVa9TRG033TZp95af7ryd+6wjw92AFAABC8S0gABCKAAAAoQgAABCKAAAAoQzsHQUAMrECAAChCAAAEIoAwJVKPnF4y4dvaI+/02zrkkXP975tfKebRjW9blpi3KtDe1zw7qn5l1u7cKbv8cqNalrR93jljbVRlrz41JXcgT9/P6/u0oDSUv/DPwTDFStj1lUI0h/Ksv9Wg0M7Nq1/e+7T016qFxtstASnppx7b/3O7etWjfbWcvlrjWpaccuPabfdEDunNJsojLq09cKVnOVrrCiKNta7+1N+/w78Jffz6i4NKC0CAFcq+cThab3iJnzy9bRecQaj6fb7hq59Y1ZIZFRYmWid3tB1+PiGHeJnD0rolnhP23rV+g4YmJeV9fiYx+68u8ugkU+Ex5a7kJKs1bk1ekvmzh4UH9BDpwGjD25bn3nubECzhh3id69eWq91hzNHD+h0Oq00bmS5iod3fuV5dY6IDI8pW7ZqDf+zqt3cOPnE4fcnjci5VEq3dWL/Dv2HK4oy9Maw3PyC0OCgMuUqRsSW1xmM4dGx+dkXa/AazZa7hv5ry4cLczJSs1LPXUg5m5ufHxYS4tmk2jNWhKKqk1Z+o92BRh0TdqxYXP3mJmeOHTSazdEVq+RnX2id2P/cj0cCrqLazY21l/W4Xg9teOe1CG/5X7fLlXzi8IRl26YlxtWP65STcT711MmyVarnZKSmnz2lBY+q0/37h6xRTSvOSUr2PXp3RfXck4Yd48//fNxkCSk+FnAl2AsIV6pijboGo2lc51tfMpocdvsns6e8Wj1Gq5R7xB4y5M5WDTvE/3Jo390tXxw/bmxs1ZqterVet/Pbrr37pJ0+ed/Yqc2ivSVzz589okRN8NbaDeihb4sbJ3ywNrCZp/7toiUfdzqXlW+oNr6jpzSuMy2ofHyTupMnTQoLC1u3bu2u/KCAs55ZvvMrTz3eWf7ttQBwu906nW7GjBl3dO3mrcH7XE5u7sUavN7TH2nXcOgL83o0qR0ZEbF35za9wagoyqWx1iX0TNTugL2oaMNHiz7+oH1cXFzS6QvOM0dat259wmbpfHO1iR9+WXw+nm2fbbYV86bPr3+x/O/HOw7OHN53XOdbp7ict3Xv061RDa2g8bubdsdkn/IMt3ZtQs/E/rWCR136v0B77rsnZzNzHVVHlDgWcCX4DAClUJjnqTlVmJfrXyk3ISG+RVlTblaG9kf1b7ppT1JS+Wo1D2z58rst6/re/2DmuTNV805NeurxulUq9E7s2dCUl5+VWbwHW2FBCc1sRTpv/dsPlq2MTDv6+OiRrVu3rmUpys1ImzRpUm5ubqdOnSpdOB5wlsvpbNnj/pisn3zt/SoAq3qdumfPnjZt2syZOWPkgL4P9030P70wL7ddzXILX5vTpk2bFStWaF+U9o1lzc3RLtNhs+kVZf78+e3at7+nTaO5c+fefnu7+hGqvaiw+FW4vJW/7EVFWvlfbegOtcs7HQ5PjWW7vX3Nsm/Me7VNXOslS5c2ijIUH05RFOulR989mTz2icrZJ0scC7gSrABwlXQ63VtvvdXGWyk3Oraso6jo4nFvuZImdyVOfv4l98/7b2rSIirImNCj5/VVq2h1bivVqGUJCi7eg9vtLqGZpwKibv369SERUZ/vbVD3xnod290eFRPrdrtUVbWEhCqK0uOePjfUqOF/lk6vXzCyb5uefX3tnQ7f79ndnoouy5e36H7/8hXLpr803e6w16xZ03e6Tqe2at6sT2KPxl3u+XzJIrf3crSxLi+57lZ0uj179jidTqfLvXv3brfbHRkVU+JV6C6WkLxs6Lmvz/f11ap5s3t7dm90R489J87mhlfyFJ/xDqdVrXQrSkFutudWuD1LGM8h7z3RGQzde/WuXr1aSWMBf4wAwFXSKuV2GjB69YKXVZ3qfXFSjGbLsWPHGt5669sTH3nDZnMV5Jw7d85XMtfucLpdzoTe92X41dr19VBys0v1b50u57OjHp7/yvS5c+cOHzHyYmlcr+Jn+erxXtb+Ek9vTqd6qQavyWj0P93hcOj1uoCSv74X4ssTQHV63267VNXl8gTSb12Fy+nUXpf9h9YKAvsG8r7cu/VGU763oPGl4VTF5VIV9ctFczwfCXjLT/ruiV6n/52xgD/Er4BwVYpVytUer6tV74uvtj09fryzqNBeZB02bJii6kosmXuFVYJ9nYeER1a6vL6uXq+3FxbqdLqdu3aWWI83oL3D5l2jXKrK+/1v1OC1hIR+k7Q7oOSvNpbR6HnhvnQDPPP3vOhfWiL47k2J9YGLD60VBNZoBY33eQsat61ZXqc3aMOpqpKRnlavfr0tH77Rt29ft3cyvntiCQ75zbGAK0AAoBS0oriW0LDilXK1xzb3DFjy6XJ7WEzSzu1fb9+Zmp7hdHnekGolc3cm7R4+7OFNP2X+fpVg/2a+zn31dadMnaqVxjWaLRku46pVq7YnWwPOUry/MwlobzCZPWteo8nhVhJ79d68dcugYSPmvPHOnDff8z/dZAnefDLjX+MmbNn69a2NmzhdbqPZoo21cuVnQWHh2nx8Ewt4UuJVXLx9brdW/lcbetOJ83qj5xNmvcHwlbeg8bYdOxPiE3afzdbpdNpwEWUrbD2Tv3Tp0p1Ju6+vVt3hdBnNFt+INRu3+s2xgCvgeWd0Je0AzbvHrf5PtJ8f3/Pm8X1Sfjw6qN+99qJCh82Wm5lur3qLyRK8+v2FS+dlnT/1Y9nK1c0hIQ9MeX1Kj5YBPRjNlt9pdvt9Q7rf1kRRPaVxb/WWxq124y1du3a1Wa1njx9cVrma/1mqqhZv77TbDCaz0WzucM9Du1Z9FBlbIbJcRXNIaEFG5v2DHvadPnT2e5/Mee6D2YXZaSnZaSmbjiUbTKYajVp07drV7XbbrAUBdyDgSYlX4VslaOV/oy4VBDaaLdopn8yf9UGRNe2Xk+Wq1QqNjKrVNE4bLjy67Jg+XVRVl512viA3e+ORMwaTyTfiPeOmv/fM8BLHAq6EuvDIxV84AvivGtmkgvbt/ld3ez4XAa45fgUE/H18awXgfwErAAAQihUAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQA/leknDy2duGsn3/4du3CWdo2yAD+qwgA/Flr/jPT9/hnvD78nqqVK1p+3BURGaEzlHpHs5FNKvgeSzySfOLw5g8Xao9/Zs4B3fq6Kj4B4H8cAYA/a83ClxtEGdcsfPlP9pOVem5Mn4Ss9NTCggKX42qqmjxQM+h3jlSsUbf7g0PbN76pbZ/Bf3LO/t36d1V8AsD/Mq3eEVAKG9+fv23Zu3kXMgwms82aX5iXW9tSWJiX91iLKmWrVE87/VNs5WohEWWOf7vz1o4JSauXmixBt/cdsv+rNQ89v+Dfo/pNXLZtas/WTy7+8p0Jj+RnX9DaF+Z7SnGFmg0zX55RtsoNles3WjZzUk76ea2ib1xi/44PjlAUZUSTCo06xCetXlo/ruPpIz/4SgTHJfb31CkrKrLm5jzZtlZETDmjJch6+RG32518/NDTn25/tltzl8vlmXN+3isDut47fvq7z4zwH+uz159vd9/QNW+8EhJZJqxMjE6v79h/+LfrP8vNSMtKTbbm5tgKrYV5uaqirJw7tTA/T+vK7XJpw41pWTUsKlZV1bsGjznw9frMlLPnPDV7qxjNlt6XavZ6LkQrKdygyZmjv5YUbtW938n9Sb7bYgoKURV3kbXA/6627/uw/9zih09o1DH+Wv9Q4B+JgjAotc/nvfjFvpMRWT+bg0O/zXQdX7NYq8279lhaYvMbQ0JC8vPzl+46dHDbxg3e0rVZDl38HR1mVqny5aI5rRN631sjZM0dCZ+8NK5j7/7+7a0Ht4VHRGzevPlUxSZvPTNq2LMzO9SIMSjO9OAKXRvX0QLAYbNpfZ7LyjeNGuffwFfs905vsd8lOw+9uGd7wJEZj9731F2NXggKHvvE41rR3V+qtHp/cuBYTrt9yewpc6vH3N29l+ooPGoP7dO8zvCX3+zepJavULBWGCBhxMTGZS1aV506dVJVddq0afG97tU77YcKzX1b1Z+4eF2zaF0Vb83eY2r0+L5dJ63wlAHwLym850yW/fTh1q1b/2gPurN+1REz3/TdljFPTVBUddZrs3+9q9s3Bsxt8J0tCQBcHX4FhFKLqXR93aCi229v1zuxp/LjHl8B22blTP95bU6rli0WvPZqu5rlXC6nVrp23OhH33lrUVkl//ut68rYstas3/DN50sO79rSvlZ5X/tWlcLmz5+fm5vbtm3b5/ve2aRzr6isn8Z4K/rWNBf6Kvr+WiL405XhaUcvb3Cx2G9cmzazZ85oV6ucZ6v9y49oNXituTm+Oc8a0LVVjwcCxrJ56xWf99QrbpoQH9881mgvtLarWfbyQsGe/62cO9XXlef9lF6Xnp7eolnT7t27tShnsVkLquSdeuZSzd4Gxty8rAtazV7/ksK94hpqJYXrhSsOW5H/bRkxsN/Igf0uu6tOZ8Dc8i54qjEDV0F9g83gUEqPtay6cde3yYe/e/u9D44lpx3asanI6TLrdRdy8ypfd90tHeP3b1j1y5kzZcJCi+yOILOpVY/7c08ff//99xvUrb1uy7YXpk01Vqyx8b35qenpge2dLotBv/Bw3pNta9/Ws19lk/268mUfe/wJs9Gw8HCeoiiD6oRofYZERHW4b5B/A89m/XZHaEhwix73f7tm2ZmzyRGhwcWPaEN4Kq07nL81ltZV2diYVvcOWb3gZavNbjHqM3PyqlS6rmnXe7Z+vCjfajUbjdrfncF1Q7WufGe17D1ozcJZVpvNYjRk5Vv3791doXqttNM/123QsF69+lPW7NMuxOZwBplNTqfT7nCaTZ4lhdXmsBj1/rfxyKFDiqrUrlPX/y4FzC3IZFx42FMvHigtVgAoHWtujqrTDRw8eN78Bf379Vm06E2/P/TWR9RpX+DxfrrkLV3bZdjY5HMphfl5lSpdFxMeevTET83u7u1tWqz9JUXW/MmjhtoKC+bOnWu32X6t6HupHK7L5SzewO2tuKvX/1pxt/gRja/Gr9vlKnEsrV7xHQNGuz1PPXMzeEstuj2l4HXeapaBXfnOunPQGO9Znr9cWs3eG6tXbRPXetCgwVrN3osnqpeVFPZWetdWFn635VLdSf+7FDA3rRozcBX4DAClExQW3u2RJx/p0qZ9+/ZJSd8cO3JYVVWtNu/6tWu6JcQvX/VZ94T47TsvFrxVFSW6YpXw6LJvLVzw8sszly9dojPoK9e92RIStm3nruLtNcERFyv6RoSF+ir6GkxmXznc4g28JdQ9FXe3+1XcLX5E46vxO3dYrxK7ulivOPzXesW7kpK63N15nbdQsFabN6Aru81W/CytZu+KVV/0SOw9eNCAmMbttJq9AZWE/ct4+d+WLVu2KIoSeJcuH4XvceCqEQAoHWtuzq61KwYPGpi0e7fTYT9S5PniY6bLtGrVqk2ncoaNfOyJcRML8vOXJh3VCt5qBWxvuu3O1as/mj179rQXpzfq4PnEsm6Ltpt/TPut9tac7B8LPRV99+3fZ/er6Osrh1u8QZHNphX7ff7lV7Kzs5clHVF1+oAjviHcLlemy7Ry5Wdnq7Z6rGXVgK5c3pfjgHrFW05mPDluwvhJU9auWqEVCtZuiNFs0brq2bt38bM2Hk8ZNmrM2Kcn5+flrjt6fsfyxU079woopOz/RG8w+t+WMeMmej4Efn5KwF0qXo0ZuAoEAEonKCz85rZ39bvr9uz08zq9PiQyqsINdbp07WIvLDxz7MCnlaul/XKybJXqweGRRrPlPW8BrH2bvkhavcRQVLjzm93ff7e39/MLFUXp9eTzb094ZNm/s4q3VxSl7X1DurW5rKKvtgJQFEVrU7yBUVX9i/2GRcWYg4MDjviGqNm4VZeuXdxut6rOLt6Vy1bkm4k2otFsWTJ/5uJLhYK/8hYK1v7U15XNWlD8rC/eW/jJ67/W7O0/5XX/BsWfGM2WtR+86bstJosnX+8bOKTEu+R/LnAV+BAYf4coe1Zdc8E32caXRj74+FtfXOvpAPBgBYD/un2bvlg5d2rLbn13rFj80LR/X+vpALiIFQAACMXXQAFAKAIAAITyfOv5Ws8BAHANsAIAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQysBWcAAgEysAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQyqynZwACARKwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMrATkAAIBMrAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEMqsp2cAAgESsAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQxsBQcAMrECAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMqgqmwHBwASsQIAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQysBWcAAgEysAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKoKrsBgQAErECAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMrAVnAAIBMrAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEMqsp2cAAgESsAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQxsBQcAMrECAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMqgqmwHBwASsQIAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEM7AQEADKxAgAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABCKAAAAoQgAABDKoKpsBwcAErECAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEMrAVnAAIBMrAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQ6o8DINKkxJVT25RT48qpQQbPkdoRJf/z4fjKVxQnAc3CjUr1MPXqugIAXLU/fp1tHK3bk+7eet59Mle5uYznlbp2+F+5f0SOXTmZ6/4LOwQAXAnvW/rfZdYreu8L/jmru8ip3BipGnSeNYFJp36T5spzKEad0q6Cbt1Zl9bepFMaRKkWvaJT1R8uuDKLlNZl1W2pgS/xZr0SV06XlObKsXve73922mXWK7dGq0admm+/2PiGMPX6UM/YB7Lc562EBAD8lQyq+gdv5w9muW8rr0uxKqcL3GmFSoZNqRGmbEtVaoW7K4aox3OU8kFKcoGi9aOq6k1l1JO57kybEmxwt4jRbUxxf5Nx8U999Dq1WYz6/QV3ruPin6iqenMZ9UyB+3S+u2KQUjnEc6RupLou2R2k96w5Ugv/0usGAPH+eAVwKl9JtnpelG8uoyYXKIezL74TP52vNIlRj+e4KwSrx3J+fXteLkgJNV58udfrFFVRHBfXBr+6pYyqxYm/WIvybabnyTmronWXYlUaR3viZE8Gb/8B4O8NALNOCTUqGUWeGEixujtUUA9nX/wjq9PzGKRXQvRKtu3XU1RF2Z7qdro9T6LNF1/K/elUzwe/iqL+fPkf+j6O8K0W9ma4Y8xKjTC1cojn+Z+5TgBA6T4EditK0xg1SO95btIrBd4XfdX7n6IoZ/LdN5VRUwove2nOKFIqBnmelAu6+H2hgJoDLrey5bw72KBcH3rZ8QzbxRO1R6NOaVNOzbQpezLc5S2/P00AwF+9ArC5lO8y3c1iVafLEwba2/D0IqVFrLojzX2mQLm5jHIo62LjPIdSO1z5/oK7UbRaLUxxu5VvMz3tm8cGfgjsVpTd6e625dVsm/vCpdXDDxfct0ar1cOUzCJPSNhdnjVH23Ke9cARv18xAQD+EuqyU8V+Q3/Fgrzf2yn+DR8AwP+HD4F/S4Ug5cYIda/3PT4AQFAAnLN6/mXAXzoZAMDfhx0XAEAoAgAAhCIAAEAoAgAAhCIAAECogH+lCwCQghUAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAACgy/R/IBXExYhEpGAAAAABJRU5ErkJggg=="
+    },
+    {
+        "scene_number": 4,
+        "story_text": "Scene 4: Overcoming obstacles in Generate a bedtime picture story of a rabbit and the moon",
+        "image": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAIAAAB7GkOtAAApyklEQVR4nO3dB3hUVfrH8XunJ5MGhA5BehUE6RAEKSoloQSUoihFEOkoKqDoUlQUBFFRsaKgUgREmhRBqQERVAjNKC0EkpCeyfT/M7kwhATdgO6y/t/v59mdZ56Zc8859252fnNmhvOqLx5IUgAA8uhu9QQAALcGAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhEAACAUAQAAQhnUWz0DAMAtwQoAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKIOqsh0cAEjECgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoA1vBAYBMrAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMqgq28EBgESsAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAM7AQGATKwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKoKtvBAYBErAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMrAVHADIxAoAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKIOqsh0cAEjECgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoA1vBAYBMrAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiDqrIbEABIxAoAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKANbwQGATKwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKoKtvBAYBErAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMrAVHADIxAoAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKIOqsh0cAEjECgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKwExAAyMQKAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiDqrIdHABIxAoAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKANbwQGATKwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAUFSnjxycNyT6xd5tJrSoNKtf+3mDo1ITz/7to/zy3cZRDUtqt/kf37Xy05kxkVPuqT+6Ualn76k/MyZy96rFyn9ewsm47Z+/p93+lX7GNSvvvy1sw8I5/tub7gS4UerbRzJv+CCINL1Hy2mL11S1J4SXi8hMTVn546+bln06dM7Hf+MQudlZrw+Nrl+5wueffxZWvMTcfee1x4/s2Lz27Zefffm1xhWKhZWNSDt/ev/ZtGlPje36+KTaLdop/2HFzLqygfojqc6/0sm4ZuXT0tLCwsJe23vuus9+ezKpXbWS1322iJ0AN8pww0dAqrSLCc2CnffF9LuYkjrgoYe7R0d9kXD6lf4dLp6KLxlRxWAyWUOLZ6WmJMYfK1GuosFsiZk4c96QqLZ9H934/mvWsOJBYSV0BkOnR8Yc3rE5NfFc/ma33X6nNsTKOc81iGz/ZN9uHo83NztLUZTXh3YfvXDVNx/M6ztwcI0gpUtU9/NnTpWNqPTZxx/Wva3C2rdeWjFr8vD5S14f2n3Cog1TOzeqWLt+Yvzx/BO4o0O3/etW3NG+a8KvRy2BVm22eoNRbzDYc7KTz/wWXrGyNbTYyR93N+oYvXv1ksr1m5w7fthoNhUvG5GTkXrnPT22Ln77maXfvdinjcFoKnA67R96/ODmrzKTk9Iuns9IudD4vphfvv9m9q5TGckXFk0ekZ2e6u/flpXptNttmRlPt6sZWrJMTnqqwWTOzco0mEx2W05uVmbtAHtuVua45hWCw0p4PG6TJbBx55jTRw5mplzU5mwOtNqyfG/XbFmZH0wckv8aVq7f+OjubVmpKQaTyRIU0mP8C3Vatb/Vfy/4ByAAUFQmS0Cx0GBrULD7wsWv136dkpZWrFixOS/NDA0JdrndoyZMNAdZX3r2qUqVq6QnnotTik8ZEOVyOpfPm/561ZJde8SoTnucwzqgZZ1nFm9oEa7P32zKyl2Kopw8sDv1/JlHurSbO3fue++/r6hql4iA3LmfKopy5uhP9zWfNXnKFL01ZOrXP7z/xMNTpj7/3JTJxcLC5i7buPnj+Xe0u+/+KgEbu/R8auSwaybgcGz5/MNlX9xzNjn9YueePe6srs32sTHjLAHWl994LcgamJWds2z34cM7N2/54sMvlnSIjIyMPZPqPnu0devWJx2WXq3uMBhNk7s0fsVoKnw6/VvWHvHqwl6Na4WFhR7aH9u9Z8+w0FBFUZbPmtShz0O9W9T19//L99/odLpXXnnlnm7dnQ57/74PDBw2onPb1ubAoH0p7vgNS4KDgzdu3HjIbu1ULdyoeC4GlOlYq9yIV9/3z/njrfvidm31/S/h9XYeNDL/NRzUvPqW+JTi6ae03t6Y8RwBgKLQqUDRuF2uXWcztm7e9OFHH7XvdN/qL5ZMfHzYe2+93iay9dLlyx+JiR7U476pT02oHVG2T+9ejcxZ2emXnLk2vU53MTGxRbNm0dFRLUubHLk5lbNPFWjm9XjcTseKWZObN29eKjx86dKlBqNZ8Xo3nbO/O3aAqqr2nOx6t9fft3dvj/EvhJeP6D72+dg9e2rWqLF82bJSStbBb74KsaeuXfNVv3vaFJyAw65XlSWLF78waWLr8lb/bIc+0GviqOEL35jXqmXLd994vX2NMl6PR68oCxYsuLt9+/vbNJo/f367dnfXC1VzMtJy895352ZlFj4dZ66tffUyC9+cFxkZuXzZUqNe53I6VFU9umd7h5pl8/evKIpep+7fv79NmzbzZr/y8osvDn4gpl27u/vE9NLH/zB16tTMzMxOnTqFnD8yYeyY1q1b17TYXfbc9jVK++fcOqK4ol7evLHANdTpdPUCHVpv5rM/N4964Fb/seAf4p0430Ib+HOZl5K3fvLW98s+jKhas3XjBo8PH7Zq1erBgwfVqFW74T09DSbTT9+sPHLkyLGjcWUq10g++3vtBg3r1K2X+NsJh9NVqmR4yweGrn9nts3htBj1adm2Qz/sy9/shXU/xn69dN1bL67+YklMnz6nf/8tPT09NDS0eVTfvs+9ZrEGPd6gREpqevmypR+d/3nNppHH9n63cEy/X+Pj27RquXjF6qYN6i1fu3HO9KnLvlx5LO5IgQnYna4As0mnN1xMuVSxfLnLs934ZdzRuKpVq9XvEPXzljWnz54tFhzkcLkDzCa32+10uc0mo9frtTlcASbfKjnX5bYY9F6vt/DpXMrIiqhQvnHX+3cs/SDbZjMbje/EZY28I/xicnLF8uXz9293uoKtgc17PPjjhhUnjx/bsPGb0NCQjz5ZcuxcUtzurXa3x6zXRT/+VITJVaFMqbETnjAbfJ3751yrUbO3nxisNStwDUuHBu84fPJ83I9ab8nnfp++8adb/SeDfwA+AkKRqKp6/Lv1Ly5ZO7F3pwvnzqzfsCF21868h1VF8RqMpvT0NMXjuffee50ut9fjju7T71Ki74tKr6pLS0vrOGjsundeVXW+N7D27KwCzTxud6NO0UEp8ZXr3L502fLc7MzgkJBFixbZmvS052QrimIOtP7886GmzZuvem3q0DmLVs19vmnzFnFxccePn7BaTKFhodUiKuzcuUv1FpqAqio6ncfr1et8rs42I11V85a/eu2HcL6JeRXV7XYriuJRVY/H43s2b8L5FT4dvV6vPaXT6bR+tMulXZxr+vd63W63zuCLFrvd8fDDAzt2uvex4Y+WqdmgRe3K2oEvjBn29muvzJ8/f+So0Vqf/jlnZfsuhSb/NYyKecDlcg4aPKS81aD11ql10//G3wT++fgZKIrE6/VG3j+oV4NKNWrXyUq7FBwQcObMmdjYvV27dP5x85omVcvNnD7j0JGjPXv2NAcE9h04eOyoxwdOf8v3+pv3ShgYHOp/KT10OK5AM51ef+Cb1UuXLa9fv0GbNpFt27bNzMh46KGHPp86asGovoqiRNRusH7PoekvPO/KSp/auaE7O33a889t2PeL0RKwZNFHE5988ttNGxVVPXS44AS0QVVfhATt/+GHq7OdMWPv/gPdo6MObV7TPTpq5+49WjttWXzlFbyQ653O3tjYrl06H9q8pkePHorXo31KY7YG7dy9p0D/OsXbubOvZa+ePfYfPLRt27YdO75/ZNDgqiWsiqo6c3N1On2F4qErvlxpsViMRt+bs/0/7PfPuV31Mjqd3uVwKIoSu3+//0zHjRnVrs/A916d7u8tvMJt/52/CvzT8REQiiQrNWVajxbzV22pZbIVK1cp8dTJl19fkHjm9wXz5xtMplyHa8jw4eUrVXnuidHBIaE5WZkbjiUuWzAn/uBe7WeLc2MTxjYtl5aWFmg2T3hzcXSjqvmbjX53Zf6xtJZhoWHHEy+tPJZiDrQe2bnl67denPrKvDvLh4WVrZiacPpAQvoLT44pXala3Xq3v/nsuKdfe/fTN+c8PPmlAj37J1CjSWSXAUN6NqqmzXbY4yPDy5af9vQEq9WanZ29bO/R18c+lJNrDwsL8/3eKe+QP7njPx2LwTB85vwH2zU2BQRu2bj+sRGPh4YEv3044/0nB7Xu3COmaS1//3NH9c+25S774ouGzVqkpaU9NmLkoyNGtG/Z1O1ypoZVahcR+nuG4+ftG8PvaBOamXDw0MFuPXqFh4WMf3OJf84fbtr1/uSRCek586ZPdUbU95/pV4d+mztu8Pqf4kvkXNB663ZH1Vd3/Hbr/ljwj8FHQCiSoGIlHvzX/OeGPeTIzbmUcKZ05ep6g8HldMY8+HDSmd/KVK5hCgg4dfr0gMHDLp6OL1mxssUa9OC/3pjeq9VHx3P8nXx0PMdotqz9dOGyN1PzNys83EfHc+y2nHVncheM6jv2/a/qtGqfmnhu8shHc7My0pMSQ0uWCQgObTdgeNU7mv0rupk3rPRHU8YPfe3jwj37J9D7qZcWTXlsSa7tymwDz50713/Q0KQzv5WsWCUwNMxotvinWpQ7l0/HYmlZMWz06NE/7NvXpEnjyDZ3WazBiqL0enLGoikjVr6d6u/fHGhtf/8je9d8HlqybFjpcrlZGa/MmjU1NUXV6YPCipepWqtr124XfjuRnnyhRPmIxPhjjTot05sDlr31yhK7XZuzNax42aq1Hp00bf+6VU7758tCwvxn2qbPIw/e1y4j+YLWW5fHnv5P/i3g/w9WAMDN++iZYQ+NfbpFSaMhMCgr5eKeFM+bk0Y/8ek3t3peQJGwAgBuXrsBw+dMGOZ2uc7HHytXrZbeaOo3de6tnhRQVKwAAEAofgUEAEIRAAAgFAEAAEIRAAAglOF6/94RAPD/HysAABCKAAAAoQgAFJWvLu5nedVxP/uz6rjfLf1gZp+7JnW6fUzT8jNiIl8f1jM1b1vQv92GhbP9t0U3pmk5/23RG2ujLH3pqaJcgb9+PW/u1IAbpb7LPwTDDVXHDdAfSfvD6rhHdm3d9NH8Z2e8XLdkoNESeDHx/Cebdu/cuGbse6v/9smMaVpu+69Jd1UtOS824YaO0jZ0K8pR/saKomhjLTqU+OdX4G+5njd3asCNIgBQVAkn42b0jpy87PsZvSMNRlO7fsM2vDfHGlY8uFgJnd7QbeSkhh2i5g6J7h5zf9u6lfsPGpyVljZh/Lh7u3QdMvqJkJKlUxMTtBq2xrxqvXOHRBXoodOgsYd3bLp0/lyBZg07RO1bt7xu6w5nj/2i0+m0erlhpcvF7f5W2zQ0JLxUqUrV8h9VuX7jhJNxn04dlZF8UWvfOmZgh4EjFUUZVic4MzsnKDCgWOlyoSXL6AzGkBIls9PT/IffN+zJ7Z8tzEi5mHbxfGriuczs7GCrVdX5ygD4yj2q6tTVe7Ur0Khj9K5Vi6vUb3LWV0PYXKJcRHZ6auuYged/PVrgLCrXb6y9rEf2fmTzx2+EhpcOLemrQZZwMm7yih0zYiLrRXbKSLlw8VR8qYgqGSkXk8+d0oJH1ene/jltTNNy82IT/LeKomjXpGHHqAu/nzBZrIXHAoqCvYBQVOWq1TYYTc90vvPlvOq4y+ZOe71KuFYd96jT+ui9rRp2iDp95GCXli9NeubpkpWqt+rdeuPuA9369E06E9/v6enNSuTVsL1w7qhSfHJeueACPfRvUWfykg0Fm/mK+n6w9ItO59OyDZUndfTVy3UnBZSJalL7+alT8+robtiTHVDgqOdW7v528TvDX5iTv70WAF6vN39t3ief/VdGZuYbc2b5D3/s7obDXnyrZ5OaYaGhP+zeoTcYFUW5MtbG6F4x2hVw2u2bP//giyXtC9QQ7ly/8pTPvik8H0VRXA7HqrdmLah3W8fOXZ0O+xe7Ds8e2f+ZzndO87jv6tG3e6NqWu3fRVv3haef8g23YUN0r5iBNQLHXPmfQLvvvybnLmW6Ko267lhAUfAdAG7AH1XHbVHKlJmWoj1V7/bb98fGlqlc/Zft3/y4fWP/Bx++dP5spawrNWxjejU0ZWWnFSwX3KKUr1zwdZo57Lq8or5LVqwOSzo2Yezo1q1b17DYM1OS/HV0K6SeKHCUx+1u2fPB8LTf/O2z0y5dOQk1f23e0YP6D+8fk//w3KzMu6uXXvjGvDZt2qxatUr7obR/LFtmhnaaLofjujWEnfbcwmfhySs05rTb9To1du8ebegONcu4XS5FUdxOZ/vqpfy1fxsVNxQeTlEU25Vb/zV5/uknKqbHX3csoChYAeAm6XS6Dz/8sE1eddwSJUu57PbLj+eVxGpyX8zzM1/2/n7o9iYtigcYo3v2uq1ShFbDtkK1GpaAwMI9eL3e6zTzehVVt2nTJmto8a9/aFC7Tt2Od7crHl7S6/WVbLRYgxRF6Xl/36rVquU/SqfXvzO6f5te/f3t3S7/5+xeVdWtXLmyRY8HV65aMevlWU6Xs3r16v7DdTq1VfNmfWN6Nu56/9dLP/BeKRBmsQZdWybMq+h0+/fvd7vdbo933759Xq83rHj4dc9Cd7ls5DVDz39zgb+vVs2bPdCrR6N7eu4/eS4zpIKiKNpw3ssjKTmZ6b5L4fUtYXwP5V0TncHQo3efKlUqX28s4N8jAHCTtOq4na5Ux817cVKMZsvx48cb3nnnR1Mee8/h8ORknD9/vnAd4JR85YL9PVy/2ZWivm6P+4Uxwxe8Nkurl+v1BcPll+PCR3nc7lxbdsH2V/h6c7tVrTavw24yGvMf7nK59JcL+V4t8+t/Ib42Aa5fQ/i689Fel/MP7cz3Vl2r/etVvHqjKftK7d+84VTF41EV9ZsP5vm+EvB6fE9cLXSs/5OxgH+Lj4BwUwpVx9Vuy9eou/bbHc9OmuS25zrtthEjRiiq7rp1gItYLtjfuTUkrEL41Xq5vnLren1eHV3d7j27CxcZLtze5chbo6iqVpv3p7zavNu2bdu1+5rDLdagvbH7rinzm1f53ZmbazT6XrivXAD1j2oIX7foceGhd+7KK0ScR6tXfDCv9m/b6mV0eoM2nKoqKclJdevV3f7Ze/379/fmTcZ/TSyB1j8cCygCAgA3wBLkq3doCQoOyLuj3fofVBSlzf2Dln650hkcHrt75/c7d19MTnF7fG9INx9PHDFm3O7YfSNHDN/626VdqxYX7kFvMBZu5u88JzP9pM343bZt06ZPd3iUQGuQ0WxJ8RjXrFmzM8FW4Cgl7zOTAu0NJrNvzWs0ubxKTO8+277bPmTEqHnvfTzv/U/yH26yBG6LT3nymcnbv/v+zsZN3B6v0WzRxlq9+quA4BBtPv6JFbhz3bO4fPm8XpdX6dWrlzb01pMX9EbfN8x6g+HbX5OfeGrSjl27o6Oi951L1+l02nChpcp+dzZ7+fLlu2P33Va5isvtMZot/hGrN271h2MBReB7Z1SUdoBm0Qlb/jva34//fvOovom/Hhsy4AGnPdflcGReSnZWusNkCVz36cLlb6VdOPVrqYpVzFbrQ9PenNazZYEejGbLnzRr1+/RHnc1UVRdYvyxOzst05ktlevc0a1bN4fNdu7E4RUVK+c/SlXVwu3dTofBZDaazR3uf2TPms/D8mrzmq1BOSmXHhwy3H/4sLmfLJv3ryVzc9OTEtOTErceTzCYTNUatejWrZvX63XYcgpcgQJ3rnsW/lWC2+V8+OGHi5epEFa6XHDxcKPZoh2ybMGcJXZb0un40pVrBIUVr9E0UhsupESp8X27qqouPelCTmb6lqNnDSaTf8T7n5n1yXMjrzsWUBTqwqOXP3AE8B81uklZ7df9r+/zfS8C3HJ8BAT89/jXCsD/AlYAACAUKwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAD8r0iMP75h4Zzffz6wYeEcbRtkAP9RBAD+qvXvzvbf/hVvjry/UsVyll/3hIaF6gw3vKPZ6CZl/bfXfSThZNy2zxZqt39lzgW69XdVeALA/zgCAH/V+oWvNihuXL/w1b/YT9rF8+P7RqclX8zNyfG4bqaqyUPVA/7kkXLVavd4eFj7xre37Tv0L845f7f5uyo8AeB/mVbvCLgBWz5dsGPFoqzUFIPJ7LBl52Zl1rTk5mZljWsRUSqiStKZ30pWrGwNLXbiwO47O0bHrltusgS06//ooW/XPzLznbfHDJiyYsf0Xq0nLv7m48mPZaenau1zs32luILMhtmvvlIqomrFeo1WzJ6akXxBq+gbGTOw48OjFEUZ1aRsow5RseuW14vseOboz/4SwZExA311yux2W2bGxLY1QsNLGy0Btmsf8Xq9CSeOPPvlzhe6N/d4PL45Z2e9NqjbA5NmLXpuVP6xvnpz5t39hq1/7zVrWLHgYuE6vb7jwJEHNn2VmZKUdjHBlpnhyLXlZmWqirJ6/vTc7CytK6/How03vmWl4OIlVVW9b+j4X77fdCnx3Hlfzd4Io9nS50rNXt+JaCWFGzQ5e+xqSeFWPQbEH4r1XxZTgFVVvHZbTv6r2r7/8Pxzixo5uVHHqFv9R4F/JArC4IZ9/dZLaw/Gh6b9bg4MOnDJc2L9Yq0274bjSTHN61it1uzs7OV7jhzesWVzXunaNJcu6p4OsyMivvlgXuvoPg9Us66/J3rZy8907DMwf3vb4R0hoaHbtm07Va7Jh8+NGfHC7A7Vwg2KOzmwbLfGtbQAcDkcWp/n07JNY57J38Bf7PfevGK/S3cfeWn/zgKPvPJ4v6fua/RiQODTT0zQiu6ejmj16fMFx3I7nUvnTptfJbxLj96qK/eYM6hv81ojX32/R5Ma/kLBWmGA6FFTGpeyaF116tRJVdUZM2ZE9X5A73YeyTX3b1VvyuKNzUroIvJq9h5XS0zq323qKl8ZgPwlhfefTXOeiWvduvWvzoB761UaNft9/2UZ/9RkRVXnvDH36lXduaXA3Ibe25IAwM3hIyDcsPAKt9UOsLdrd3efmF7Kr/v9BWyblTa9+8a8Vi1bvPPG63dXL+3xuLXStc+MffzjDz8opWT/9N3GYo609Zs27/16adye7e1rlPG3b1UheMGCBZmZmW3btp3Z/94mnXsXT/ttfF5F3+rmXH9F36slgr9cHZJ07NoGl4v9RrZpM3f2K3fXKO3bav/aR7QavLbMDP+c5wzq1qrnQwXGcuTVK77gq1fcNDoqqnlJozPXdnf1UtcWCvb9d/X86f6ufO+n9Lrk5OQWzZr26NG9RWmLw5YTkXXquSs1exsYM7PSUrWavflLCveObKiVFK4borgc9vyXZdTgAaMHD7jmqrrdBeaWleqrxgzcBPU9NoPDDRrXstKWPQcS4n786JMlxxOSjuzaand7zHpdamZWxfLl7+gYdWjzmtNnzxYLDrI7XQFmU6ueD2aeOfHpp582qF1z4/YdL86YbixXbcsnCy4mJxds7/ZYDPqFcVkT29a8q9eAiiZn+TKlxk14wmw0LIzLUhRlSC2r1qc1tHiHfkPyN/Bt1u90BVkDW/R88MD6FWfPJYQGBRZ+RBvCV2nd5f6jsbSuSpUMb/XAo+veedXmcFqM+ksZWREVyjftdv93X3yQbbOZjUbt/ztDawdpXfmPatlnyPqFc2wOh8VoSMu2HfphX9kqNZLO/F67QcO6detNW39QOxGHyx1gNrndbqfLbTb5lhQ2h8ti1Oe/jEePHFFUpWat2vmvUoG5BZiMC+N89eKBG8UKADfGlpmh6nSDhw59a8E7Awf0/eCD9/M9mVcfUaf9gCfv26W80rVdRzydcD4xNzurQoXy4SFBx07+1qxLn7ymhdpfYbdlPz9mmCM3Z/78+U6H42pF3yvlcD0ed+EG3ryKu3r91Yq7hR/R+Gv8ej2e646l1Su+Z9BYr++ub26GvFKLXl8peF1eNcuCXfmPunfI+LyjfP/n0mr21qlSqU1k6yFDhmo1ey8fqF5TUjiv0ru2ssh3Wa7Uncx/lQrMTavGDNwEvgPAjQkIDun+2MTHurZp3759bOze40fjVFXVavNu2rC+e3TUyjVf9YiO2rn7csFbVVFKlIsIKVHqw4XvvPrq7JXLl+oM+oq161uswTt27yncXhMYermib2hwkL+ir8Fk9pfDLdwgr4S6r+LuznwVdws/ovHX+J0/ovd1u7pcrzjkar3iPbGxXbt03phXKFirzVugK6fDUfgorWbvqjVre8b0GTpkUHjju7WavQUqCecv45X/smzfvl1RlIJX6dpR+B0HbhoBgBtjy8zYs2HV0CGDY/ftc7ucR+2+Hz5e8pjWrFmz9VTGiNHjnnhmSk529vLYY1rBW62A7e133btu3edz586d8dKsRh1831jWbtF2269Jf9TelpH+a66vou/BQwed+Sr6+svhFm5gdzi0Yr8zX30tPT19RexRVacv8Ih/CK/Hc8ljWr36q3OVWo1rWalAV568l+MC9Yq3x6dMfGbypKnTNqxZpRUK1i6I0WzRuurVp0/ho7acSBwxZvzTzz6fnZW58diFXSsXN+3cu0Ah5fx39AZj/ssy/pkpvi+BZ04rcJUKV2MGbgIBgBsTEBxSv+19A+5rl558QafXW8OKl61aq2u3rs7c3LPHf/myYuWk0/GlIqoEhoQZzZZP8gpgHdy6NnbdUoM9d/fefT/9+EOfmQsVRek9ceZHkx9b8XZa4faKorTt92j3NtdU9NVWAIqiaG0KNzCqav5iv8HFw82BgQUe8Q9RvXGrrt26er1eVZ1buCuPw+6fiTai0WxZumD24iuFgr/NKxSsPevvymHLKXzU2k8WLnvzas3egdPezN+g8B2j2bJhyfv+y2Ky+PK13+BHr3uV8h8L3AS+BMZ/Q3FnWm1zzt5048ujH57w4dpbPR0APqwA8B93cOva1fOnt+zef9eqxY/MePtWTwfAZawAAEAofgYKAEIRAAAglO9Xz7d6DgCAW4AVAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAGtoIDAJlYAQCAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhlUFW2gwMAiVgBAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBnYCAgCZWAEAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIZVBVtoMDAIlYAQCAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhlYCs4AJCJFQAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBlVlOzgAkIgVAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAGtoIDAJlYAQCAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAZVZTcgAJCIFQAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBraCAwCZWAEAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIZVBVtoMDAIlYAQCAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhlYCs4AJCJFQAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBlVlOzgAkIgVAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIZWAnIACQiRUAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAQAAAhFAACAUAZVZTs4AJCIFQAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBAAACEUAAIBQBraCAwCZWAEAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFAEAAAIRQAAgFD/PgDCTEpkabVNaTWytBpg8D1SM/T6/3w4qmKR4qRAsxCjUiVYvbmuAAA37d+/zjYuoduf7P3ugjc+U6lfzPdKXTPk79w/IsOpxGd6/8YOAQBFkfeW/k+Z9Yo+7wX/vM1rdyt1wlSDzrcmMOnUvUmeLJdi1Cl3l9VtPOfR2pt0SoPiqkWv6FT151TPJbvSupS642LBl3izXoksrYtN8mQ4fe/3vzrjMeuVO0uoRp2a7bzcuGqweluQb+xf0rwXbIQEAPydDKr6b97OH07z3lVGl2hTzuR4k3KVFIdSLVjZcVGpEeItZ1VPZChlApSEHEXrR1XV24up8ZneSw4l0OBtEa7bkujdm3L5WT+9Tm0Wrv6U6s10XX5GVdX6xdSzOd4z2d5yAUpFq++R2mHqxgRvgN635riY+7eeNwCI9+9XAKeylQSb70W5fjE1IUeJS7/8TvxMttIkXD2R4S0bqB7PuPr2vHSAEmS8/HKv1ymqorgurw2uuqOYqsVJfiUtyoFLvjvnbYrWXaJNaVzCFyf7U3j7DwD/3QAw65Qgo5Ji98VAos3boawal375KZvbdxugV6x6Jd1x9RBVUXZe9Lq9vjslzJdfyvPTqb4vfhVF/f3aJ/1fR/hXCz+keMPNSrVgtaLVd/+vnCcA4Ma+BPYqStNwNUDvu2/SKzl5L/pq3n8URTmb7b29mJqYe81Lc4pdKRfgu1M64PLvhQrUHPB4le0XvIEG5bagax5PcVw+ULs16pQ2pdVLDmV/ireM5c+nCQD4u1cADo/y4yVvs5Kq2+MLA+1teLJdaVFS3ZXkPZuj1C+mHEm73DjLpdQMUX5K9TYqoVYOVrxe5cAlX/vmJQt+CexVlH3J3rZl1HSHN/XK6uHnVO+dJdQqwcoluy8knB7fmqNtad964Gi+j5gAAH8LdcWpQp/QF1lA3u92Cv/CBwDw/+FL4D9SNkCpE6r+kPceHwAgKADO23z/MuBvnQwA4L+HHRcAQCgCAACEIgAAQCgCAACEIgAAQKgC/0oXACAFKwAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAEIoAAAChCAAAUGT6P/OBp5qIi3KsAAAAAElFTkSuQmCC"
+    },
+    {
+        "scene_number": 5,
+        "story_text": "Scene 5: The happy ending of Generate a bedtime picture story of a rabbit and the moon",
+        "image": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAIAAAB7GkOtAAAnrUlEQVR4nO3dB3QU5frH8Zkt2U0PIaEX6QJiQYpAgoiAiJhQAoogIEUQpSkWEEWvgI0qCHLhKldFrxQBEQEpF5QaimKhF5EW0ttmk93szv/sDixLErw0L9f/8/2csGfP5J33nZmTzG/f7PI+6pt7UhQAgDyGm30AAICbgwAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigAAAKFM6s0+AgDATcEMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiTqrIcHABIxAwAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKBNLwQGATMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKpKsvBAYBEzAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgTKwEBgEzMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqSrLwQGARMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKxFBwAyMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiTqrIcHABIxAwAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKBNLwQGATMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAok6qyGhAASMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgTS8EBgEzMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqSrLwQGARMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKxFBwAyMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiTqrIcHABIxAwAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQysRIQAMjEDAAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAok6qyHBwASMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgTS8EBgEzMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIA+MtLOnZozbypJ37es2beVHtO9s0+HPxlmG72AeCv5Pd9Py6dMi4vKyP11Imy1WpaAoN7T5hVqlylG9L5/q0bFrw2zBoceu63I6GR0VGVqtZo2Cx++Kv6d39ct2LDJ7NyM9LOHD0QGBJmz80uX6POueOHB0ye/8krT0/dcfo/9j+yacWpO07rj8rNph/G8Eblu4x6o1ajFod3bbn30QHX3NsHw3r0GPpC0PHE8Ihwg4lfalwp9YN9OVfcGNKN79z8jQUrahSciapQJScjbekPR9cu+nTglH/ekM53fPV57QpRA+LapGRkR5QpdzbPtTPF4d+gWqipQaT5yJ5tMTExmzdvrtmw2ajBT3w0/58RERFXGACZmZlX2PjP5juY+T+eLR9k3JfhvJ7eRjSucOTYsanvvnPGFNmkc+/A0LAbd6T4/4wAwFUY1eKWxO3bH3ygbXJaRq/efTvFxz0z6kWD0Zh84lh0leqmgIDg8MjcjLSkYwdLV6hsslgTXpg4fUBcqx5PrvnH1OCIyJCI0gaTqd0Tw3/dvC4j6bR/s1sa3P3pq0PrRQcHBwe/N31qeFS5qEpV08+eGv/tz+8N7DRs7rKLM4Aj+7OyssLDw8vXvPXskQM5ubbQkOCQyKjQUlGqwfBA/5Eldq4oylP1w3JseSFBgb7GMQl9d6/5Mic12e12BViDWnTt/fWsN2MSnlj/8cywqLLh0eXMFuupAz/Fdu/v25J07ODTsxYteuulPhM+mDOy15hF30/sFvvSFxu/mPB8kUGLn/j9vZ/+cd1XOakpmSlnM5JO59hsoSEhZotl9MLv3uze0mQOuGz75LPZaecaPZjwy/ffTt56Ijv13McvD7FlZaSePB5VuVp+Xu7ZI/v1OClTpfrzC9aFlo6+2T8p+GtgtoirEGANLBUeGhwS6jqX/PXKr9MyM0uVKjXlrYnhYaGFLtfQ516whAS/9cqLVatVz0o6vV+JHNsrrtDpXDx9/Hs1ojt2TlCdBfsdwb2a1xu9YHWzKKN/s7FLt2YknaoR23n39i3WoJCQyChrSOjgGZ8/VCUwf9qniqLc2ebhO9s8rN/HrSGhqqqO+2rn4HqhBqNxwoQJcd0eNbqcP+cF9I5pUGLniqJomqaq6iWNYxuM/+LbdjWjzIo7ObBcfOO6hQ7H8tnvzG5wS9sOHZ2Ogn9t/WXykJ7+W16fOqtfk2r5fQatnT+9RVz3x2qHrm4X/+WksR36PVNk0OIn3rN53SGT5nZtdGtERPjubZuNJrOiaSZzwMsPNXrXHPDH7ffuSuzUpUtEeLiiKIvfGdOme+9uzeqHBAfl2vIWbfu1YN+WsPDwjRs3Hi3XyOnWbvaPCf4yDCpwxVyFhVtPZW9Yt/aj+fPvb/fg8i8+e+HpQfNmvdcyNmbh4sVPJMT36/zguBefq1ulfPduXRtacm1Z6c58u9FgSE5Kata0aXx8XPOyAY78vGq2E0WaaW63w55XrWatrt0e+e777+Z/MDO+71NT+3ZYe7rg7yN6+R+D72dXf24yGlJTU5s1bdK5c6eY8oGX67zExu5CV3Tmb8+NGB4TE1PHWmDLTHcWFBgNauKO7S1btpw++d22dcq73S7/Lf07t//043+WU20/f7emtDNr1dp1O1cu+vX7tcUHLX7iznz7/bXKzX1/esuWLZctW+ZdiFHNz/VMwfNzc/6gfWxs7OJFC81GQ6HToarqge2b2tQpP3fm9BbNm/995nuxlcNmz56dk5PTqlWrtx9v77Dn3bwfEPzVzNmfe1MTCH8ZOempGz6Z9f2ij6rUqBPT6I6nBw9atmx5//79at9a964HupgCAn76dum+ffsOHthfrlrt1FO/1b3jrnr1b0s6ftjhLCwTHdX80YGr5ky2O5xWszHTZt+7e6d/s9e/+eHjsUOG9X0s8fuNH32y4L4W97w4Zuy9re6dtuNUvi3XGhziO4zB9ULzC11Wk/GDfTmD6obond/TfcCauVPsDofVbCqxc0VRSmwc//SLVQIKK5UrM+K5UVazSdO0AmdhaHDQPZ0f/2H1klOnz4SHBPlv+e348bvuvOOb9RvvqFtnzabNEyeMN5evuWHBBylp6UUGLfHE07Nzq1Sq2KjjI5sXfmiz2y1ms6qq+ulomnYl7efsz33mzqjk1NTKFSve3ibu5/Urfj91qlRoSIHLrV+Tm/ozgr8YPgaKK6Wq6qHvVr352crjB35Zsvzrjp06P/nkQKPR5H1x7flTRlZWpuJ2t2/fvn6Nqi1jYwYMGJie5Hm7VVMNmZmZbfuN0DxPPa97C2y5RZq5Xa4ju7ctWb3h8yXLwqLKfLt+Q53aNRXN89cM/1f9xemdPzBgpLdzw+U6v1zj14cPdubnzZgxo9Dh0LzDaZrmcrkMJrOmaU7vjv5b3Krh5MmTdltupUoVS4eFHDxyrHHHbiUOWuKJG41G/UgMntGLntcVtvdeEO/LN6P++8ua7rhGBACulKZpsY/063pH1dp16+VmpocGBp48eTIxcUfHhzr8sG5F4xoVJo6fsHffgS5dulgCg3r06T9i6NN9xs9SVNVzg1LVoNBw341q76/7izQzGI29Xn+vd1zb9g+0Sz5x9I7b6h04eMhht5kN6uyhPS57TFfc+eUaV44KX/LlUqvVajZ7k0xVDYrWoUOHvetWdO3SecvW7d5fkotbtm5PNJrM8+fOmTRp8rLFCw1GU+Vbb7cGBRcftMThdiQmdnzI01Xnzp0Vzf0fz6Voe28WWoJDtmzb3ik+bu+6FZ3i47Zs8xwkcA14ExhXSlXVpbPebd2u/dxZM0tVqJp04sjfpr6fdPK32TNmvPTKa/mOwgGDB2/Y8+uro0a++Mprebk5qw8mbV22IDAkVFEU/dHqfTSazOsOJQ0ZfkmzRh0SNv1rXmjPfsOefurZZ5/NSDm38bS9+p1N21a05M743P8w9E70xyvvvMTGqqoesZu/27jxx70/OtxKUHCILTenUFO6du06YdLUrKysxTv2K4pSZEuFWnVXrl0/bdq08W+9c1dbz/vStRq1KD5oicf272Npz49+ecy4N1avWOZya2aL1RQQ4GtQ7PAMS7f/Mmz4iFEvjVm/ZlWBw6lPhuo2u2/DkeSnho0cNXqszWZbtOOA0Wz27wS4QgQArlRIqdKP/23Gq4N6O/Lz0s+cLFutltFkKnQ6Ex7vm3LyeLlqtQMCA0/8/nuv/oOSfz8WXbmaNTjk8b/NHN+1xfxDeb5O5h/KM1usKz+du+j9DP9miqLED391/phB853O5BNHy95SMygswu12f3Myf/bQHiP+8ZX/kRTp8Eo6L7Gx0RzQqWVj1WBIOnawYbtFBotVteW6Cp19+/YtVa5SRNkKoZFR3re+L27R3C5nfn6Aq2Dbjp0//7A7YcJcRVG6j377k1eHFhm0pBO3LJ416fOC/KzUc1kpSesPntHv/r5mRdtbrc0rRwwbNmz3zp2NGzeKbXmvNdhzi+/6/ISPxw5Z+kFGysnj0ZWrB4VHmC1W/32BK8SbwMBFI5pU0D9QPy3xzOW2lC7MrG+xb88yvT30iZEfff3nHcz80YN6j3ipWbTZFBSSm5a8Pc39/phhoz799s8bEdIwAwAuUfyltP+WvRtWrpgxoVnnntuWLugzcfafeiT39Ro85blBrsLCs8cOVqh5q9Ec8Ni4aX/qiJCGGQAACMWngABAKAIAAIQiAABAKAIAAITyLkgFAJCHGQAACEUAAIBQBAAACEUA4Lp8t/DDid3vHdOuwfAmFSckxL43qEuGdyXkG2713Mm+xys3vEkF3+OVN9ZHWfjWi5s+n3fmyP5Nn89TrpveT4m9XdupAddP/Tv/ExjXat/WDWvnz3hlwtv1o4PM1qDkpLOfrN22Zc2KEfOW3/CxhjepsOloyr01oqdfWJPnCvfSV/K5kr18jRVF0cf6eG9S+UDjvszrqtjuU8piKLG3azs14PoRALh20wbEd0p4pFX9aj379c/NzHzu2ZHtH+o4YNiosOiyGUln9ArpZm+F9GkD4u57bNDqeVOCIyJDS5U2GE3t+o34dfPa9LOnizS7q03czm8W149pc+rgLwaDQS/XHlG2wv5t//bcncMjwqLKlKla03+varc3OnNk/6fjhmZfKO8ek9CnTZ9nPFXA6oXqheBLla0QHl3OYDKHlY62ZWX6dn9w0PObPp+bnZacmXyhUHtwsGrwFGbxFOBV1XHLd0zoFmsyBzRsG7912YLqtzc+dehXs8VSukIVW1ZGTEKfs0cPFDmLarc30m/rsd2eWPfPmeHeavKa233myP6Xl2yekBB7W2y77LRzySeOlalSPTstOfX0CT14VIPhg58zhzepMD3xjO9RURT9mtzVNu7cb4cDrMHFxwKuDYvB4dr9vu/Hh5q/NWb0S9FVa7XoFrNm256Hu/dIOXnssZfGNy3trZB+7vQBJfJlb4X0RdPeeK96lF7x/IAzuGezei9/trpoM4dj/b8+XPhFu7OZNlO1MW095dpdKYHl4hrXfW3cuNDQ0DVrVm+3BRbZ69Wl2/69YM7g16f4t9cDQNM0g8Hw7rvvPvBwJ6ej4PlX/padkzNzyju+3Z9qfdegN2d1aVwnIvxCoXZFuTDWmviuCaM73P22OcBZULDuXx9+8dn9sbGxiSczXKcOxMTEHHFYO9xebezn3xY/Hk8VAYdj2ax3Zt92vpr8F1t/nfxMz9Ed7n7D7bq3c49ODWuGh4UWulwfb9gZlXXCM9zq1fFdE/rUDhp+4fLqz33X5HR6TmHVoSWOBVwb3gPAtcvPzbmtQYNdiYnlqtX6ZdO3P2xa0/PxvulnT1XNvVAhPaHrXQG5nmLrl1Y8b1bGUxq+hGaOAoOqfLZgwWdLlkekHHxuxLCYmJja1oKctJRx48bl5OS0a9euUsbhInu5Xa7mXR6Pyjzua2/LTL9wjKrRoO7atUsv6T6sX8/BPRP8d8/PzWldq+zcmf6F2hXfWPacbP00Cx0Oo6LMnj279f33P9Ky4YwZM+67r/Vt4aqzIL/4WegVKIvUl29Tp5yrsFBRFJfTeX+tMvNmvdcyNmbh4sUNI03Fh1MUxX7h0XdNXntpVOWsYyWOBVwbZgC4LgZvjarGDya8NvFt7be9DRo3iww0x3fpekvVKnqF9Eo1a1sDg/Sqth999FFLb8Xz0tFlNE0roZmmKaph7dq1weGRX+++o269+m1b3xcZFe2pxauqemn4Lo/0qFGzpv9eBqNxzrCeLbv29LV3Ffr+zq556motXdqs8+NLly155+13nIXOWrVq+XY3GNQW9zTtkdClUcdHvl74oeY9HX2sS2sRa4rBsGvXLpfL5XJrO3fu1DQtIjKqxLM4X4Hy0qFnvH9x7egW9zR9tGvnhg902XXkdE5YJU8xL+9w2vmRlLycLM+l0DxTGM8m7zUxmEydu3WvXr1aSWMB14IAwLUzW6yHDh266+675499ap7D4c7LPnv2rK9CurPQpbld8d0fS/OrkN6u34hv5kzyLw1/STNVVQwGt6a53K7Xhw+ePfWdGTNmPDN0mKdc+4XbcfG93C5Xvt1WtP0Fnt5cLtVb0r3AURBgNvvvXlhYaDxfWv1i4XXfjfjSBFBd3pfbblV1uz2BdLmzcLtc+n3Zf2i9vrxvIO/tXjOaA2w224X+FU9RYLdbVdRvP5zueUtALxp84ZoYDcY/GAu4BvwJCNeuYu36K/+9+ZUxY1wF+c4C+5AhQxTV8xN1hRXSizfTv6UqSnBYRKVLy7UbjUZnfr7BYNi2fVvxmu/F2xc6Crx9nS/y/pO3pPvGjRu3brtkd2twyI7EnUUKtetjmc2eG7d+qN568Z5HfVrgPzn4gxr0/kPr9eV1u3bv7vhQhx/XrWhco0KrWuUMRpM+nKoqaakp9W+rv+nzeT179tS8B+O7JiWWnufuj+vh+VW5rg4gWMtH+i/6cmHDt95K3LYlJ985c8q7LrfnBen6w0lDhj97oUL6uW1+FdI9f125UCG9eDNfwXd7TtbR/EvKtbs0Ld0dsGLFik2ncovs1eShbsXbmy1Wz8+3OaBQUxK6dZ/oLek+bNSLoWGhE8e94ts9wBq06VjaC5cWajeaTOnugOXLv+ravbt/sfXiT0o8iyYPdfN8T9P0avL60IsTz5duN5pMG4+mjnpxzEuvvJbvLJz/7TaDwaAP1/OJ/t+fti1evNihmNasWFbocvtXja/VKOayYwHXhD8B4drdE/do0tEDA3o96izIL3Q4ctJTnVXvDLAGrfxk7qL3M8+dOFqmcnVLcHDvN95/o0vzjw/bfTt+fNjuqd5++WatHnuyU8vGiuop1363t1x7tXp3dny4o8NuP33418WVq/nvVWL7QkeBKcBitljaPPLE9hX/ioguH1G2giU4JC81/fEBg3y7D5r2ycLpf1swLT8rJSkrJWnDIU+h9poNm3V8uKOmaQ57nu+wS3xS4lno3/VVk4+8UF/ebLHquyycPWVBgT3l92Nlq9UOiYis3SRWHy6sdJmRj3ZUVUNWyrm8nKz1B07pd399xEc8peefKXEs4Nqocw+c/xMkgBtoWOPy+qf739vpeV8E+B/EewDAn8V/0gP8D2IGAABCMQMAAKEIAAAQigAAAKEIAAAQigAAAKEIAAAQigDA/4qkY4dWz53y2897Vs+doi+MDOBPRQDgeq36+2Tf4/V4/5lHqlauYD26PTwi3GC66jXOhjUu73ssccuZI/s3fj5Xf7yeYy7Sra+r4gcA/I/zLGjLF1/X87Vq7qQ7I82r5k66zn4yk88+2yM+MzU5Py9PK3Rd7e6KovSuFahcfkvFmnW79B3UplGD+3oMvJ5jLtKtr6viB8AXX+r/9heLweGqrf909uYlH+dmpJkCLA67LT83p7Y1Pz83d0SzKmWqVE85eTy6crXg8FKH92y7u2184jeLA6yB9/V8cu+/Vz0xcc4Hw3uNXbJ5fNeYFxZ8+8+Xn7JlZejt822e4lwhFtPkSe+WqVKj8m0Nl0wel516Tq/xG5vQp23foYqiDG1cvmGbuMRvFt8W2/bkgZ99RYNjE/rk5+Y4CwrsOdnPt6odHlXWbA20X7pF07Qzh/e98uWW1zvd43a7Pcdsy53S7+FHx7zz8atD/cf66v2JrR8btGre1OCIUqGlogxGY9s+z+xZ+1VOWkpm8hl7TrYj367X7Vo+Y3y+LVfvSnO79eFGNq8aGhmtquqDA5/95fu16Umnz3qq+FYxW6zdL1Tx9ZyIXmT4jsanDl4sMtyic69jexN9lyUgMFhVtAJ7nv9Vvb/nYP9ji3vm5YZt4272DwX+kggAXLWvZ7218sdj4Zm/WYJC9qS7D69aoFfrXX0oJeGeesHBwTabbfH2fb9uXr/OW8w2s9AQ90CbyVWqfPvh9Jj47o/WDF71QPyit0e37d7Hv739181h4eEbN248UaHxR68OH/L65DY1o0yKKzWo/MONbtUDoNDh0Ps8m2kLGD7av4Gv/G97b/nfhdv2vbVrS5Et7z792IsPNnwzMOilUc/pZXh/r9Li09eKjuVyOhdOe2NG9aiHOndTC/MPOkN63HPrM5P+0blxbV/pYL1UQPzQsY3KWPWu2rVrp6rqhAkT4ro9anQ59+Vbera4beyCNU1LG6p4q/geUkuP6fnwuGWewgD+RYZ3ncp0ntwfExNz1BnY/raqQyf/w3dZnn3xZUVVp8ycdvGqbllf5NgGtm9OAODa8B4ArlpUpVvqBhbcd1/r7gldlaO7fCVtm5YN+PvM6S2aN5sz873Wtcq63S69mO3oEU//86MPyyi2n75bU8qRuWrtuh1fL9y/fdP9tcv52reoFDp79uycnJxWrVpN7Nm+cYdukZnHn/XW+K1lyffV+L1YNPjL5WEpBy9tcL78b2zLltMmv9u6dlnP4vuXbtGr8tpzsn3HPKXfwy269C4ylsNbwficp4Jxk/i4uHuizc58e+taZS4tHez5t3zGeF9XntdTRkNqamqzpk06d+7UrKzVYc+rknvi1QtVfO8w5+RmZuhVfP2LDHeLvUsvMlw/TCl0FPhflqH9ew3r3+uSq+pyFTm23Iy0m/0Tgb8qdR6LweEqjWxedf32PWf2/zD/k88OnUnZt3VDgcttMRoycnIrV6x4Z9u4vetW/H7qVKnQkAJnYaAloEWXx3NOHv7000/vqFtnzabNb04Yb65Qc/0ns5NTU4u2d7mtJuPc/bkvtKpzb9delQOcFcuVGfncKIvZNHd/rqIoA24N1vsMDo9s89gA/wae5fudhSHBQc26PL5n1ZJTp8+EhwQV36IP4am9Xui63Fh6V2Wio1o8+uQ3cybZHU6r2ZienVulUsUmDz/y3Rcf2ux2i9ms/+4MrBuid+Xbq3n3AavmTrE7HFazKdNm37t7Z/nqtVNO/lb3jrvq17/tjVU/6ifiKHQFWgJcLpez0GUJ8Ewp7I5Cq9nofxkP7NunqEqdW+v6X6UixxYYYJ673/P3KOBqMQPA1bHnZKsGQ/+BA2fNntOnV48PP/yH3ze9FRMN+gd4vG+XeovZdhzy0pmzSfm23EqVKkaFhRw8crzpQ929TYu1v6DAbntt+CBHft6MGTOcDsfFGr8XCuS63a7iDTRvDV6j8WIN3uJbdL6qv5rbXeJYegXjB/qN0DxPPcdm8hZf1DzF4Q3e+pZFu/Lt1X7As969PL9cehXfetWrtoyNGTBgoF7F9/yO6iVFhr213/WZhd9luVCJ0v8qFTk2b/F44FrwHgCuTmBoWKenXniqY8v7778/MXHHoQP7VVXVq/WuXb2qU3zc0hVfdY6P27LtfAlcVVFKV6gSVrrMR3PnTJo0eenihQaTsXLd263BoZu3bS/eXhcUfr7Gb3hoiK/GrynA4iuQW7yBt6i6pwbvFr8avMW36HxVf2cM6VZiV94PSahBYRcrGG9PTOz4UIc13tLBerXeIl05HY7ie+lVfJetWNklofvAAf2iGrXWq/gWqS3sX5nV/7Js2rRJUZSiV+nSUajpimtGAODq2HOyt69eNnBA/8SdO12FzgMFng8+6tV6N5zIHjJs5KjRY/NstsWJB/USuHr53Ab3tv/mm39NmzZtwlvvNGzjeceybrNWG4+mXK69PftijV+nt8avKcDi+66naHCxBgUOh3/53yWJB1SDscgW3xCa262X4T1dtcXI5lWLdOX23o71Osa+CsbFSwfrF8RssfoXEC6yl17F96VXXrPl5qw5eG7r0gVNOnTzP5HiRYb9L8uzo8d63gSe+EaRq+Q/im9f4GoRALg6gaFht7d6sNeD92WlnjMYjcERkeVr3Nrx4Y7O/PxTh375snK1lN+PlalSPSgswmyxfuItifXjhpWJ3yw0FeRv27Hzpx92d584V1GUbi9MnP/yU0s+yCze/g9q/CqKorcp3sCsqv7lf0MjoyxBQUW2+Iao1aiFXoZXVacV78rtKPAdiT6it5DvZF/p4H97Swfr3/V15bDnFd+rSMXgPn5VfH2N/Z+YLdbVn/3Dd1kCrJ58faz/kyVeJf99gWvAm8D4b4h0Zta15O3IMr89rO9zH6282YcDwIMZAP50P25YuXzG+Oadem5dtuCJCR/c7MMBcB4zAAAQio+BAoBQng+93exjAADcBMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKxFBwAyMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCiTqrIcHABIxAwAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQysRIQAMjEDAAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAok6qyHBwASMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgTS8EBgEzMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqSrLwQGARMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhDKxFBwAyMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMqkqqwEBgETMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQysRQcAMjEDAAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAok6qyHBwASMQMAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgTS8EBgEzMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQyqSrLwQGARMwAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoEysBAYBMzAAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEIgAAQCgCAACEMqkqy8EBgETMAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQiAABAKAIAAIQysRQcAMjEDAAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhCIAAEAoAgAAhPrPARARoMSWVVuWVWPLqoEmz5Y64SX/9+G4ylcUJ0WahZmV6qHqtXUFALhm//k+26i0YVeq9t057ViOcnspz526TtiNXD8i26kcy9FuYIcAgCvhfUn/hyxGxei94Z+1awUupV6EajJ45gQBBnVHiju3UDEblNblDWtOu/X2AQbljkjValQMqvpzhju9QIkpo25OLnqLtxiV2LKGxBR3ttPzev+rk26LUbm7tGo2qDbn+cY1QtVbQjxj/5KpnbMTEgBwI5lU9T+8nP81U7u3nCHJrpzM01LylTSHUjNU2Zys1A7TKgSrh7OVcoHKmTxF70dV1Qal1GM5WrpDCTJpzaIM65O0HWnnv+tjNKhNo9SfMrScwvPfUVX19lLqqTztpE2rEKhUDvZsqRuhrjmjBRo9c47k/Bt63gAg3n+eAZywKWfsnpvy7aXUM3nK/qzzr8RP2pTGUerhbK18kHoo++LL87KBSoj5/O3eaFBURSk8Pze46M5Sqh4n/qKtyp50z5OzdkXvLsmuNCrtiZNdabz8B4D/bgBYDEqIWUkr8MRAkl1rU17dn3X+W3aX5zHQqAQblSzHxV1URdmSrLk0z5PSlvO3cn8G1fPGr6Kov136Td/bEb7Zwu40Lcqi1AxVKwd7nl/PeQIAru5NYE1RmkSpgUbP8wCjkue96aveL0VRTtm0BqXUpPxLbs1pBUqFQM+TsoHnPy9UpOaAW1M2ndOCTMotIZdsT3Oc31F/NBuUlmXVdIeyK00rZ/3jwwQA3OgZgMOt/JCuNY1WXW5PGOgvw1MLlGbR6tYU7VSecnspZV/m+ca5hUqdMOWnDK1habVaqKJpyp50T/t7oou+Cawpys5UrVU5NcuhZVyYPfycod1dWq0eqqQXeELC6fbMOVqV9cwHDvj9iQkAcEOoS04U+wv9FQv0fm6n+Cd8AAD/H94EvpzygUq9cHW39zU+AEBQAJy1e/5nwA09GADAfw8rLgCAUAQAAAhFAACAUAQAAAhFAACAUEX+ly4AQApmAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAAAgFAEAAEIRAACgyPR/NK4OP7SXsT8AAAAASUVORK5CYII="
+    }
+]
+
+
+def build_llm_request(username, prompt, temperature=None):
+    """Build the request payload for the LLM framework /generate-story endpoint"""
+    llm_request = {
+        'username': username,
+        'prompt': prompt,
+        'genre': 'fantasy',  # Default genre
+        'age_group': 'children',  # Default age group
+        'scene_count': 5  # Default scene count
+    }
+    if temperature is not None:
+        llm_request['temperature'] = temperature
+    return llm_request
+
+
+def parse_temperature(data):
+    """
+    Read the optional sampling temperature from a create-story request.
+
+    Raises:
+        ValueError: If the temperature is not a number between 0 and 2
+    """
+    temperature = data.get('temperature')
+    if temperature is None:
+        return None
+    if isinstance(temperature, bool) or not isinstance(temperature, (int, float)) or not 0 <= temperature <= 2:
+        raise ValueError('Temperature must be a number between 0 and 2')
+    return temperature
+
+
+def transform_llm_response(llm_response, username, prompt):
+    """Transform an LLM framework response into the story format used by the web client"""
+    if not llm_response.get('success'):
+        raise Exception(f"LLM API error: {llm_response.get('error', 'Unknown error')}")
+
+    story = llm_response.get('data') or {}
+
+    # Older LLM framework versions return the story as stringified JSON in 'result'
+    result_str = story.get('result')
+    if isinstance(result_str, str):
+        try:
+            story = json.loads(result_str)
+        except json.JSONDecodeError:
+            print(f"Failed to parse LLM result as JSON: {result_str}")
+            story = {}
+
+    print(f"Story generated: {story.get('title')}")
+    # Create scenes from LLM response
+    scenes = []
+    for i, scene in enumerate(story.get('scenes', []), 1):
+        scenes.append({
+            'id': i,
+            'description': scene.get('story_text', f'Scene {i}'),
+            'imagePrompt': scene.get('imagePrompt', f'{prompt} - scene {i}'),
+            # Generated image, as an /images/<hash> URL or an inline data URI
+            'image': scene.get('image_url') or scene.get('image')
+        })
+
+    # Ensure we have exactly 5 scenes
+    while len(scenes) < 5:
+        scenes.append({
+            'id': len(scenes) + 1,
+            'description': f'Scene {len(scenes) + 1}: Additional scene',
+            'imagePrompt': f'{prompt} - scene {len(scenes) + 1}',
+            'image': None
+        })
+
+    return {
+        'id': str(uuid.uuid4()),
+        'username': username,
+        'prompt': prompt,
+        'story': {
+            'title': story.get('title', f'Story based on: {prompt}'),
+            'scenes': scenes[:5]  # Ensure exactly 5 scenes
+        },
+        'createdAt': datetime.now().isoformat(),
+        'status': 'generated'
+    }
+
+
+def build_stream_start_event(username, prompt):
+    """Build the first event of a relayed story stream, carrying the story id"""
+    return {
+        'event': 'story',
+        'id': str(uuid.uuid4()),
+        'username': username,
+        'prompt': prompt,
+        'createdAt': datetime.now().isoformat()
+    }
+
+
+class StreamedStory:
+    """
+    Assembles the story relayed by a story stream so it can be stored.
+
+    Chunks are fed as they are relayed; once the LLM framework's ``done`` event
+    has arrived, ``story()`` returns the story in the same format as
+    transform_llm_response, under the id advertised by the start event.
+    """
+
+    def __init__(self, start_event):
+        self.start_event = start_event
+        self.title = None
+        self.scenes = {}
+        self.done = False
+        self._buffer = b''
+
+    def feed(self, chunk):
+        """Consume a relayed chunk of NDJSON, which may hold partial lines"""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b'\n')
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            kind = event.get('event')
+            if kind == 'title':
+                self.title = event.get('title')
+            elif kind in ('scene', 'image'):
+                scene = self.scenes.setdefault(event.get('scene_number'), {})
+                scene.update({key: value for key, value in event.items() if key not in ('event', 'scene_number')})
+            elif kind == 'done':
+                self.done = True
+
+    def story(self):
+        """Build the assembled story, keeping the id and creation time of the start event"""
+        story = {'scenes': [self.scenes[number] for number in sorted(self.scenes, key=lambda n: (n is None, n))]}
+        if self.title:
+            story['title'] = self.title
+        username, prompt = self.start_event['username'], self.start_event['prompt']
+        story_data = transform_llm_response({'success': True, 'data': story}, username, prompt)
+        story_data['id'] = self.start_event['id']
+        story_data['createdAt'] = self.start_event['createdAt']
+        return story_data
+
+
+def busy_response_headers(headers):
+    """Select the Retry-After header relayed when the LLM framework sheds load"""
+    return {'Retry-After': headers.get('Retry-After', '10')}
+
+
+def image_request_headers(headers):
+    """Select the request headers forwarded when proxying an image"""
+    if_none_match = headers.get('If-None-Match')
+    return {'If-None-Match': if_none_match} if if_none_match else {}
+
+
+def image_response_headers(headers):
+    """Select the LLM framework's image response headers relayed to the client"""
+    return {
+        name: headers[name]
+        for name in IMAGE_RESPONSE_HEADERS
+        if name in headers
+    }
+
+
+def encode_stream_event(event):
+    """Encode a story stream event as one NDJSON line"""
+    return (json.dumps(event) + '\n').encode()
+
+
+def build_fallback_story(username, prompt):
+    """Build the mock story returned when the LLM framework call fails"""
+    return {
+        "id": str(uuid.uuid4()),
+        "username": username,
+        "prompt": prompt,
+        "story": {
+            "title": "Adventure of Generate a bedtime picture story of a rabbit and the moon",
+            "scenes": FALLBACK_SCENES
+        },
+        "metadata": {
+            "generated_at": "2025-08-01T20:49:36.183830",
+            "user": "ekta",
+            "genre": "kids",
+            "age_group": "3",
+            "scene_count": 5
+        }
+    }
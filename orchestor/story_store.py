@@ -0,0 +1,148 @@
+"""
+Persistent story store for the orchestrator.
+
+Generated stories are kept in a local SQLite database, keyed by story id and by
+the fingerprint of the request that produced them, so a story can be fetched
+again after a page reload (GET /story/<id>) and deterministic requests
+(temperature 0) can be answered from the store instead of re-running the LLM
+and image pipeline. Entries expire after a configurable TTL.
+
+Configuration (environment variables):
+    STORY_STORE_PATH         SQLite database file (default: data/stories.db)
+    STORY_TTL_SECONDS        Lifetime of a stored story (default: 86400)
+    STORY_CACHE_FIRST        Serve temperature 0 requests from the store (default: true)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Expired rows are purged at most this often (seconds)
+PURGE_INTERVAL = 300
+
+
+def request_fingerprint(llm_request):
+    """
+    Fingerprint an LLM framework request.
+
+    Args:
+        llm_request: Payload built by build_llm_request
+
+    Returns:
+        Hex digest identifying the request's parameters
+    """
+    canonical = json.dumps(llm_request, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def is_deterministic(llm_request):
+    """Whether the request asks for reproducible output (temperature 0)"""
+    return llm_request.get('temperature') == 0
+
+
+class StoryStore:
+    """SQLite-backed story store with TTL expiry, safe to share between threads"""
+
+    def __init__(self, path, ttl_seconds=86400):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+            ttl_seconds: Lifetime of a stored story
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS stories ('
+                ' id TEXT PRIMARY KEY,'
+                ' fingerprint TEXT,'
+                ' story TEXT NOT NULL,'
+                ' created_at REAL NOT NULL,'
+                ' expires_at REAL NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS stories_fingerprint ON stories (fingerprint, created_at)'
+            )
+
+    def put(self, story, fingerprint=None):
+        """
+        Store a story under its id and, optionally, its request fingerprint.
+
+        Args:
+            story: Story data as returned to the web client (must have an 'id')
+            fingerprint: Request fingerprint, or None for stories that must not be replayed
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO stories (id, fingerprint, story, created_at, expires_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (story['id'], fingerprint, json.dumps(story), now, now + self.ttl_seconds)
+            )
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._purge(now)
+
+    def get(self, story_id):
+        """
+        Get a story by id.
+
+        Returns:
+            The story data, or None if it is unknown or expired
+        """
+        return self._fetch('SELECT story FROM stories WHERE id = ? AND expires_at > ?', story_id)
+
+    def get_by_fingerprint(self, fingerprint):
+        """
+        Get the most recent story generated for a request fingerprint.
+
+        Returns:
+            The story data, or None if there is no live story for the fingerprint
+        """
+        return self._fetch(
+            'SELECT story FROM stories WHERE fingerprint = ? AND expires_at > ?'
+            ' ORDER BY created_at DESC LIMIT 1',
+            fingerprint
+        )
+
+    def purge_expired(self):
+        """Delete expired stories and return how many were removed"""
+        with self._lock, self._conn:
+            return self._purge(time.time())
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _fetch(self, query, key):
+        with self._lock:
+            row = self._conn.execute(query, (key, time.time())).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _purge(self, now):
+        self._last_purge = now
+        return self._conn.execute('DELETE FROM stories WHERE expires_at <= ?', (now,)).rowcount
+
+
+def create_story_store():
+    """Create the story store configured by the environment"""
+    return StoryStore(
+        os.getenv('STORY_STORE_PATH', os.path.join('data', 'stories.db')),
+        ttl_seconds=float(os.getenv('STORY_TTL_SECONDS', 86400))
+    )
+
+
+def cache_first_enabled():
+    """Whether deterministic requests are served from the store when possible"""
+    return os.getenv('STORY_CACHE_FIRST', 'true').lower() in ('1', 'true', 'yes')
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for storing streamed stories under the id advertised by the stream
+"""
+import json
+import os
+import sys
+import tempfile
+
+import httpx
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('STORY_STORE_PATH', os.path.join(tempfile.mkdtemp(), 'stories.db'))
+
+LLM_EVENTS = [
+    {'event': 'title', 'title': 'The Moon Rabbit'},
+    {'event': 'scene', 'scene_number': 1, 'story_text': 'A rabbit looks up.'},
+    {'event': 'scene', 'scene_number': 2, 'story_text': 'The moon smiles back.'},
+    {'event': 'image', 'scene_number': 2, 'image': None, 'image_url': '/images/' + 'b' * 64},
+    {'event': 'image', 'scene_number': 1, 'image': None, 'image_url': '/images/' + 'a' * 64},
+    {'event': 'done', 'scene_count': 2},
+]
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body delivered in the given chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __iter__(self):
+        yield from self.chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def llm_stream_handler(request):
+    """Answer /generate-story/stream with NDJSON split mid-line across chunks"""
+    body = ''.join(json.dumps(event) + '\n' for event in LLM_EVENTS).encode()
+    return httpx.Response(200, stream=ChunkedStream([body[i:i + 37] for i in range(0, len(body), 37)]))
+
+
+def check_stored_story(lines, story):
+    """The relayed events are unchanged and the stored story matches them"""
+    start = json.loads(lines[0])
+    assert start['event'] == 'story'
+    assert [json.loads(line)['event'] for line in lines[1:]] == [event['event'] for event in LLM_EVENTS]
+    assert story['id'] == start['id'] and story['createdAt'] == start['createdAt']
+    assert story['story']['title'] == 'The Moon Rabbit'
+    scenes = story['story']['scenes']
+    assert scenes[0]['description'] == 'A rabbit looks up.'
+    assert scenes[0]['image'] == '/images/' + 'a' * 64
+    assert scenes[1]['image'] == '/images/' + 'b' * 64
+
+
+def test_asgi_streamed_story_can_be_fetched():
+    """A story streamed through the ASGI app is stored under its advertised id"""
+    from fastapi.testclient import TestClient
+
+    import asgi
+
+    with TestClient(asgi.app) as client:
+        asgi.app.state.llm_client = httpx.AsyncClient(
+            base_url='http://llm', transport=httpx.MockTransport(llm_stream_handler)
+        )
+        response = client.post('/createstory/stream', json={'username': 'TestUser', 'prompt': 'moon', 'temperature': 0})
+        lines = response.text.splitlines()
+        fetched = client.get(f"/story/{json.loads(lines[0])['id']}")
+        assert fetched.status_code == 200
+        check_stored_story(lines, fetched.json()['data'])
+
+        # The stored story also answers a repeated deterministic request
+        replay = client.post('/createstory', json={'username': 'TestUser', 'prompt': 'moon', 'temperature': 0})
+        assert replay.json()['data']['id'] == json.loads(lines[0])['id']
+    print('✅ ASGI streamed story test passed!')
+
+
+def test_flask_streamed_story_can_be_fetched():
+    """A story streamed through the Flask app is stored under its advertised id"""
+    import app as flask_app
+
+    original = flask_app.llm_client
+    flask_app.llm_client = httpx.Client(base_url='http://llm', transport=httpx.MockTransport(llm_stream_handler))
+    try:
+        client = flask_app.app.test_client()
+        response = client.post('/createstory/stream', json={'username': 'TestUser', 'prompt': 'moon'})
+        lines = response.get_data(as_text=True).splitlines()
+        fetched = client.get(f"/story/{json.loads(lines[0])['id']}")
+        assert fetched.status_code == 200
+        check_stored_story(lines, fetched.get_json()['data'])
+    finally:
+        flask_app.llm_client = original
+    print('✅ Flask streamed story test passed!')
+
+
+if __name__ == '__main__':
+    test_asgi_streamed_story_can_be_fetched()
+    test_flask_streamed_story_can_be_fetched()
@@ -6,8 +6,14 @@ Simple test script for animated image generation improvements
 import asyncio
 import base64
 import io
-from PIL import Image, ImageDraw, ImageFont
-import random
+import os
+import sys
+from PIL import Image
+
+# Add the llm directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'llm'))
+
+from tools.generate_story.mock_renderer import render_mock_image
 
 class SimpleImageGenerator:
     """Simplified image generator for testing"""
@@ -15,27 +21,7 @@ class SimpleImageGenerator:
     async def generate_animated_image(self, prompt: str, style: str = "digital art") -> str:
         """Generate an animated-style mock image with visual elements"""
         try:
-            # Create a larger, more detailed image
-            width, height = 800, 600
-            
-            # Create image with animated-style background
-            image = Image.new('RGB', (width, height), color='#1a1a2e')  # Dark blue background
-            draw = ImageDraw.Draw(image)
-            
-            # Create animated-style gradient background
-            for y in range(height):
-                # Create a more dynamic gradient
-                progress = y / height
-                r = int(26 + progress * 50)  # Dark blue to lighter blue
-                g = int(26 + progress * 80)
-                b = int(46 + progress * 100)
-                draw.line([(0, y), (width, y)], fill=(r, g, b))
-            
-            # Add animated-style elements based on the prompt
-            self._add_animated_elements(draw, prompt, width, height, style)
-            
-            # Add animated-style border
-            self._add_animated_border(draw, width, height)
+            image = render_mock_image(prompt, style)
             
             # Convert to base64
             buffer = io.BytesIO()
@@ -52,240 +38,6 @@ class SimpleImageGenerator:
             image.save(buffer, format='PNG')
             img_str = base64.b64encode(buffer.getvalue()).decode()
             return f"data:image/png;base64,{img_str}"
-    
-    def _add_animated_elements(self, draw, prompt: str, width: int, height: int, style: str):
-        """Add animated-style visual elements based on the prompt"""
-        prompt_lower = prompt.lower()
-        
-        # Define color palettes for different styles
-        color_palettes = {
-            'fantasy': ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
-            'adventure': ['#FF8C42', '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
-            'mystery': ['#6C5CE7', '#A29BFE', '#FD79A8', '#FDCB6E', '#00B894'],
-            'kids': ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
-            'digital art': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
-        }
-        
-        colors = color_palettes.get(style, color_palettes['kids'])
-        
-        # Add floating particles/stars for animated effect
-        random.seed(hash(prompt) % 1000)  # Consistent randomness for same prompt
-        
-        for _ in range(20):
-            x = random.randint(50, width - 50)
-            y = random.randint(50, height - 50)
-            size = random.randint(2, 6)
-            color = random.choice(colors)
-            # Draw star-like particles
-            points = [
-                (x, y - size), (x + size//2, y - size//2), (x + size, y),
-                (x + size//2, y + size//2), (x, y + size), (x - size//2, y + size//2),
-                (x - size, y), (x - size//2, y - size//2)
-            ]
-            draw.polygon(points, fill=color)
-        
-        # Add scene-specific elements based on prompt keywords
-        if any(word in prompt_lower for word in ['rabbit', 'bunny', 'animal']):
-            self._draw_rabbit_scene(draw, width, height, colors)
-        elif any(word in prompt_lower for word in ['knight', 'castle', 'sword']):
-            self._draw_knight_scene(draw, width, height, colors)
-        elif any(word in prompt_lower for word in ['forest', 'tree', 'nature']):
-            self._draw_forest_scene(draw, width, height, colors)
-        elif any(word in prompt_lower for word in ['moon', 'star', 'night']):
-            self._draw_night_scene(draw, width, height, colors)
-        elif any(word in prompt_lower for word in ['ocean', 'sea', 'water']):
-            self._draw_ocean_scene(draw, width, height, colors)
-        else:
-            self._draw_generic_scene(draw, width, height, colors, prompt)
-    
-    def _draw_rabbit_scene(self, draw, width: int, height: int, colors: list):
-        """Draw a rabbit-themed animated scene"""
-        # Draw a cozy nest
-        nest_x, nest_y = width // 2, height // 2 + 50
-        nest_color = colors[3]  # Green for grass
-        
-        # Draw nest base
-        for i in range(5):
-            radius = 80 + i * 5
-            draw.ellipse([nest_x - radius, nest_y - radius, nest_x + radius, nest_y + radius], 
-                        outline=nest_color, width=2)
-        
-        # Draw rabbit silhouette
-        rabbit_x, rabbit_y = width // 2, height // 2
-        # Rabbit body
-        draw.ellipse([rabbit_x - 30, rabbit_y - 20, rabbit_x + 30, rabbit_y + 40], 
-                    fill=colors[4])  # Light color for rabbit
-        # Rabbit head
-        draw.ellipse([rabbit_x - 20, rabbit_y - 40, rabbit_x + 20, rabbit_y], 
-                    fill=colors[4])
-        # Rabbit ears
-        draw.ellipse([rabbit_x - 15, rabbit_y - 60, rabbit_x - 5, rabbit_y - 30], 
-                    fill=colors[4])
-        draw.ellipse([rabbit_x + 5, rabbit_y - 60, rabbit_x + 15, rabbit_y - 30], 
-                    fill=colors[4])
-        
-        # Draw flowers around the nest
-        for i in range(8):
-            angle = i * 45
-            flower_x = nest_x + int(100 * (angle % 90) / 90)
-            flower_y = nest_y + int(100 * (angle // 90))
-            self._draw_flower(draw, flower_x, flower_y, colors[i % len(colors)])
-    
-    def _draw_knight_scene(self, draw, width: int, height: int, colors: list):
-        """Draw a knight-themed animated scene"""
-        # Draw castle silhouette
-        castle_x, castle_y = width // 2, height // 2
-        castle_color = colors[2]  # Blue for castle
-        
-        # Castle base
-        draw.rectangle([castle_x - 60, castle_y + 20, castle_x + 60, castle_y + 80], 
-                      fill=castle_color)
-        # Castle towers
-        draw.rectangle([castle_x - 50, castle_y - 40, castle_x - 30, castle_y + 20], 
-                      fill=castle_color)
-        draw.rectangle([castle_x + 30, castle_y - 40, castle_x + 50, castle_y + 20], 
-                      fill=castle_color)
-        # Castle flags
-        draw.polygon([(castle_x - 40, castle_y - 40), (castle_x - 40, castle_y - 60), 
-                     (castle_x - 20, castle_y - 50)], fill=colors[0])
-        draw.polygon([(castle_x + 40, castle_y - 40), (castle_x + 40, castle_y - 60), 
-                     (castle_x + 20, castle_y - 50)], fill=colors[0])
-        
-        # Draw knight
-        knight_x, knight_y = castle_x - 100, castle_y + 40
-        # Knight body
-        draw.rectangle([knight_x - 15, knight_y - 30, knight_x + 15, knight_y + 20], 
-                      fill=colors[1])
-        # Knight head
-        draw.ellipse([knight_x - 10, knight_y - 50, knight_x + 10, knight_y - 30], 
-                    fill=colors[4])
-        # Knight sword
-        draw.line([(knight_x + 20, knight_y - 10), (knight_x + 40, knight_y - 30)], 
-                 fill=colors[3], width=3)
-    
-    def _draw_forest_scene(self, draw, width: int, height: int, colors: list):
-        """Draw a forest-themed animated scene"""
-        # Draw trees
-        for i in range(5):
-            tree_x = 100 + i * 120
-            tree_y = height // 2 + 50
-            
-            # Tree trunk
-            draw.rectangle([tree_x - 10, tree_y, tree_x + 10, tree_y + 80], 
-                          fill=colors[3])
-            # Tree leaves
-            draw.ellipse([tree_x - 30, tree_y - 40, tree_x + 30, tree_y + 20], 
-                        fill=colors[1])
-            
-            # Add some smaller trees
-            if i % 2 == 0:
-                small_tree_x = tree_x + 40
-                small_tree_y = tree_y + 20
-                draw.rectangle([small_tree_x - 5, small_tree_y, small_tree_x + 5, small_tree_y + 40], 
-                              fill=colors[3])
-                draw.ellipse([small_tree_x - 15, small_tree_y - 20, small_tree_x + 15, small_tree_y + 10], 
-                            fill=colors[2])
-        
-        # Draw grass at the bottom
-        for x in range(0, width, 20):
-            draw.line([(x, height - 50), (x + 10, height - 30)], 
-                     fill=colors[1], width=2)
-    
-    def _draw_night_scene(self, draw, width: int, height: int, colors: list):
-        """Draw a night-themed animated scene"""
-        # Draw moon
-        moon_x, moon_y = width - 150, 100
-        draw.ellipse([moon_x - 40, moon_y - 40, moon_x + 40, moon_y + 40], 
-                    fill=colors[4])
-        
-        # Draw stars
-        for _ in range(30):
-            star_x = random.randint(50, width - 50)
-            star_y = random.randint(50, height // 2)
-            size = random.randint(1, 3)
-            draw.ellipse([star_x - size, star_y - size, star_x + size, star_y + size], 
-                        fill=colors[4])
-        
-        # Draw clouds
-        cloud_positions = [(100, 80), (300, 120), (500, 90)]
-        for cloud_x, cloud_y in cloud_positions:
-            draw.ellipse([cloud_x - 30, cloud_y - 15, cloud_x + 30, cloud_y + 15], 
-                        fill=colors[2])
-            draw.ellipse([cloud_x - 20, cloud_y - 20, cloud_x + 20, cloud_y + 10], 
-                        fill=colors[2])
-            draw.ellipse([cloud_x - 10, cloud_y - 25, cloud_x + 10, cloud_y + 5], 
-                        fill=colors[2])
-    
-    def _draw_ocean_scene(self, draw, width: int, height: int, colors: list):
-        """Draw an ocean-themed animated scene"""
-        # Draw ocean waves
-        for y in range(height // 2, height, 20):
-            wave_color = colors[2]  # Blue for water
-            for x in range(0, width, 40):
-                # Draw wave pattern
-                points = [(x, y), (x + 20, y - 10), (x + 40, y)]
-                draw.line(points, fill=wave_color, width=3)
-        
-        # Draw sun
-        sun_x, sun_y = width - 100, 100
-        draw.ellipse([sun_x - 30, sun_y - 30, sun_x + 30, sun_y + 30], 
-                    fill=colors[4])
-        
-        # Draw some fish
-        fish_positions = [(200, height // 2 + 50), (400, height // 2 + 30), (600, height // 2 + 70)]
-        for fish_x, fish_y in fish_positions:
-            # Fish body
-            draw.ellipse([fish_x - 15, fish_y - 8, fish_x + 15, fish_y + 8], 
-                        fill=colors[0])
-            # Fish tail
-            draw.polygon([(fish_x - 15, fish_y), (fish_x - 25, fish_y - 10), 
-                         (fish_x - 25, fish_y + 10)], fill=colors[0])
-    
-    def _draw_generic_scene(self, draw, width: int, height: int, colors: list, prompt: str):
-        """Draw a generic animated scene"""
-        # Draw a central focal point
-        center_x, center_y = width // 2, height // 2
-        
-        # Draw a magical circle
-        for i in range(3):
-            radius = 60 + i * 20
-            draw.ellipse([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
-                        outline=colors[i % len(colors)], width=3)
-        
-        # Draw some floating elements
-        for i in range(6):
-            angle = i * 60
-            element_x = center_x + int(80 * (angle % 90) / 90)
-            element_y = center_y + int(80 * (angle // 90))
-            size = 10 + (i % 3) * 5
-            draw.ellipse([element_x - size, element_y - size, element_x + size, element_y + size], 
-                        fill=colors[i % len(colors)])
-    
-    def _draw_flower(self, draw, x: int, y: int, color: str):
-        """Draw a simple flower"""
-        # Flower petals
-        for i in range(6):
-            angle = i * 60
-            petal_x = x + int(8 * (angle % 90) / 90)
-            petal_y = y + int(8 * (angle // 90))
-            draw.ellipse([petal_x - 3, petal_y - 3, petal_x + 3, petal_y + 3], 
-                        fill=color)
-        # Flower center
-        draw.ellipse([x - 2, y - 2, x + 2, y + 2], fill='#FFD700')
-    
-    def _add_animated_border(self, draw, width: int, height: int):
-        """Add an animated-style border to the image"""
-        border_color = '#FFD700'  # Gold border
-        border_width = 3
-        
-        # Draw border with rounded corners effect
-        for i in range(border_width):
-            # Top and bottom borders
-            draw.line([(i, i), (width - i, i)], fill=border_color, width=1)
-            draw.line([(i, height - i), (width - i, height - i)], fill=border_color, width=1)
-            # Left and right borders
-            draw.line([(i, i), (i, height - i)], fill=border_color, width=1)
-            draw.line([(width - i, i), (width - i, height - i)], fill=border_color, width=1)
 
 async def test_animated_image_generation():
     """Test the improved animated image generation"""
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { CreateStoryRequest, CreateStoryResponse } from '../types';
+import { CreateStoryRequest, CreateStoryResponse, StoryStreamEvent } from '../types';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:3001';
 
@@ -10,16 +10,95 @@ const api = axios.create({
   },
 });
 
+/**
+ * Scene images are served by URL (e.g. `/images/<hash>`) relative to the API.
+ * Resolve them against the API base so they load from the orchestrator rather
+ * than the web app's own origin. Data URIs and absolute URLs pass through.
+ */
+export const resolveImageUrl = (image: string | null | undefined): string | null => {
+  if (!image) return null;
+  return image.startsWith('/') ? `${API_BASE_URL}${image}` : image;
+};
+
 export const storyService = {
   createStory: async (request: CreateStoryRequest): Promise<CreateStoryResponse> => {
     try {
       const response = await api.post('/createstory', request);
-      return response.data;
+      const result: CreateStoryResponse = response.data;
+      result.data?.story.scenes.forEach((scene) => {
+        scene.image = resolveImageUrl(scene.image);
+      });
+      return result;
     } catch (error) {
       console.error('Error creating story:', error);
       throw error;
     }
   },
+
+  /** Fetch a previously generated story by id (e.g. after a page reload). */
+  getStory: async (id: string): Promise<CreateStoryResponse> => {
+    try {
+      const response = await api.get(`/story/${encodeURIComponent(id)}`);
+      const result: CreateStoryResponse = response.data;
+      result.data?.story.scenes.forEach((scene) => {
+        scene.image = resolveImageUrl(scene.image);
+      });
+      return result;
+    } catch (error) {
+      console.error('Error fetching story:', error);
+      throw error;
+    }
+  },
+
+  /**
+   * Create a story and receive it progressively as newline-delimited JSON events.
+   * `onEvent` is called for every event (story, title, scene, image, done, error)
+   * as soon as it arrives.
+   */
+  createStoryStream: async (
+    request: CreateStoryRequest,
+    onEvent: (event: StoryStreamEvent) => void,
+    signal?: AbortSignal
+  ): Promise<void> => {
+    const response = await fetch(`${API_BASE_URL}/createstory/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(request),
+      signal,
+    });
+
+    if (!response.ok || !response.body) {
+      throw new Error(`Story stream failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+
+    const emit = (line: string) => {
+      if (line.trim()) {
+        const event = JSON.parse(line) as StoryStreamEvent;
+        if (event.event === 'image') {
+          event.image = resolveImageUrl(event.image_url ?? event.image);
+        }
+        onEvent(event);
+      }
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffered += decoder.decode(value, { stream: true });
+
+      let newline = buffered.indexOf('\n');
+      while (newline !== -1) {
+        emit(buffered.slice(0, newline));
+        buffered = buffered.slice(newline + 1);
+        newline = buffered.indexOf('\n');
+      }
+    }
+    emit(buffered + decoder.decode());
+  },
 };
 
 export default api;
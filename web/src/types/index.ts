@@ -20,6 +20,8 @@ export interface Story {
 export interface CreateStoryRequest {
   username: string;
   prompt: string;
+  /** Sampling temperature (0-2); 0 gives reproducible stories that the API can replay */
+  temperature?: number;
 }
 
 export interface CreateStoryResponse {
@@ -27,3 +29,11 @@ export interface CreateStoryResponse {
   data?: Story;
   error?: string;
 }
+
+export type StoryStreamEvent =
+  | { event: 'story'; id: string; username: string; prompt: string; createdAt: string }
+  | { event: 'title'; title: string; theme?: string | null; target_age?: string | null }
+  | { event: 'scene'; scene_number: number; story_text: string }
+  | { event: 'image'; scene_number: number; image: string | null; image_url?: string | null }
+  | { event: 'done'; scene_count: number }
+  | { event: 'error'; error: string };